@@ -45,13 +45,20 @@ class MCTSNode:
     wins: float = 0.0
     untried_actions: list[Action] | None = None
 
-    def ucb_value(self, exploration_c: float, parent_visits: int) -> float:
-        """Calculate UCB1 value for node selection."""
-        if self.visits == 0:
-            return float('inf')
-        exploitation = self.wins / self.visits
-        exploration = exploration_c * math.sqrt(math.log(parent_visits) / self.visits)
-        return exploitation + exploration
+    def best_child(self, exploration_c: float) -> MCTSNode:
+        """Select the child with the highest UCB1 value.
+
+        log(visits) is the same for every child, so it is computed once per
+        selection instead of once per child.
+        """
+        exploration_scale = exploration_c * math.sqrt(math.log(self.visits))
+
+        def ucb_value(child: MCTSNode) -> float:
+            if child.visits == 0:
+                return float('inf')
+            return child.wins / child.visits + exploration_scale / math.sqrt(child.visits)
+
+        return max(self.children, key=ucb_value)
 
 
 class MCTSAgent:
@@ -146,10 +153,7 @@ class MCTSAgent:
 
             # 1. Selection: Traverse tree using UCB1
             while node.untried_actions is not None and len(node.untried_actions) == 0 and node.children:
-                node = max(
-                    node.children,
-                    key=lambda n: n.ucb_value(self._exploration_c, node.visits)
-                )
+                node = node.best_child(self._exploration_c)
                 if node.action:
                     current_board = self._apply_action(
                         current_board, current_player, node.action, config
@@ -1,8 +1,9 @@
 """Common utilities shared across agent implementations."""
 
+from functools import lru_cache
 from random import Random
 
-from ..types import Owner, Position, GameState, SetupAction
+from ..types import Owner, Position, GameState, SetupAction, TerritoryBoard
 from ..config import GameConfig
 
 
@@ -31,6 +32,173 @@ def find_valid_setup_positions(
     ]
 
 
+@lru_cache(maxsize=None)
+def neighbor_table(board_size: int) -> tuple[tuple[tuple[Position, ...], ...], ...]:
+    """Precomputed orthogonal neighbors for every cell on the board.
+
+    Neighbors depend only on (row, col) for a fixed board size, so they are
+    built once per size and read as table[row][col] thereafter.
+
+    Args:
+        board_size: Size of board
+
+    Returns:
+        Nested tuples indexed [row][col], each holding that cell's neighbors
+        sorted by (row, col)
+    """
+    return tuple(
+        tuple(
+            tuple(sorted(
+                Position(r, c).neighbors(board_size),
+                key=lambda p: (p.row, p.col),
+            ))
+            for c in range(board_size)
+        )
+        for r in range(board_size)
+    )
+
+
+@lru_cache(maxsize=None)
+def set_order_neighbor_table(board_size: int) -> tuple[tuple[tuple[Position, ...], ...], ...]:
+    """Orthogonal neighbors per cell, in Position.neighbors() iteration order.
+
+    Unlike neighbor_table, cells are not sorted: each keeps the frozenset's
+    iteration order, so code that breaks ties by neighbor order behaves
+    exactly as if it enumerated Position.neighbors() directly.
+
+    Args:
+        board_size: Size of board
+
+    Returns:
+        Nested tuples indexed [row][col] of that cell's neighbors
+    """
+    return tuple(
+        tuple(tuple(Position(r, c).neighbors(board_size)) for c in range(board_size))
+        for r in range(board_size)
+    )
+
+
+@lru_cache(maxsize=None)
+def board_positions(board_size: int) -> tuple[Position, ...]:
+    """All positions in row-major order, matching TerritoryBoard.territories().
+
+    Args:
+        board_size: Size of board
+
+    Returns:
+        Tuple where index row * board_size + col holds Position(row, col)
+    """
+    return tuple(
+        Position(r, c)
+        for r in range(board_size)
+        for c in range(board_size)
+    )
+
+
+@lru_cache(maxsize=None)
+def flat_neighbor_table(board_size: int) -> tuple[tuple[tuple[int, Position], ...], ...]:
+    """Neighbors of every cell keyed by flat (row-major) index.
+
+    Lets array-style code read neighbor owners/stones straight out of flat
+    lists built from TerritoryBoard.territories() while still having the
+    Position needed to build actions.
+
+    Args:
+        board_size: Size of board
+
+    Returns:
+        Tuple indexed by flat cell index, each holding (flat index, Position)
+        pairs for that cell's neighbors, sorted by (row, col)
+    """
+    table = neighbor_table(board_size)
+    return tuple(
+        tuple((n.row * board_size + n.col, n) for n in table[r][c])
+        for r in range(board_size)
+        for c in range(board_size)
+    )
+
+
+# Rollout-candidate destination weights (see weighted_destination)
+_NEUTRAL_WEIGHT = 3
+_BEATABLE_ENEMY_WEIGHT = 5
+_FRIENDLY_WEIGHT = 1
+
+
+def weighted_destination(
+    board: TerritoryBoard,
+    player: Owner,
+    neighbors: tuple[Position, ...],
+    amount: int,
+    rng: Random,
+) -> Position | None:
+    """Pick a move destination biased toward productive targets.
+
+    Neutral cells weigh 3, enemies that ``amount`` stones would beat weigh 5,
+    friendly cells weigh 1 and enemies it would not beat are never chosen.
+
+    Args:
+        board: Board the move is made on
+        player: Moving player
+        neighbors: Candidate destinations
+        amount: Stones that would be sent
+        rng: Random number generator
+
+    Returns:
+        Chosen destination, or None if every neighbor is an unbeatable enemy
+    """
+    weights = []
+    for n in neighbors:
+        owner = board.get_owner(n)
+        if owner == Owner.NEUTRAL:
+            weights.append(_NEUTRAL_WEIGHT)
+        elif owner == player:
+            weights.append(_FRIENDLY_WEIGHT)
+        elif amount > board.get_stones(n):
+            weights.append(_BEATABLE_ENEMY_WEIGHT)
+        else:
+            weights.append(0)
+    if not any(weights):
+        return None
+    return rng.choices(neighbors, weights=weights)[0]
+
+
+def weighted_flat_destination(
+    neighbors: tuple[tuple[int, Position], ...],
+    owners: list[Owner],
+    cell_stones: list[int],
+    player: Owner,
+    amount: int,
+    rng: Random,
+) -> Position | None:
+    """weighted_destination for code that reads flat owner/stone lists.
+
+    Args:
+        neighbors: (flat index, Position) pairs, as in flat_neighbor_table
+        owners: Flat row-major owner of every cell
+        cell_stones: Flat row-major stone count of every cell
+        player: Moving player
+        amount: Stones that would be sent
+        rng: Random number generator
+
+    Returns:
+        Chosen destination, or None if every neighbor is an unbeatable enemy
+    """
+    weights = []
+    for j, _ in neighbors:
+        owner = owners[j]
+        if owner == Owner.NEUTRAL:
+            weights.append(_NEUTRAL_WEIGHT)
+        elif owner == player:
+            weights.append(_FRIENDLY_WEIGHT)
+        elif amount > cell_stones[j]:
+            weights.append(_BEATABLE_ENEMY_WEIGHT)
+        else:
+            weights.append(0)
+    if not any(weights):
+        return None
+    return rng.choices(neighbors, weights=weights)[0][1]
+
+
 def random_setup(
     state: GameState,
     player: Owner,
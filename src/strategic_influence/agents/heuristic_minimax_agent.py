@@ -15,8 +15,11 @@ This is "Minimax without the search tree" - we pick moves as Minimax would,
 but instead of searching, we evaluate the immediate consequences.
 """
 
+from functools import lru_cache
 from random import Random
 
+import numpy as np
+
 from ..types import (
     Owner,
     Position,
@@ -24,7 +27,6 @@ from ..types import (
     SetupAction,
     PlayerTurnActions,
     TerritoryAction,
-    calculate_half,
     create_grow_action,
     create_simple_move_action,
 )
@@ -34,11 +36,115 @@ from ..evaluation import (
     BALANCED_WEIGHTS,
     EvaluationWeights,
 )
-from ..engine import apply_turn
-from .common import center_aware_setup
+from ..engine import apply_turn, validate_turn_actions
+from .common import center_aware_setup, neighbor_table
 from ..types import TurnActions
 
 
+# Neighbor offsets: down, up, left, right
+_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# Owner code used for the off-board sentinel cell
+_OFF_BOARD = -1
+
+# Score of a threat-resolving reinforcement; expansion/attack always exceed it
+_REINFORCE_SCORE = 80.0
+
+
+@lru_cache(maxsize=None)
+def _direction_table(board_size: int) -> tuple[tuple[tuple[tuple[int, Position], ...], ...], ...]:
+    """(direction index, neighbor) pairs for every cell, indexed [row][col]."""
+    return tuple(
+        tuple(
+            tuple(
+                (d, Position(r + dr, c + dc))
+                for d, (dr, dc) in enumerate(_DIRECTIONS)
+                if 0 <= r + dr < board_size and 0 <= c + dc < board_size
+            )
+            for c in range(board_size)
+        )
+        for r in range(board_size)
+    )
+
+
+@lru_cache(maxsize=None)
+def _lane_indices(board_size: int) -> np.ndarray:
+    """Flat neighbor indices for every (direction, cell) pair, shape [4, N, N].
+
+    Indexes a flattened N*N grid with one trailing sentinel slot; off-board
+    neighbors point at the sentinel (index N*N). Built once per board size so
+    scoring is a single gather with no per-call padding or edge handling.
+    """
+    sentinel = board_size * board_size
+    indices = np.full((4, board_size, board_size), sentinel, dtype=np.intp)
+    for d, (dr, dc) in enumerate(_DIRECTIONS):
+        for r in range(board_size):
+            for c in range(board_size):
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < board_size and 0 <= nc < board_size:
+                    indices[d, r, c] = nr * board_size + nc
+    indices.setflags(write=False)
+    return indices
+
+
+def _stay_actions(state: GameState, player: Owner) -> PlayerTurnActions:
+    """Actions for a player who stays (grows) on every owned territory."""
+    return _stay_actions_for(player, state.board.positions_owned_by(player))
+
+
+@lru_cache(maxsize=1024)
+def _stay_actions_for(player: Owner, owned: frozenset[Position]) -> PlayerTurnActions:
+    """All-stay actions for a set of owned territories, shared across lookaheads.
+
+    Depends only on the player and the territories it owns, so boards with
+    the same ownership reuse one object instead of rebuilding it per call.
+    """
+    return PlayerTurnActions(
+        player=player,
+        actions=tuple(create_grow_action(pos) for pos in owned),
+    )
+
+
+def _score_directions(
+    owners: np.ndarray,
+    stones: np.ndarray,
+    player: Owner,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Score expansion/attack moves for every (direction, cell) pair at once.
+
+    The four neighbor lanes are stacked into a single [4, N, N] plane so each
+    comparison covers all directions in one operation.
+
+    Returns:
+        scores: float array [4, N, N], -inf where no expansion/attack applies
+        amounts: int array [4, N, N], stones sent for each scored move
+    """
+    lane_indices = _lane_indices(owners.shape[0])
+    half_stones = (stones + 1) // 2
+
+    # Gather every neighbor lane at once; the trailing slot is off-board
+    nbr_owner = np.append(owners.ravel(), _OFF_BOARD)[lane_indices]
+    nbr_stones = np.append(stones.ravel(), 0)[lane_indices]
+
+    # Neutral neighbors of each cell, then of each cell's neighbor
+    neutral = nbr_owner == Owner.NEUTRAL.value
+    nn_count = neutral.sum(axis=0, dtype=np.int16)
+    nbr_nn_count = np.append(nn_count.ravel(), 0)[lane_indices]
+
+    # EXPANSION: score by future potential (neutral neighbors of target)
+    scores = np.where(neutral, 200.0 + 30.0 * nbr_nn_count, -np.inf)
+    amounts = np.where(neutral, half_stones, 0)
+
+    # ATTACK: SEND_HALF if it wins, otherwise SEND_ALL if that wins
+    enemy = nbr_owner == player.opponent().value
+    half_wins = enemy & (half_stones > nbr_stones)
+    all_wins = enemy & ~half_wins & (stones > nbr_stones)
+    scores = np.where(half_wins, 100.0, np.where(all_wins, 90.0, scores))
+    amounts = np.where(half_wins, half_stones, np.where(all_wins, stones, amounts))
+
+    return scores, amounts
+
+
 class HeuristicMinimaxAgent:
     """Pure heuristic agent capturing Minimax strategy without search.
 
@@ -101,13 +207,33 @@ class HeuristicMinimaxAgent:
         actions: list[TerritoryAction] = []
         board = state.board
 
-        territories = list(board.positions_owned_by(player))
+        board_size = config.board_size
+        owner_arr, stone_arr = board.to_arrays()
+        owners = owner_arr.reshape(board_size, board_size)
+        stones = stone_arr.reshape(board_size, board_size)
+        territories = np.argwhere(owners == player.value).tolist()
         if not territories:
             return PlayerTurnActions(player=player, actions=())
 
-        # Score each territory's best action
-        for pos in territories:
-            best_action = self._choose_best_action(pos, state, player, config)
+        # Expansion/attack scores for every territory in one vectorized pass,
+        # reduced to each territory's best score and tie mask in the same batch
+        scores, amounts = _score_directions(owners, stones, player)
+        best_scores = scores.max(axis=0)
+        is_best = (scores == best_scores).tolist()
+        best_scores = best_scores.tolist()
+        amounts = amounts.tolist()
+        stones = stones.tolist()
+
+        # Pick each territory's best action
+        for row, col in territories:
+            pos = Position(row, col)
+            if stones[row][col] <= 1:
+                # Rule 1: 1-stone territories MUST STAY (no scoring needed)
+                actions.append(create_grow_action(pos))
+                continue
+            best_action = self._choose_best_action(
+                pos, state, player, config, best_scores, is_best, amounts
+            )
             actions.append(best_action)
 
         move = PlayerTurnActions(player=player, actions=tuple(actions))
@@ -126,6 +252,9 @@ class HeuristicMinimaxAgent:
         state: GameState,
         player: Owner,
         config: GameConfig,
+        best_scores: list[list[float]],
+        is_best: list[list[list[bool]]],
+        amounts: list[list[list[int]]],
     ) -> TerritoryAction:
         """Choose best action for a single territory using heuristics.
 
@@ -135,80 +264,77 @@ class HeuristicMinimaxAgent:
         - Reinforce resolving threat: 80 points (already filtered)
         - STAY/GROW: 10 points (baseline)
 
+        Expansion and attack scores come precomputed from _score_directions,
+        already reduced to per-cell best scores and [direction][row][col] tie
+        masks; only reinforcement needs the second-neighbor threat check here.
+
         Returns: Single best action (highest score, random among ties)
         """
         board = state.board
-        territory = board.get(pos)
-        stones = territory.stones
-        opponent = player.opponent()
+        board_size = config.board_size
+        row, col = pos.row, pos.col
+        stones = board.get(pos).stones
 
         # Rule 1: 1-stone territories MUST STAY (survival rule)
         if stones <= 1:
             return create_grow_action(pos)
 
-        half_stones = calculate_half(stones)
-        neighbors = list(pos.neighbors(config.board_size))
-
-        # Score all valid options
-        options: list[tuple[float, TerritoryAction]] = []
-
-        # STAY is always an option (baseline)
-        options.append((10.0, create_grow_action(pos)))
-
-        for neighbor in neighbors:
-            neighbor_owner = board.get_owner(neighbor)
-            neighbor_stones = board.get_stones(neighbor) if neighbor_owner != Owner.NEUTRAL else 0
-
-            if neighbor_owner == Owner.NEUTRAL:
-                # EXPANSION: Score by future potential (neutral neighbors)
-                # This is Minimax's key insight for move ordering
-                neutral_neighbors = sum(
-                    1 for nn in neighbor.neighbors(config.board_size)
-                    if board.get_owner(nn) == Owner.NEUTRAL
-                )
-                # Scoring formula from Minimax move ordering
-                score = 200.0 + neutral_neighbors * 30.0
-                options.append((score, create_simple_move_action(pos, neighbor, half_stones)))
-
-            elif neighbor_owner == opponent:
-                # ATTACK: Only with clear advantage
-                # Heuristic: Same filtering as Minimax move generation
-                if half_stones > neighbor_stones:
-                    # SEND_HALF wins - prefer it (keeps source territory)
-                    options.append((100.0, create_simple_move_action(pos, neighbor, half_stones)))
-                elif stones > neighbor_stones:
-                    # Only SEND_ALL wins - include it (but lower score)
-                    options.append((90.0, create_simple_move_action(pos, neighbor, stones)))
-                # else: no advantage, don't include attack
-
-            else:  # neighbor_owner == player (friendly)
-                # REINFORCE: Only if it resolves a threat
-                # Heuristic: Same threat detection as Minimax
-                neighbor_threatened_by = None
-                for nn in neighbor.neighbors(config.board_size):
-                    if board.get_owner(nn) == opponent:
-                        enemy_stones = board.get_stones(nn)
-                        if enemy_stones > neighbor_stones:
-                            neighbor_threatened_by = enemy_stones
-                            break
-
-                if neighbor_threatened_by is not None:
-                    # Neighbor is threatened
-                    reinforced_stones = neighbor_stones + half_stones
-                    if reinforced_stones >= neighbor_threatened_by:
-                        # Reinforcement resolves threat
-                        options.append((80.0, create_simple_move_action(pos, neighbor, half_stones)))
-                # else: not threatened or reinforcement doesn't help
-
-        # Pick highest scored option
-        if not options:
+        half_stones = (stones + 1) // 2  # calculate_half, inlined
+        directions = _direction_table(board_size)[row][col]
+        rng_randrange = self._rng.randrange
+
+        # Every expansion/attack scores at least 90, so it always beats
+        # reinforce (80) and stay (10): take the best one without scanning
+        # friendly neighbors for threats.
+        if best_scores[row][col] > _REINFORCE_SCORE:
+            best_d, best_neighbor = directions[0]
+            ties = 0
+            for d, neighbor in directions:
+                if not is_best[d][row][col]:
+                    continue
+                # Reservoir sampling: uniform random among ties in one pass
+                # (the first candidate is always kept, without drawing)
+                ties += 1
+                if ties == 1 or rng_randrange(ties) == 0:
+                    best_d, best_neighbor = d, neighbor
+            amount = amounts[best_d][row][col]
+            return create_simple_move_action(pos, best_neighbor, amount)
+
+        # REINFORCE: Only if it resolves a threat
+        # Heuristic: Same threat detection as Minimax
+        opponent = player.opponent()
+        get_owner = board.get_owner
+        get_stones = board.get_stones
+        best_neighbor = None  # STAY is the baseline
+        ties = 0
+        neighbors = neighbor_table(board_size)
+        for _, neighbor in directions:
+            if get_owner(neighbor) != player:
+                continue
+
+            neighbor_stones = get_stones(neighbor)
+            neighbor_threatened_by = None
+            for nn in neighbors[neighbor.row][neighbor.col]:
+                if get_owner(nn) == opponent:
+                    enemy_stones = get_stones(nn)
+                    if enemy_stones > neighbor_stones:
+                        neighbor_threatened_by = enemy_stones
+                        break
+
+            if neighbor_threatened_by is not None:
+                # Neighbor is threatened
+                reinforced_stones = neighbor_stones + half_stones
+                if reinforced_stones >= neighbor_threatened_by:
+                    # Reinforcement resolves threat; random among ties
+                    ties += 1
+                    if ties == 1 or rng_randrange(ties) == 0:
+                        best_neighbor = neighbor
+            # else: not threatened or reinforcement doesn't help
+
+        # Only the winning action is materialized
+        if best_neighbor is None:
             return create_grow_action(pos)
-
-        best_score = max(opt[0] for opt in options)
-        best_options = [opt[1] for opt in options if opt[0] == best_score]
-
-        # Random among ties (consistent with greedy strategic agent)
-        return self._rng.choice(best_options)
+        return create_simple_move_action(pos, best_neighbor, half_stones)
 
     def _evaluate_move_consequences(
         self,
@@ -220,12 +346,14 @@ class HeuristicMinimaxAgent:
         """1-ply lookahead: evaluate the position after this move.
 
         This adds a tiny bit of search without full minimax tree.
-        Returns the evaluation score for the resulting position.
+        Returns the evaluation score for the resulting position, or 0.0 if
+        the game is over or the move would be rejected by the engine.
         """
-        opponent = player.opponent()
+        if state.is_complete or not validate_turn_actions(move, state, config)[0]:
+            return 0.0
 
         # Apply our move (opponent stays)
-        opp_actions = PlayerTurnActions(player=opponent, actions=())
+        opp_actions = _stay_actions(state, player.opponent())
         if player == Owner.PLAYER_1:
             turn_actions = TurnActions(
                 player1_actions=move,
@@ -241,13 +369,8 @@ class HeuristicMinimaxAgent:
 
         # Use fixed seed for consistency
         eval_rng = Random(42)
-        try:
-            from ..engine import apply_turn
-            next_state = apply_turn(state, turn_actions, config, eval_rng)
-            return evaluate_board(
-                next_state.board, player, config,
-                next_state.current_turn, self._weights
-            )
-        except Exception:
-            # Fallback if lookahead fails
-            return 0.0
+        next_state = apply_turn(state, turn_actions, config, eval_rng)
+        return evaluate_board(
+            next_state.board, player, config,
+            next_state.current_turn, self._weights
+        )
@@ -5,6 +5,8 @@ V3: Stone-count with split movement support.
 This agent prompts the user for input through the terminal.
 """
 
+from operator import attrgetter
+
 from ..types import (
     Owner,
     Position,
@@ -15,6 +17,7 @@ from ..types import (
     create_simple_move_action,
 )
 from ..config import GameConfig
+from .common import neighbor_table
 
 
 class HumanAgent:
@@ -102,8 +105,10 @@ class HumanAgent:
         print(f"Current board:")
         print(state.board)
 
-        owned_positions = list(state.board.positions_owned_by(player))
-        owned_positions.sort(key=lambda p: (p.row, p.col))
+        owned_positions = sorted(
+            state.board.positions_owned_by(player), key=attrgetter("row", "col")
+        )
+        table = neighbor_table(config.board_size)
 
         print(f"\nYou control {len(owned_positions)} territories.")
         print("For each territory, choose:")
@@ -114,11 +119,11 @@ class HumanAgent:
 
         for pos in owned_positions:
             territory = state.board.get(pos)
-            neighbors = pos.neighbors(config.board_size)
+            neighbors = table[pos.row][pos.col]
 
             print(f"\n--- Territory at {pos} ({territory.stones} stones) ---")
             print(f"Neighbors: ", end="")
-            for n in sorted(neighbors, key=lambda p: (p.row, p.col)):
+            for n in neighbors:
                 n_terr = state.board.get(n)
                 if n_terr.owner == Owner.NEUTRAL:
                     print(f"{n}[empty] ", end="")
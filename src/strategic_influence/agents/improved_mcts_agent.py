@@ -13,13 +13,24 @@ TUNING GUIDE:
 - num_simulations: More = better estimates but slower (50-200 typical)
 - exploration_c: Higher = explore more, lower = exploit more (1.0-2.0)
 - rollout_smartness: 0.0=random, 1.0=fully heuristic
+- num_workers: >1 splits the simulation budget across worker processes
+  (root parallelization); 1 keeps everything in-process
+- leaf_batch: rollouts per UCB selection; with num_workers > 1 each batch
+  runs across the worker pool (leaf parallelization) instead of sharding
+- max_rollout_depth: stop rollouts after this many turns and score the board
+  by territory count (None = play to the end; ~8 trades accuracy for speed)
+- rollout_seed_buckets: reuse rollout results within a search by limiting
+  each candidate to this many distinct rollout seeds (None = no reuse)
 """
 
 import math
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from random import Random
 
+import numpy as np
+
 from ..types import (
     Owner,
     Position,
@@ -27,6 +38,7 @@ from ..types import (
     SetupAction,
     PlayerTurnActions,
     TerritoryAction,
+    TerritoryBoard,
     TurnActions,
     MoveType,
     calculate_half,
@@ -34,12 +46,20 @@ from ..types import (
     create_simple_move_action,
 )
 from ..config import GameConfig
-from ..engine import apply_turn
+from ..engine import apply_turn, determine_winner
+from ..resolution import resolve_turn
 from ..evaluation import is_position_threatened
-from .common import center_aware_setup
+from .common import (
+    board_positions,
+    center_aware_setup,
+    flat_neighbor_table,
+    neighbor_table,
+    weighted_destination,
+    weighted_flat_destination,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateStats:
     """Statistics for a candidate move."""
     actions: PlayerTurnActions
@@ -77,6 +97,10 @@ class ImprovedMCTSAgent:
     - num_simulations: How many games to simulate (default 100)
     - exploration_c: UCB exploration constant (default 1.414 = sqrt(2))
     - rollout_smartness: 0.0=random, 1.0=heuristic (default 0.7)
+    - num_workers: Worker processes for parallel search (default 1)
+    - leaf_batch: Rollouts per UCB selection (default 1)
+    - max_rollout_depth: Turn cap per rollout, None for full games (default None)
+    - rollout_seed_buckets: Distinct memoized rollouts per candidate (default None)
     """
 
     def __init__(
@@ -87,6 +111,10 @@ class ImprovedMCTSAgent:
         exploration_c: float = 1.414,
         rollout_smartness: float = 0.7,  # How heuristic vs random the rollout is
         verbose: bool = False,
+        num_workers: int = 1,
+        leaf_batch: int = 1,
+        max_rollout_depth: int | None = None,
+        rollout_seed_buckets: int | None = None,
     ):
         self._initial_seed = seed
         self._rng = Random(seed)
@@ -95,7 +123,22 @@ class ImprovedMCTSAgent:
         self._exploration_c = exploration_c
         self._rollout_smartness = rollout_smartness
         self._verbose = verbose
+        self._num_workers = num_workers
+        self._leaf_batch = max(1, leaf_batch)
+        self._max_rollout_depth = max_rollout_depth
+        self._rollout_seed_buckets = rollout_seed_buckets
+        self._bucket_seeds: list[int] = []
+        self._rollout_cache: dict[tuple[PlayerTurnActions, int], Owner | None] = {}
+        self._executor: ProcessPoolExecutor | None = None
         self._last_search_time = 0.0
+        # Rollout RNG, re-seeded per rollout rather than allocated each time
+        self._sim_rng = Random()
+        # Scratch action lists reused by every rollout turn, one per side
+        self._action_bufs: dict[Owner, list[TerritoryAction]] = {
+            Owner.PLAYER_1: [],
+            Owner.PLAYER_2: [],
+        }
+        self._all_stay_cache: dict[tuple[Owner, tuple[Position, ...]], PlayerTurnActions] = {}
 
     @property
     def name(self) -> str:
@@ -103,6 +146,13 @@ class ImprovedMCTSAgent:
 
     def reset(self) -> None:
         self._rng = Random(self._initial_seed)
+        self._all_stay_cache.clear()
+
+    def close(self) -> None:
+        """Shut down the worker pool used for parallel search, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def choose_setup(
         self,
@@ -133,42 +183,208 @@ class ImprovedMCTSAgent:
         if self._verbose:
             print(f"  MCTS: {len(candidates)} candidates, {self._num_simulations} sims")
 
+        if self._num_workers > 1 and self._leaf_batch == 1:
+            total_sims = self._run_root_parallel(candidates, state, player, config)
+        else:
+            total_sims = self._run_simulations(
+                candidates, state, player, config, self._num_simulations
+            )
+
+        self._last_search_time = time.time() - start_time
+
+        # Return candidate with highest win rate
+        best = max(candidates, key=lambda c: c.win_rate)
+
+        if self._verbose:
+            print(f"  MCTS: {total_sims} sims in {self._last_search_time:.2f}s, best={best.win_rate:.1%}")
+
+        return best.actions
+
+    def _run_simulations(
+        self,
+        candidates: list[CandidateStats],
+        state: GameState,
+        player: Owner,
+        config: GameConfig,
+        num_simulations: int,
+        early_termination: bool = True,
+    ) -> int:
+        """Run UCB1-guided simulations, updating candidate stats in place.
+
+        Each selection runs a batch of leaf_batch rollouts for the chosen
+        candidate (the last batch is trimmed to the remaining budget).
+
+        Returns:
+            Number of simulations actually run.
+        """
+        # Mirror candidate stats in arrays so UCB1 is one vectorized pass.
+        # Win rates and 1/sqrt(sims) are updated incrementally for the one
+        # candidate simulated, so each selection needs a single log + sqrt.
+        wins = np.array([c.wins for c in candidates], dtype=float)
+        sims = np.array([c.simulations for c in candidates], dtype=float)
+        visited = sims > 0
+        win_rates = np.divide(wins, sims, out=np.zeros_like(wins), where=visited)
+        inv_sqrt_sims = np.divide(
+            1.0, np.sqrt(sims), out=np.full_like(sims, np.inf), where=visited
+        )
+        num_unexplored = int(np.count_nonzero(~visited))
+
+        # Memoized rollouts are only valid for this search's root state
+        self._rollout_cache.clear()
+        if self._rollout_seed_buckets:
+            self._bucket_seeds = [
+                self._rng.randint(0, 2**31 - 1)
+                for _ in range(self._rollout_seed_buckets)
+            ]
+
         # Run simulations using UCB1 to select which candidate to simulate
         total_sims = 0
-        for _ in range(self._num_simulations):
-            # Select candidate with highest UCB value
-            best_candidate = max(
-                candidates,
-                key=lambda c: c.ucb_value(total_sims + 1, self._exploration_c)
+        next_termination_check = 30
+        while total_sims < num_simulations:
+            # Select candidate with highest UCB value (unexplored first)
+            if num_unexplored:
+                best_i = int(np.argmax(inv_sqrt_sims))  # first inf
+            else:
+                exploration_scale = self._exploration_c * math.sqrt(
+                    math.log(total_sims + 1)
+                )
+                best_i = int((win_rates + exploration_scale * inv_sqrt_sims).argmax())
+            best_candidate = candidates[best_i]
+
+            # Run simulation(s)
+            batch = min(self._leaf_batch, num_simulations - total_sims)
+            results = self._run_leaf_batch(
+                state, player, best_candidate.actions, config, batch
             )
 
-            # Run simulation
-            result = self._simulate_game(
-                state, player, best_candidate.actions, config
+            # Update statistics (draws count as half a win)
+            reward = 0.0
+            for result in results:
+                if result == player:
+                    reward += 1.0
+                elif result is None:
+                    reward += 0.5
+            best_candidate.simulations += batch
+            best_candidate.wins += reward
+            if sims[best_i] == 0:
+                num_unexplored -= 1
+            sims[best_i] += batch
+            wins[best_i] += reward
+            win_rates[best_i] = wins[best_i] / sims[best_i]
+            inv_sqrt_sims[best_i] = 1.0 / math.sqrt(sims[best_i])
+
+            total_sims += batch
+
+            # Early termination: if one candidate is clearly better
+            # (checked every 10 simulations once 30 have run)
+            if early_termination and total_sims >= next_termination_check:
+                next_termination_check = total_sims + 10
+                if self._should_terminate_early(candidates):
+                    break
+
+        return total_sims
+
+    def _run_root_parallel(
+        self,
+        candidates: list[CandidateStats],
+        state: GameState,
+        player: Owner,
+        config: GameConfig,
+    ) -> int:
+        """Split the simulation budget across worker processes and merge stats.
+
+        Each worker runs an independent UCB1 search over the same candidates
+        with its own seed (root parallelization); per-candidate wins and
+        simulation counts are summed afterwards.
+
+        Returns:
+            Number of simulations run across all workers.
+        """
+        executor = self._get_executor()
+
+        base, extra = divmod(self._num_simulations, self._num_workers)
+        shard_sizes = [base + (i < extra) for i in range(self._num_workers)]
+        candidate_actions = [c.actions for c in candidates]
+
+        futures = [
+            executor.submit(
+                _run_shard,
+                state, player, candidate_actions, config, num_sims,
+                self._exploration_c, self._rollout_smartness,
+                self._max_rollout_depth, self._rollout_seed_buckets,
+                self._rng.randint(0, 2**31 - 1),
             )
+            for num_sims in shard_sizes
+            if num_sims > 0
+        ]
 
-            # Update statistics
-            best_candidate.simulations += 1
-            if result == player:
-                best_candidate.wins += 1
-            elif result is None:  # Draw - count as half win
-                best_candidate.wins += 0.5
+        total_sims = 0
+        for future in futures:
+            for candidate, (wins, sims) in zip(candidates, future.result()):
+                candidate.wins += wins
+                candidate.simulations += sims
+                total_sims += sims
 
-            total_sims += 1
+        return total_sims
 
-            # Early termination: if one candidate is clearly better
-            if total_sims >= 30 and self._should_terminate_early(candidates):
-                break
+    def _run_leaf_batch(
+        self,
+        state: GameState,
+        player: Owner,
+        candidate: PlayerTurnActions,
+        config: GameConfig,
+        count: int,
+    ) -> list[Owner | None]:
+        """Run `count` independent rollouts of one candidate.
 
-        self._last_search_time = time.time() - start_time
+        With num_workers > 1 the rollouts are spread over the worker pool
+        (leaf parallelization); otherwise they run in-process, reusing
+        memoized results when rollout_seed_buckets is set.
+        """
+        if count == 1 or self._num_workers <= 1:
+            return [
+                self._memoized_rollout(state, player, candidate, config)
+                for _ in range(count)
+            ]
 
-        if self._verbose:
-            best = max(candidates, key=lambda c: c.win_rate)
-            print(f"  MCTS: {total_sims} sims in {self._last_search_time:.2f}s, best={best.win_rate:.1%}")
+        seeds = [self._rng.randint(0, 2**31 - 1) for _ in range(count)]
+        return list(self._get_executor().map(
+            _simulate_rollout,
+            [state] * count, [player] * count, [candidate] * count,
+            [config] * count, [self._rollout_smartness] * count,
+            [self._max_rollout_depth] * count, seeds,
+        ))
 
-        # Return candidate with highest win rate
-        best = max(candidates, key=lambda c: c.win_rate)
-        return best.actions
+    def _memoized_rollout(
+        self,
+        state: GameState,
+        player: Owner,
+        candidate: PlayerTurnActions,
+        config: GameConfig,
+    ) -> Owner | None:
+        """Run one rollout, or reuse the result of an identical earlier one.
+
+        With rollout_seed_buckets set, each rollout picks one of a fixed set
+        of seeds for this search; a (candidate, seed) pair always plays out
+        the same way, so its result is cached and reused. The cache is keyed
+        on the candidate only because it is cleared for every root state.
+        """
+        if not self._rollout_seed_buckets:
+            return self._simulate_game(state, player, candidate, config)
+
+        bucket = self._rng.randrange(self._rollout_seed_buckets)
+        key = (candidate, bucket)
+        if key not in self._rollout_cache:
+            self._rollout_cache[key] = self._simulate_game(
+                state, player, candidate, config, seed=self._bucket_seeds[bucket]
+            )
+        return self._rollout_cache[key]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Worker pool for parallel search, created on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._num_workers)
+        return self._executor
 
     def get_stats(self) -> dict:
         """Get statistics from last search."""
@@ -182,10 +398,14 @@ class ImprovedMCTSAgent:
         if len(candidates) < 2:
             return True
 
-        # Sort by simulations
-        sorted_cands = sorted(candidates, key=lambda c: c.simulations, reverse=True)
-        best = sorted_cands[0]
-        second = sorted_cands[1]
+        # Two most-simulated candidates (earliest first on ties), one pass
+        best = second = None
+        for c in candidates:
+            if best is None or c.simulations > best.simulations:
+                second = best
+                best = c
+            elif second is None or c.simulations > second.simulations:
+                second = c
 
         if best.simulations < 10 or second.simulations < 5:
             return False
@@ -205,7 +425,7 @@ class ImprovedMCTSAgent:
     ) -> list[CandidateStats]:
         """Generate diverse candidate moves."""
         candidates: list[CandidateStats] = []
-        owned = list(state.board.positions_owned_by(player))
+        owned = tuple(state.board.positions_owned_by(player))
 
         if not owned:
             return []
@@ -213,40 +433,52 @@ class ImprovedMCTSAgent:
         opponent = player.opponent()
         board = state.board
 
+        # Every candidate starts from "all stay" and changes one slot
+        grow_template = [create_grow_action(pos) for pos in owned]
+
         # Candidate 1: All stay (defensive baseline)
-        all_stay = self._all_stay(state, player)
+        all_stay = self._all_stay_for(player, owned)
         candidates.append(CandidateStats(actions=all_stay))
 
-        # Generate targeted candidates for each territory
-        for pos in owned:
+        # Generate targeted candidates for each territory. Each differs from
+        # all-stay in one slot, so (slot, destination, amount) identifies it
+        # and the full PlayerTurnActions is only built for new keys.
+        seen_moves: set[tuple[int, Position, int]] = set()
+        neighbor_lists = neighbor_table(config.board_size)
+        for i, pos in enumerate(owned):
             territory = board.get(pos)
             stones = territory.stones
             half_stones = calculate_half(stones)
-            neighbors = list(pos.neighbors(config.board_size))
+            neighbors = neighbor_lists[pos.row][pos.col]
 
             for neighbor in neighbors:
-                neighbor_owner = board.get_owner(neighbor)
-                neighbor_stones = board.get_stones(neighbor) if neighbor_owner != Owner.NEUTRAL else 0
+                neighbor_owner = board.get(neighbor).owner
 
                 # SEND_HALF expansion/attack
-                cand = self._single_action_candidate(
-                    state, player, pos, neighbor, half_stones, config
-                )
-                if cand not in [c.actions for c in candidates]:
-                    candidates.append(CandidateStats(actions=cand))
-
+                amounts = (half_stones,)
                 # SEND_ALL for strong attacks or full expansion
                 if neighbor_owner == opponent or neighbor_owner == Owner.NEUTRAL:
+                    amounts = (half_stones, stones)
+
+                for amount in amounts:
+                    key = (i, neighbor, amount)
+                    if key in seen_moves:
+                        continue
+                    seen_moves.add(key)
                     cand = self._single_action_candidate(
-                        state, player, pos, neighbor, stones, config
+                        player, grow_template, i,
+                        create_simple_move_action(pos, neighbor, amount),
                     )
-                    if cand not in [c.actions for c in candidates]:
-                        candidates.append(CandidateStats(actions=cand))
+                    candidates.append(CandidateStats(actions=cand))
 
-        # Add random candidates to fill remaining slots
+        # Add random candidates to fill remaining slots (these can match any
+        # earlier candidate, so they are deduplicated on the full actions)
+        if len(candidates) < self._num_candidates:
+            seen = {c.actions for c in candidates}
         while len(candidates) < self._num_candidates:
-            random_cand = self._random_candidate(state, player, config)
-            if random_cand not in [c.actions for c in candidates]:
+            random_cand = self._random_candidate(state, player, owned, config)
+            if random_cand not in seen:
+                seen.add(random_cand)
                 candidates.append(CandidateStats(actions=random_cand))
             else:
                 break  # Avoid infinite loop
@@ -255,57 +487,62 @@ class ImprovedMCTSAgent:
         if len(candidates) > self._num_candidates:
             # Keep first few (heuristic) plus random sample
             heuristic_count = max(4, self._num_candidates // 2)
-            keep = candidates[:heuristic_count]
-            remaining = candidates[heuristic_count:]
-            self._rng.shuffle(remaining)
-            candidates = keep + remaining[:self._num_candidates - heuristic_count]
+            # Direct k-choice instead of shuffling the whole remainder
+            extra = self._rng.sample(
+                candidates[heuristic_count:],
+                max(0, self._num_candidates - heuristic_count),
+            )
+            del candidates[heuristic_count:]
+            candidates.extend(extra)
 
         return candidates
 
     def _single_action_candidate(
         self,
-        state: GameState,
         player: Owner,
-        source: Position,
-        dest: Position,
-        stones: int,
-        config: GameConfig,
+        grow_template: list[TerritoryAction],
+        index: int,
+        action: TerritoryAction,
     ) -> PlayerTurnActions:
-        """Create candidate where one territory moves, others stay."""
-        actions = []
-        for pos in state.board.positions_owned_by(player):
-            if pos == source:
-                actions.append(create_simple_move_action(pos, dest, stones))
-            else:
-                actions.append(create_grow_action(pos))
+        """Create candidate where one territory moves, others stay.
+
+        Args:
+            player: Player the candidate is for
+            grow_template: Grow actions for every owned territory, in order
+            index: Slot of the moving territory in grow_template
+            action: The move replacing that slot
+        """
+        actions = grow_template.copy()
+        actions[index] = action
         return PlayerTurnActions(player=player, actions=tuple(actions))
 
     def _random_candidate(
         self,
         state: GameState,
         player: Owner,
+        owned: tuple[Position, ...],
         config: GameConfig,
     ) -> PlayerTurnActions:
         """Generate a random candidate with some heuristic bias."""
         actions = []
+        neighbor_lists = neighbor_table(config.board_size)
 
-        for pos in state.board.positions_owned_by(player):
+        for pos in owned:
             territory = state.board.get(pos)
             stones = territory.stones
-            neighbors = list(pos.neighbors(config.board_size))
+            neighbors = neighbor_lists[pos.row][pos.col]
 
             # Biased random: prefer SEND_HALF for expansion
             choice = self._rng.random()
-            if choice < 0.4 or not neighbors:
+            dest = None
+            if choice >= 0.4 and neighbors:
+                # SEND_HALF (preferred) below 0.75, SEND_ALL above
+                amount = calculate_half(stones) if choice < 0.75 else stones
+                dest = weighted_destination(state.board, player, neighbors, amount, self._rng)
+            if dest is None:
                 actions.append(create_grow_action(pos))
-            elif choice < 0.75:
-                # SEND_HALF (preferred)
-                dest = self._rng.choice(neighbors)
-                actions.append(create_simple_move_action(pos, dest, calculate_half(stones)))
             else:
-                # SEND_ALL
-                dest = self._rng.choice(neighbors)
-                actions.append(create_simple_move_action(pos, dest, stones))
+                actions.append(create_simple_move_action(pos, dest, amount))
 
         return PlayerTurnActions(player=player, actions=tuple(actions))
 
@@ -315,79 +552,122 @@ class ImprovedMCTSAgent:
         player: Owner,
         candidate: PlayerTurnActions,
         config: GameConfig,
+        seed: int | None = None,
     ) -> Owner | None:
-        """Simulate game to completion using heuristic rollout."""
-        opponent = player.opponent()
-        current_state = state
+        """Simulate game using heuristic rollout.
 
-        # Apply candidate move with heuristic opponent response
-        if not current_state.is_complete:
-            opp_actions = self._heuristic_actions(current_state, opponent, config)
-
-            if player == Owner.PLAYER_1:
-                turn_actions = TurnActions(
-                    player1_actions=candidate,
-                    player2_actions=opp_actions,
-                    turn_number=current_state.current_turn + 1,
-                )
-            else:
-                turn_actions = TurnActions(
-                    player1_actions=opp_actions,
-                    player2_actions=candidate,
-                    turn_number=current_state.current_turn + 1,
-                )
+        One RNG, seeded from the agent's (or from `seed` if given), drives
+        the whole rollout: the heuristic policy for both sides and every
+        turn resolution.
 
-            sim_rng = Random(self._rng.randint(0, 2**31 - 1))
-            current_state = apply_turn(current_state, turn_actions, config, sim_rng)
+        Only the candidate's turn goes through apply_turn (which validates
+        it). The heuristic turns after it advance the bare board with
+        resolve_turn: the policy only emits legal actions, and a rollout
+        needs neither the turn history nor per-turn GameState objects.
 
-        # Continue with heuristic play
-        while not current_state.is_complete:
-            p1_actions = self._heuristic_actions(current_state, Owner.PLAYER_1, config)
-            p2_actions = self._heuristic_actions(current_state, Owner.PLAYER_2, config)
+        Plays to completion unless max_rollout_depth is set, in which case
+        the rollout stops after that many turns and the board is judged by
+        the game's own win rule (territory count).
+        """
+        if state.is_complete:
+            return state.winner
+
+        opponent = player.opponent()
+        if seed is None:
+            seed = self._rng.randint(0, 2**31 - 1)
+        sim_rng = self._sim_rng
+        sim_rng.seed(seed)
+        if self._max_rollout_depth is None:
+            stop_turn = config.num_turns
+        else:
+            stop_turn = min(config.num_turns, state.current_turn + self._max_rollout_depth)
 
+        # Apply candidate move with heuristic opponent response
+        opp_actions = self._heuristic_actions(state.board, opponent, config, sim_rng)
+        if player == Owner.PLAYER_1:
             turn_actions = TurnActions(
-                player1_actions=p1_actions,
-                player2_actions=p2_actions,
-                turn_number=current_state.current_turn + 1,
+                player1_actions=candidate,
+                player2_actions=opp_actions,
+                turn_number=state.current_turn + 1,
             )
+        else:
+            turn_actions = TurnActions(
+                player1_actions=opp_actions,
+                player2_actions=candidate,
+                turn_number=state.current_turn + 1,
+            )
+        next_state = apply_turn(state, turn_actions, config, sim_rng)
+        board = next_state.board
+        turn = next_state.current_turn
 
-            sim_rng = Random(self._rng.randint(0, 2**31 - 1))
-            current_state = apply_turn(current_state, turn_actions, config, sim_rng)
-
-        return current_state.winner
+        # Continue with heuristic play
+        while turn < stop_turn:
+            p1_actions = self._heuristic_actions(board, Owner.PLAYER_1, config, sim_rng)
+            p2_actions = self._heuristic_actions(board, Owner.PLAYER_2, config, sim_rng)
+            turn += 1
+            board = resolve_turn(
+                board,
+                TurnActions(
+                    player1_actions=p1_actions,
+                    player2_actions=p2_actions,
+                    turn_number=turn,
+                ),
+                config,
+                sim_rng,
+            )[0]
+
+        return determine_winner(board)
 
     def _heuristic_actions(
         self,
-        state: GameState,
+        board: TerritoryBoard,
         player: Owner,
         config: GameConfig,
+        rng: Random,
     ) -> PlayerTurnActions:
         """Generate actions using lightweight heuristics.
 
         This is the key improvement: instead of random play,
         use simple heuristics that approximate good strategy.
+
+        The board is read once into flat owner/stone lists (row-major), and
+        neighbors come from a precomputed flat index table, so the per-cell
+        policy works on plain list indexing.
         """
-        actions = []
+        actions = self._action_bufs[player]
+        actions.clear()
         opponent = player.opponent()
-        board = state.board
+        board_size = config.board_size
+
+        cells = board.territories()
+        owners = [t.owner for t in cells]
+        stones = [t.stones for t in cells]
 
         # Calculate relative strength
-        my_stones = board.total_stones(player)
-        enemy_stones = board.total_stones(opponent)
+        my_stones = 0
+        enemy_stones = 0
+        for owner, count in zip(owners, stones):
+            if owner == player:
+                my_stones += count
+            elif owner == opponent:
+                enemy_stones += count
         relative_strength = my_stones / max(1, enemy_stones)
 
-        for pos in board.positions_owned_by(player):
-            territory = board.get(pos)
-            stones = territory.stones
-            neighbors = list(pos.neighbors(config.board_size))
+        positions = board_positions(board_size)
+        neighbor_indices = flat_neighbor_table(board_size)
+        for i, owner in enumerate(owners):
+            if owner != player:
+                continue
+            pos = positions[i]
+            neighbors = neighbor_indices[i]
 
             if not neighbors:
                 actions.append(create_grow_action(pos))
                 continue
 
             action = self._choose_heuristic_action(
-                pos, stones, neighbors, board, player, opponent,
-                relative_strength, config
+                pos, stones[i], neighbors, owners, stones, player, opponent,
+                relative_strength, neighbor_indices, rng
             )
             actions.append(action)
 
@@ -397,92 +677,97 @@ class ImprovedMCTSAgent:
         self,
         pos: Position,
         stones: int,
-        neighbors: list[Position],
-        board,
+        neighbors: tuple[tuple[int, Position], ...],
+        owners: list[Owner],
+        cell_stones: list[int],
         player: Owner,
         opponent: Owner,
         relative_strength: float,
-        config: GameConfig,
+        neighbor_indices: tuple[tuple[tuple[int, Position], ...], ...],
+        rng: Random,
     ) -> TerritoryAction:
         """Choose action based on simple heuristics.
 
         The rollout_smartness parameter controls how heuristic vs random:
         - 0.0 = pure random
         - 1.0 = always follow heuristics
+
+        Args:
+            neighbors: (flat index, Position) pairs adjacent to pos
+            owners: Flat row-major owner of every cell
+            cell_stones: Flat row-major stone count of every cell
+            neighbor_indices: flat_neighbor_table for the board size
+            rng: Rollout RNG (shared across the whole simulated game)
         """
         half_stones = calculate_half(stones)
 
         # With probability (1 - smartness), just pick randomly
-        if self._rng.random() > self._rollout_smartness:
-            # Random action
-            choice = self._rng.random()
+        if rng.random() > self._rollout_smartness:
+            # Random action: STAY/HALF/ALL at fixed odds, with the destination
+            # weighted toward neutral cells and enemies the move would beat
+            choice = rng.random()
             if choice < 0.4 or not neighbors:
                 return create_grow_action(pos)
-            elif choice < 0.7:
-                return create_simple_move_action(pos, self._rng.choice(neighbors), half_stones)
-            else:
-                return create_simple_move_action(pos, self._rng.choice(neighbors), stones)
+            amount = half_stones if choice < 0.7 else stones
+            dest = weighted_flat_destination(
+                neighbors, owners, cell_stones, player, amount, rng
+            )
+            if dest is None:
+                return create_grow_action(pos)
+            return create_simple_move_action(pos, dest, amount)
 
-        # Otherwise, use heuristics
-        # Categorize neighbors
-        enemy_neighbors = []
+        # Otherwise, use heuristics. One pass categorizes the neighbors and
+        # finds the weakest enemy we outnumber (first one on ties).
         neutral_neighbors = []
         friendly_neighbors = []
-
-        for n in neighbors:
-            owner = board.get_owner(n)
+        target = None
+        enemy_stones = stones
+        has_enemy = False
+        for j, n in neighbors:
+            owner = owners[j]
             if owner == opponent:
-                enemy_neighbors.append((n, board.get_stones(n)))
+                has_enemy = True
+                if cell_stones[j] < enemy_stones:
+                    target, enemy_stones = n, cell_stones[j]
             elif owner == Owner.NEUTRAL:
                 neutral_neighbors.append(n)
             else:
-                friendly_neighbors.append((n, board.get_stones(n)))
+                friendly_neighbors.append((j, n))
 
         # Heuristic 1: Attack weaker enemies when strong
-        if enemy_neighbors and relative_strength >= 1.0:
-            attackable = [(n, s) for n, s in enemy_neighbors if stones > s]
-            if attackable:
-                target, enemy_stones = min(attackable, key=lambda x: x[1])
-                # SEND_HALF if it can win (safer), SEND_ALL if needed
-                if half_stones > enemy_stones:
-                    return create_simple_move_action(pos, target, half_stones)
-                elif stones > enemy_stones:
-                    return create_simple_move_action(pos, target, stones)
+        if target is not None and relative_strength >= 1.0:
+            # SEND_HALF if it can win (safer), SEND_ALL if needed
+            amount = half_stones if half_stones > enemy_stones else stones
+            return create_simple_move_action(pos, target, amount)
 
         # Heuristic 2: Expand into neutral (prefer SEND_HALF - keeps territory)
         if neutral_neighbors:
-            target = self._rng.choice(neutral_neighbors)
+            target = rng.choice(neutral_neighbors)
             # Almost always SEND_HALF for expansion (safe division principle)
-            if self._rng.random() < 0.8:
+            if rng.random() < 0.8:
                 return create_simple_move_action(pos, target, half_stones)
-            else:
-                return create_simple_move_action(pos, target, stones)
+            return create_simple_move_action(pos, target, stones)
 
         # Heuristic 3: Defend when weak and threatened
-        is_threatened = bool(enemy_neighbors)
-        if is_threatened and stones < 4:
+        if has_enemy and stones < 4:
             return create_grow_action(pos)
 
-        # Heuristic 4: Reinforce threatened friendly
+        # Heuristic 4: Reinforce threatened friendly (the second-neighbor
+        # scan only runs once nothing above applied)
         if friendly_neighbors:
             threatened_friends = [
-                (n, s) for n, s in friendly_neighbors
-                if any(board.get_owner(nn) == opponent
-                       for nn in n.neighbors(config.board_size))
+                n for j, n in friendly_neighbors
+                if any(owners[k] == opponent for k, _ in neighbor_indices[j])
             ]
             if threatened_friends:
-                target = self._rng.choice([n for n, _ in threatened_friends])
-                return create_simple_move_action(pos, target, half_stones)
+                return create_simple_move_action(
+                    pos, rng.choice(threatened_friends), half_stones
+                )
 
         # Default: mostly stay and grow
-        if self._rng.random() < 0.7:
-            return create_grow_action(pos)
-        elif neighbors:
-            return create_simple_move_action(
-                pos, self._rng.choice(neighbors), half_stones
-            )
-        else:
+        if rng.random() < 0.7:
             return create_grow_action(pos)
+        return create_simple_move_action(pos, rng.choice(neighbors)[1], half_stones)
 
     def _all_stay(
         self,
@@ -490,8 +775,77 @@ class ImprovedMCTSAgent:
         player: Owner,
     ) -> PlayerTurnActions:
         """Create all-stay actions."""
-        actions = [
-            create_grow_action(pos)
-            for pos in state.board.positions_owned_by(player)
-        ]
-        return PlayerTurnActions(player=player, actions=tuple(actions))
+        return self._all_stay_for(
+            player, tuple(state.board.positions_owned_by(player))
+        )
+
+    def _all_stay_for(
+        self,
+        player: Owner,
+        owned: tuple[Position, ...],
+    ) -> PlayerTurnActions:
+        """All-stay actions for the given territories, memoized per agent."""
+        key = (player, owned)
+        all_stay = self._all_stay_cache.get(key)
+        if all_stay is None:
+            all_stay = PlayerTurnActions(
+                player=player,
+                actions=tuple(create_grow_action(pos) for pos in owned),
+            )
+            self._all_stay_cache[key] = all_stay
+        return all_stay
+
+
+def _run_shard(
+    state: GameState,
+    player: Owner,
+    candidate_actions: list[PlayerTurnActions],
+    config: GameConfig,
+    num_simulations: int,
+    exploration_c: float,
+    rollout_smartness: float,
+    max_rollout_depth: int | None,
+    rollout_seed_buckets: int | None,
+    seed: int,
+) -> list[tuple[float, int]]:
+    """Run one root-parallel shard of simulations (in a worker process).
+
+    Returns:
+        (wins, simulations) for each candidate, in input order.
+    """
+    agent = ImprovedMCTSAgent(
+        seed=seed,
+        num_simulations=num_simulations,
+        exploration_c=exploration_c,
+        rollout_smartness=rollout_smartness,
+        max_rollout_depth=max_rollout_depth,
+        rollout_seed_buckets=rollout_seed_buckets,
+    )
+    candidates = [CandidateStats(actions=actions) for actions in candidate_actions]
+    agent._run_simulations(
+        candidates, state, player, config, num_simulations,
+        early_termination=False,
+    )
+    return [(c.wins, c.simulations) for c in candidates]
+
+
+def _simulate_rollout(
+    state: GameState,
+    player: Owner,
+    candidate: PlayerTurnActions,
+    config: GameConfig,
+    rollout_smartness: float,
+    max_rollout_depth: int | None,
+    seed: int,
+) -> Owner | None:
+    """Run a single heuristic rollout (in a worker process).
+
+    Returns:
+        Winner of the simulated game, or None for a draw.
+    """
+    agent = ImprovedMCTSAgent(
+        seed=seed,
+        rollout_smartness=rollout_smartness,
+        max_rollout_depth=max_rollout_depth,
+    )
+    return agent._simulate_game(state, player, candidate, config)
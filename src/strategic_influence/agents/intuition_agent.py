@@ -11,6 +11,7 @@ The key insight: Safely dividing maximizes growth for next turn.
 Split -> grow -> grow -> merge creates compound growth advantage.
 """
 
+from functools import lru_cache
 from random import Random
 
 from ..types import (
@@ -20,6 +21,7 @@ from ..types import (
     SetupAction,
     PlayerTurnActions,
     TerritoryAction,
+    TerritoryBoard,
     MoveType,
     calculate_half,
     create_grow_action,
@@ -32,7 +34,39 @@ from ..evaluation import (
     can_safely_divide,
     turns_until_threat_reaches,
 )
-from .common import find_valid_setup_positions
+from .common import (
+    find_valid_setup_positions,
+    neighbor_table,
+    set_order_neighbor_table,
+)
+
+
+@lru_cache(maxsize=None)
+def _center_tables(
+    board_size: int,
+) -> tuple[tuple[tuple[int, ...], ...], tuple[tuple[int, ...], ...]]:
+    """Per-cell distance to center and neighbor count, indexed [row][col].
+
+    Both only depend on the board size, so setup and expansion scoring read
+    them instead of recomputing per position.
+
+    Args:
+        board_size: Size of board
+
+    Returns:
+        (center distance table, neighbor count table)
+    """
+    mid = board_size // 2
+    neighbors = neighbor_table(board_size)
+    dist = tuple(
+        tuple(abs(r - mid) + abs(c - mid) for c in range(board_size))
+        for r in range(board_size)
+    )
+    neighbor_counts = tuple(
+        tuple(len(neighbors[r][c]) for c in range(board_size))
+        for r in range(board_size)
+    )
+    return dist, neighbor_counts
 
 
 class IntuitionAgent:
@@ -67,17 +101,13 @@ class IntuitionAgent:
         config: GameConfig,
     ) -> SetupAction:
         """Choose setup position - prefer center for expansion potential."""
-        board_size = config.board_size
-        mid = board_size // 2
-
         valid_positions = find_valid_setup_positions(state, player, config)
+        dist, neighbor_counts = _center_tables(config.board_size)
 
         # Prefer positions closer to center (more expansion options)
         def center_score(pos) -> float:
-            dist = abs(pos.row - mid) + abs(pos.col - mid)
             # Also prefer positions with more neighbors
-            num_neighbors = len(pos.neighbors(board_size))
-            return -dist + num_neighbors * 0.5
+            return -dist[pos.row][pos.col] + neighbor_counts[pos.row][pos.col] * 0.5
 
         valid_positions.sort(key=center_score, reverse=True)
 
@@ -96,9 +126,7 @@ class IntuitionAgent:
         board = state.board
         opponent = player.opponent()
 
-        owned_positions = list(board.positions_owned_by(player))
-
-        for pos in owned_positions:
+        for pos in board.positions_owned_by(player):
             action = self._choose_action_for_territory(
                 pos, state, player, config
             )
@@ -118,7 +146,9 @@ class IntuitionAgent:
         territory = board.get(pos)
         stones = territory.stones
         half_stones = calculate_half(stones)
-        neighbors = list(pos.neighbors(config.board_size))
+        # Position.neighbors() order, so max() ties among the categorized
+        # neighbors below break as they always have
+        neighbors = set_order_neighbor_table(config.board_size)[pos.row][pos.col]
         opponent = player.opponent()
 
         # Categorize neighbors
@@ -127,13 +157,14 @@ class IntuitionAgent:
         friendly_neighbors: list[tuple[Position, int]] = []
 
         for n in neighbors:
-            n_owner = board.get_owner(n)
+            n_territory = board.get(n)
+            n_owner = n_territory.owner
             if n_owner == Owner.NEUTRAL:
                 neutral_neighbors.append(n)
             elif n_owner == opponent:
-                enemy_neighbors.append((n, board.get_stones(n)))
+                enemy_neighbors.append((n, n_territory.stones))
             else:
-                friendly_neighbors.append((n, board.get_stones(n)))
+                friendly_neighbors.append((n, n_territory.stones))
 
         # Check if we can safely divide
         safely_dividable = can_safely_divide(pos, board, player, config)
@@ -156,7 +187,7 @@ class IntuitionAgent:
         if safely_dividable and neutral_neighbors:
             # Prefer center-ward expansion
             best_neutral = self._best_expansion_target(
-                neutral_neighbors, config
+                neutral_neighbors, *_center_tables(config.board_size)
             )
             # SEND_HALF to keep this territory
             return create_simple_move_action(pos, best_neutral, half_stones)
@@ -185,7 +216,9 @@ class IntuitionAgent:
         # Priority 5: Expand even if not perfectly safe (early game aggression)
         early_game = state.current_turn < config.num_turns * 0.3
         if early_game and neutral_neighbors and stones >= 2:
-            best_neutral = self._best_expansion_target(neutral_neighbors, config)
+            best_neutral = self._best_expansion_target(
+                neutral_neighbors, *_center_tables(config.board_size)
+            )
             return create_simple_move_action(pos, best_neutral, half_stones)
 
         # Default: Stay and grow
@@ -194,23 +227,26 @@ class IntuitionAgent:
     def _best_expansion_target(
         self,
         neutral_neighbors: list[Position],
-        config: GameConfig,
+        dist: tuple[tuple[int, ...], ...],
+        neighbor_counts: tuple[tuple[int, ...], ...],
     ) -> Position:
-        """Find the best neutral to expand into (prefer center)."""
-        mid = config.board_size // 2
+        """Find the best neutral to expand into (prefer center).
 
+        Args:
+            neutral_neighbors: Candidate expansion targets
+            dist: Center distance table from _center_tables
+            neighbor_counts: Neighbor count table from _center_tables
+        """
         def score(pos: Position) -> float:
-            dist = abs(pos.row - mid) + abs(pos.col - mid)
             # More neighbors = more future options
-            num_neighbors = len(pos.neighbors(config.board_size))
-            return -dist + num_neighbors * 0.3
+            return -dist[pos.row][pos.col] + neighbor_counts[pos.row][pos.col] * 0.3
 
         return max(neutral_neighbors, key=score)
 
     def _find_safest_neighbor(
         self,
         friendly_neighbors: list[tuple[Position, int]],
-        board,
+        board: TerritoryBoard,
         player: Owner,
         config: GameConfig,
     ) -> Position | None:
@@ -218,14 +254,18 @@ class IntuitionAgent:
         if not friendly_neighbors:
             return None
 
+        neighbors = neighbor_table(config.board_size)
+        opponent = player.opponent()
+
         def safety_score(item: tuple[Position, int]) -> float:
             pos, stones = item
             # Higher stones = safer
             # Fewer enemy neighbors = safer
             threat_level = 0
-            for n in pos.neighbors(config.board_size):
-                if board.get_owner(n) == player.opponent():
-                    threat_level += board.get_stones(n)
+            for n in neighbors[pos.row][pos.col]:
+                n_territory = board.get(n)
+                if n_territory.owner == opponent:
+                    threat_level += n_territory.stones
             return stones - threat_level * 0.5
 
         best = max(friendly_neighbors, key=safety_score)
@@ -6,13 +6,23 @@ This module explores improvements to MCTS by replacing random rollouts with:
 3. MCTSHeuristicRollout: Uses heuristic-guided rollouts (greedy moves)
 
 The goal is to replace random rollout bias with strategic signal.
+
+Shared tuning knobs:
+- num_workers: >1 runs search work across worker processes; 1 keeps
+  everything in-process
+- leaf_batch: candidates selected per UCB step, spread out by virtual loss
+  and evaluated together; with num_workers > 1 each batch runs across the
+  worker pool (leaf parallelization) instead of sharding the budget by root
 """
 
 import math
 import time
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from random import Random
 
+import numpy as np
+
 from ..types import (
     Owner,
     Position,
@@ -20,6 +30,7 @@ from ..types import (
     SetupAction,
     PlayerTurnActions,
     TerritoryAction,
+    TerritoryBoard,
     TurnActions,
     MoveType,
     calculate_half,
@@ -27,16 +38,22 @@ from ..types import (
     create_simple_move_action,
 )
 from ..config import GameConfig
-from ..engine import apply_turn
+from ..engine import apply_turn, determine_winner
+from ..resolution import resolve_turn
 from ..evaluation import (
     evaluate_board,
     BALANCED_WEIGHTS,
     EvaluationWeights,
 )
-from .common import center_aware_setup
+from .common import (
+    center_aware_setup,
+    flat_neighbor_table,
+    neighbor_table,
+    weighted_destination,
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class CandidateStats:
     """Statistics for a candidate move."""
     actions: PlayerTurnActions
@@ -65,6 +82,109 @@ class CandidateStats:
         return exploitation + exploration
 
 
+class _UCBArrays:
+    """Candidate stats mirrored into arrays so UCB1 selection is one argmax.
+
+    Win rates and 1/sqrt(simulations) are updated incrementally for the one
+    candidate simulated, so each selection costs a single log + sqrt plus a
+    vectorized pass, instead of a ucb_value() call per candidate.
+    """
+
+    def __init__(self, candidates: list[CandidateStats]):
+        wins = np.array([c.wins for c in candidates], dtype=float)
+        self.sims = np.array([c.simulations for c in candidates], dtype=float)
+        visited = self.sims > 0
+        self.wins = wins
+        self.win_rates = np.divide(wins, self.sims, out=np.zeros_like(wins), where=visited)
+        self.inv_sqrt_sims = np.divide(
+            1.0, np.sqrt(self.sims), out=np.full_like(self.sims, np.inf), where=visited
+        )
+        self.num_unexplored = int(np.count_nonzero(~visited))
+
+    def select(self, total_sims: int, exploration_c: float) -> int:
+        """Index of the candidate with the highest UCB1 value (unexplored first)."""
+        if self.num_unexplored:
+            return int(np.argmax(self.inv_sqrt_sims))  # first inf
+        exploration_scale = exploration_c * math.sqrt(math.log(total_sims + 1))
+        return int((self.win_rates + exploration_scale * self.inv_sqrt_sims).argmax())
+
+    def update(self, i: int, reward: float) -> None:
+        """Record one simulation of candidate i."""
+        if self.sims[i] == 0:
+            self.num_unexplored -= 1
+        self.sims[i] += 1
+        self.wins[i] += reward
+        self.win_rates[i] = self.wins[i] / self.sims[i]
+        self.inv_sqrt_sims[i] = 1.0 / math.sqrt(self.sims[i])
+
+    def select_batch(self, total_sims: int, exploration_c: float, size: int) -> list[int]:
+        """Indices of the next `size` candidates to simulate.
+
+        Every pick but the last takes a virtual loss so the following picks
+        favour other candidates; the losses are reverted before returning,
+        leaving the stats for update() to record the real results.
+        """
+        picks = []
+        for k in range(size):
+            i = self.select(total_sims + k, exploration_c)
+            picks.append(i)
+            if k < size - 1:
+                self.add_virtual_loss(i)
+        for i in picks[:-1]:
+            self.revert_virtual_loss(i)
+        return picks
+
+    def add_virtual_loss(self, i: int) -> None:
+        """Count a pending simulation of candidate i as a loss.
+
+        Lets several selections be made before any result is in, without
+        all of them landing on the same candidate.
+        """
+        self.update(i, 0.0)
+
+    def revert_virtual_loss(self, i: int) -> None:
+        """Undo add_virtual_loss once the real result is known."""
+        self.sims[i] -= 1
+        if self.sims[i] == 0:
+            self.num_unexplored += 1
+            self.win_rates[i] = 0.0
+            self.inv_sqrt_sims[i] = math.inf
+        else:
+            self.win_rates[i] = self.wins[i] / self.sims[i]
+            self.inv_sqrt_sims[i] = 1.0 / math.sqrt(self.sims[i])
+
+    def has_clear_leader(self) -> bool:
+        """Whether the search can stop early, read straight from the arrays.
+
+        Same rule as _should_terminate_early: the most-simulated candidate
+        (earliest on ties) has 3x+ the runner-up's simulations and a win rate
+        more than 15 points higher.
+        """
+        if len(self.sims) < 2:
+            return True
+
+        best = int(self.sims.argmax())
+        best_sims = self.sims[best]
+        self.sims[best] = -1.0
+        second = int(self.sims.argmax())
+        self.sims[best] = best_sims
+        second_sims = self.sims[second]
+
+        if best_sims < 10 or second_sims < 5:
+            return False
+
+        return bool(
+            best_sims >= second_sims * 3
+            and self.win_rates[best] > self.win_rates[second] + 0.15
+        )
+
+    def write_back(self, candidates: list[CandidateStats]) -> None:
+        """Copy simulation counts and wins back into the candidates."""
+        for c, sims, wins in zip(candidates, self.sims.tolist(), self.wins.tolist()):
+            c.simulations = int(sims)
+            c.wins = wins
+
+
 class MCTSHeuristicEval:
     """MCTS with heuristic evaluation at leaf nodes (depth-0 minimax).
 
@@ -87,6 +207,8 @@ class MCTSHeuristicEval:
         exploration_c: float = 1.414,
         weights: EvaluationWeights | None = None,
         verbose: bool = False,
+        num_workers: int = 1,
+        leaf_batch: int = 1,
     ):
         self._initial_seed = seed
         self._rng = Random(seed)
@@ -95,7 +217,13 @@ class MCTSHeuristicEval:
         self._exploration_c = exploration_c
         self._weights = weights or BALANCED_WEIGHTS
         self._verbose = verbose
+        self._num_workers = num_workers
+        self._leaf_batch = max(1, leaf_batch)
+        self._executor: ProcessPoolExecutor | None = None
+        self._eval_cache: dict[PlayerTurnActions, float] = {}
+        self._board_scores: dict[tuple[TerritoryBoard, int], float] = {}
         self._last_search_time = 0.0
+        self._all_stay_cache: dict[tuple[Owner, tuple[Position, ...]], PlayerTurnActions] = {}
 
     @property
     def name(self) -> str:
@@ -103,6 +231,13 @@ class MCTSHeuristicEval:
 
     def reset(self) -> None:
         self._rng = Random(self._initial_seed)
+        self._all_stay_cache.clear()
+
+    def close(self) -> None:
+        """Shut down the worker pool used for parallel search, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def choose_setup(
         self,
@@ -120,6 +255,10 @@ class MCTSHeuristicEval:
         config: GameConfig,
     ) -> PlayerTurnActions:
         """Choose actions using MCTS with heuristic evaluation."""
+        # Nothing to search once the game is over
+        if state.is_complete:
+            return self._all_stay(state, player)
+
         start_time = time.time()
 
         candidates = self._generate_candidates(state, player, config)
@@ -134,42 +273,90 @@ class MCTSHeuristicEval:
             print(f"  MCTSHeuristic: {len(candidates)} candidates, {self._num_simulations} sims")
 
         # Run simulations using UCB1
-        total_sims = 0
-        for _ in range(self._num_simulations):
-            # Select candidate with highest UCB value
-            best_candidate = max(
-                candidates,
-                key=lambda c: c.ucb_value(total_sims + 1, self._exploration_c)
+        if self._num_workers > 1 and self._leaf_batch == 1:
+            total_sims = _run_root_parallel(self, candidates, state, player, config)
+        else:
+            total_sims = self._run_simulations(
+                candidates, state, player, config, self._num_simulations
             )
 
-            # Run simulation with heuristic evaluation
-            result = self._simulate_with_eval(
-                state, player, best_candidate.actions, config
-            )
+        self._last_search_time = time.time() - start_time
 
-            # Update statistics (convert evaluation to win/loss)
-            best_candidate.simulations += 1
-            best_candidate.total_value += result
-            if result > 0.5:
-                best_candidate.wins += 1
-            elif result == 0.5:
-                best_candidate.wins += 0.5
+        # Return candidate with highest win rate
+        best = max(candidates, key=lambda c: c.win_rate)
+
+        if self._verbose:
+            print(f"  MCTSHeuristic: {total_sims} sims in {self._last_search_time:.2f}s, best={best.win_rate:.1%}")
+
+        return best.actions
+
+    def _run_simulations(
+        self,
+        candidates: list[CandidateStats],
+        state: GameState,
+        player: Owner,
+        config: GameConfig,
+        num_simulations: int,
+        early_termination: bool = True,
+    ) -> int:
+        """Run UCB1-guided simulations, updating candidate stats in place.
+
+        Each step selects a batch of leaf_batch candidates (the last batch is
+        trimmed to the remaining budget).
 
-            total_sims += 1
+        Returns:
+            Number of simulations actually run.
+        """
+        # Cached leaf values are only valid for this search's root state
+        self._eval_cache.clear()
+        self._board_scores.clear()
+
+        ucb = _UCBArrays(candidates)
+        # The opponent's greedy reply to the root is the same for every leaf
+        opp_actions = self._greedy_actions(state.board, player.opponent(), config)
+        total_sims = 0
+        while total_sims < num_simulations:
+            # Select candidates with highest UCB value
+            batch = min(self._leaf_batch, num_simulations - total_sims)
+            picks = ucb.select_batch(total_sims, self._exploration_c, batch)
+
+            # Run simulations with heuristic evaluation
+            results = _run_leaf_batch(
+                self, "_simulate_with_eval", state, player,
+                [candidates[i].actions for i in picks], opp_actions, config,
+            )
 
-            # Early termination
-            if total_sims >= 30 and self._should_terminate_early(candidates):
+            # Update statistics (convert evaluation to win/loss)
+            for best_i, result in zip(picks, results):
+                best_candidate = candidates[best_i]
+                best_candidate.simulations += 1
+                best_candidate.total_value += result
+                if result > 0.5:
+                    reward = 1.0
+                elif result == 0.5:
+                    reward = 0.5
+                else:
+                    reward = 0.0
+                best_candidate.wins += reward
+                ucb.update(best_i, reward)
+
+            total_sims += batch
+
+            if (early_termination and total_sims >= 30
+                    and self._should_terminate_early(candidates)):
                 break
 
-        self._last_search_time = time.time() - start_time
+        return total_sims
 
-        if self._verbose:
-            best = max(candidates, key=lambda c: c.win_rate)
-            print(f"  MCTSHeuristic: {total_sims} sims in {self._last_search_time:.2f}s, best={best.win_rate:.1%}")
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Worker pool for parallel search, created on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._num_workers)
+        return self._executor
 
-        # Return candidate with highest win rate
-        best = max(candidates, key=lambda c: c.win_rate)
-        return best.actions
+    def _shard_kwargs(self) -> dict:
+        """Constructor arguments for this agent's root-parallel workers."""
+        return {"exploration_c": self._exploration_c, "weights": self._weights}
 
     def get_stats(self) -> dict:
         """Get statistics from last search."""
@@ -183,9 +370,14 @@ class MCTSHeuristicEval:
         if len(candidates) < 2:
             return True
 
-        sorted_cands = sorted(candidates, key=lambda c: c.simulations, reverse=True)
-        best = sorted_cands[0]
-        second = sorted_cands[1]
+        # Two most-simulated candidates (earliest first on ties), one pass
+        best = second = None
+        for c in candidates:
+            if best is None or c.simulations > best.simulations:
+                second = best
+                best = c
+            elif second is None or c.simulations > second.simulations:
+                second = c
 
         if best.simulations < 10 or second.simulations < 5:
             return False
@@ -204,7 +396,7 @@ class MCTSHeuristicEval:
     ) -> list[CandidateStats]:
         """Generate diverse candidate moves."""
         candidates: list[CandidateStats] = []
-        owned = list(state.board.positions_owned_by(player))
+        owned = tuple(state.board.positions_owned_by(player))
 
         if not owned:
             return []
@@ -213,39 +405,47 @@ class MCTSHeuristicEval:
         board = state.board
 
         # Candidate 1: All stay (defensive baseline)
-        all_stay = self._all_stay(state, player)
+        all_stay = self._all_stay_for(player, owned)
+
+        # Every other candidate starts from "all stay" and changes one slot
+        grow_template = list(all_stay.actions)
         candidates.append(CandidateStats(actions=all_stay))
+        seen: set[PlayerTurnActions] = {all_stay}
 
         # Generate targeted candidates for each territory
-        for pos in owned:
+        neighbor_lists = neighbor_table(config.board_size)
+        for i, pos in enumerate(owned):
             territory = board.get(pos)
             stones = territory.stones
             half_stones = calculate_half(stones)
-            neighbors = list(pos.neighbors(config.board_size))
 
-            for neighbor in neighbors:
-                neighbor_owner = board.get_owner(neighbor)
-                neighbor_stones = board.get_stones(neighbor) if neighbor_owner != Owner.NEUTRAL else 0
+            for neighbor in neighbor_lists[pos.row][pos.col]:
+                neighbor_owner = board.get(neighbor).owner
 
                 # SEND_HALF expansion/attack
                 cand = self._single_action_candidate(
-                    state, player, pos, neighbor, half_stones, config
+                    player, grow_template, i,
+                    create_simple_move_action(pos, neighbor, half_stones),
                 )
-                if cand not in [c.actions for c in candidates]:
+                if cand not in seen:
+                    seen.add(cand)
                     candidates.append(CandidateStats(actions=cand))
 
                 # SEND_ALL for strong attacks or full expansion
                 if neighbor_owner == opponent or neighbor_owner == Owner.NEUTRAL:
                     cand = self._single_action_candidate(
-                        state, player, pos, neighbor, stones, config
+                        player, grow_template, i,
+                        create_simple_move_action(pos, neighbor, stones),
                     )
-                    if cand not in [c.actions for c in candidates]:
+                    if cand not in seen:
+                        seen.add(cand)
                         candidates.append(CandidateStats(actions=cand))
 
         # Add random candidates to fill remaining slots
         while len(candidates) < self._num_candidates:
-            random_cand = self._random_candidate(state, player, config)
-            if random_cand not in [c.actions for c in candidates]:
+            random_cand = self._random_candidate(state, player, owned, config)
+            if random_cand not in seen:
+                seen.add(random_cand)
                 candidates.append(CandidateStats(actions=random_cand))
             else:
                 break
@@ -262,45 +462,49 @@ class MCTSHeuristicEval:
 
     def _single_action_candidate(
         self,
-        state: GameState,
         player: Owner,
-        source: Position,
-        dest: Position,
-        stones: int,
-        config: GameConfig,
+        grow_template: list[TerritoryAction],
+        index: int,
+        action: TerritoryAction,
     ) -> PlayerTurnActions:
-        """Create candidate where one territory moves, others stay."""
-        actions = []
-        for pos in state.board.positions_owned_by(player):
-            if pos == source:
-                actions.append(create_simple_move_action(pos, dest, stones))
-            else:
-                actions.append(create_grow_action(pos))
+        """Create candidate where one territory moves, others stay.
+
+        Args:
+            player: Player the candidate is for
+            grow_template: Grow actions for every owned territory, in order
+            index: Slot of the moving territory in grow_template
+            action: The move replacing that slot
+        """
+        actions = grow_template.copy()
+        actions[index] = action
         return PlayerTurnActions(player=player, actions=tuple(actions))
 
     def _random_candidate(
         self,
         state: GameState,
         player: Owner,
+        owned: tuple[Position, ...],
         config: GameConfig,
     ) -> PlayerTurnActions:
         """Generate a random candidate."""
         actions = []
+        neighbor_lists = neighbor_table(config.board_size)
 
-        for pos in state.board.positions_owned_by(player):
+        for pos in owned:
             territory = state.board.get(pos)
             stones = territory.stones
-            neighbors = list(pos.neighbors(config.board_size))
+            neighbors = neighbor_lists[pos.row][pos.col]
 
             choice = self._rng.random()
-            if choice < 0.4 or not neighbors:
+            dest = None
+            if choice >= 0.4 and neighbors:
+                # SEND_HALF (preferred) below 0.75, SEND_ALL above
+                amount = calculate_half(stones) if choice < 0.75 else stones
+                dest = weighted_destination(state.board, player, neighbors, amount, self._rng)
+            if dest is None:
                 actions.append(create_grow_action(pos))
-            elif choice < 0.75:
-                dest = self._rng.choice(neighbors)
-                actions.append(create_simple_move_action(pos, dest, calculate_half(stones)))
             else:
-                dest = self._rng.choice(neighbors)
-                actions.append(create_simple_move_action(pos, dest, stones))
+                actions.append(create_simple_move_action(pos, dest, amount))
 
         return PlayerTurnActions(player=player, actions=tuple(actions))
 
@@ -309,76 +513,109 @@ class MCTSHeuristicEval:
         state: GameState,
         player: Owner,
         candidate: PlayerTurnActions,
+        opp_actions: PlayerTurnActions,
         config: GameConfig,
     ) -> float:
         """Simulate one step with candidate, then evaluate board heuristically.
 
         Returns normalized evaluation: 1.0 = win, 0.5 = draw, 0.0 = loss
-        """
-        opponent = player.opponent()
 
-        # Apply candidate move with greedy opponent response
-        if not state.is_complete:
-            opp_actions = self._greedy_actions(state, opponent, config)
+        opp_actions is the opponent's greedy response to the root state,
+        computed once per search by _run_simulations. The root is never a
+        finished game (choose_actions returns before searching one).
 
-            if player == Owner.PLAYER_1:
-                turn_actions = TurnActions(
-                    player1_actions=candidate,
-                    player2_actions=opp_actions,
-                    turn_number=state.current_turn + 1,
-                )
-            else:
-                turn_actions = TurnActions(
-                    player1_actions=opp_actions,
-                    player2_actions=candidate,
-                    turn_number=state.current_turn + 1,
-                )
+        When the turn cannot involve any dice (see _turn_is_deterministic)
+        the value is cached per candidate for the rest of the search.
+        """
+        cached = self._eval_cache.get(candidate)
+        if cached is not None:
+            return cached
 
-            sim_rng = Random(self._rng.randint(0, 2**31 - 1))
-            current_state = apply_turn(state, turn_actions, config, sim_rng)
+        # Apply candidate move with greedy opponent response
+        if player == Owner.PLAYER_1:
+            turn_actions = TurnActions(
+                player1_actions=candidate,
+                player2_actions=opp_actions,
+                turn_number=state.current_turn + 1,
+            )
         else:
-            current_state = state
+            turn_actions = TurnActions(
+                player1_actions=opp_actions,
+                player2_actions=candidate,
+                turn_number=state.current_turn + 1,
+            )
+
+        current_state = apply_turn(state, turn_actions, config, self._rng)
+        deterministic = _turn_is_deterministic(state.board, turn_actions, config)
 
         # Evaluate the resulting board
         if current_state.is_complete:
             # Game ended - return actual result
             if current_state.winner == player:
-                return 1.0
+                result = 1.0
             elif current_state.winner is None:
-                return 0.5
+                result = 0.5
             else:
-                return 0.0
+                result = 0.0
         else:
             # Evaluate board heuristically
-            eval_score = evaluate_board(
-                current_state.board, player, config,
-                current_state.current_turn, self._weights
+            eval_score = self._score_board(
+                current_state.board, player, config, current_state.current_turn
             )
             # Normalize to [0, 1] range (eval_score ranges roughly [-1, 1])
-            return (eval_score + 1.0) / 2.0
+            result = (eval_score + 1.0) / 2.0
+
+        if deterministic:
+            self._eval_cache[candidate] = result
+        return result
+
+    def _score_board(
+        self,
+        board: TerritoryBoard,
+        player: Owner,
+        config: GameConfig,
+        turn: int,
+    ) -> float:
+        """evaluate_board, memoized per resulting board within a search.
+
+        Different candidates, or different dice on the same one, often
+        reach the same board; the player and weights are fixed per search.
+        """
+        key = (board, turn)
+        score = self._board_scores.get(key)
+        if score is None:
+            score = evaluate_board(board, player, config, turn, self._weights)
+            self._board_scores[key] = score
+        return score
 
     def _greedy_actions(
         self,
-        state: GameState,
+        board: TerritoryBoard,
         player: Owner,
         config: GameConfig,
     ) -> PlayerTurnActions:
         """Generate actions using greedy heuristic strategy."""
         actions = []
         opponent = player.opponent()
-        board = state.board
+        board_size = config.board_size
+
+        cells = board.territories()
+        owners = [t.owner for t in cells]
+        stones = [t.stones for t in cells]
+        neighbor_indices = flat_neighbor_table(board_size)
+        open_counts: dict[int, int] = {}
 
         for pos in board.positions_owned_by(player):
-            territory = board.get(pos)
-            stones = territory.stones
-            neighbors = list(pos.neighbors(config.board_size))
+            i = pos.row * board_size + pos.col
+            neighbors = neighbor_indices[i]
 
             if not neighbors:
                 actions.append(create_grow_action(pos))
                 continue
 
             action = self._choose_greedy_action(
-                pos, stones, neighbors, board, player, opponent, config
+                pos, stones[i], neighbors, owners, stones, opponent,
+                neighbor_indices, open_counts,
             )
             actions.append(action)
 
@@ -388,58 +625,65 @@ class MCTSHeuristicEval:
         self,
         pos: Position,
         stones: int,
-        neighbors: list[Position],
-        board,
-        player: Owner,
+        neighbors: tuple[tuple[int, Position], ...],
+        owners: list[Owner],
+        cell_stones: list[int],
         opponent: Owner,
-        config: GameConfig,
+        neighbor_indices: tuple[tuple[tuple[int, Position], ...], ...],
+        open_counts: dict[int, int],
     ) -> TerritoryAction:
-        """Choose greedy action based on simple scoring."""
+        """Choose greedy action based on simple scoring.
+
+        Options score 200 + 30 per open neighbor for expanding into a neutral,
+        100 for a SEND_HALF attack that wins, 95 for a SEND_ALL one, and at
+        most 50 for staying. The bands never overlap, so the options are
+        checked in that order and the first (in neighbor order) of the best
+        band is returned, as a stable sort by score would.
+
+        Args:
+            neighbors: (flat index, Position) pairs adjacent to pos
+            owners: Flat row-major owner of every cell
+            cell_stones: Flat row-major stone count of every cell
+            neighbor_indices: flat_neighbor_table for the board size
+            open_counts: Neutral-neighbor count per neutral cell, filled in
+                lazily and shared by every territory of this board
+        """
         half_stones = calculate_half(stones)
 
-        # Categorize neighbors
+        # Expand into neutral (prefer SEND_HALF), favouring open space
+        best_neutral = None
+        best_open = -1
         enemy_neighbors = []
-        neutral_neighbors = []
-        friendly_neighbors = []
-
-        for n in neighbors:
-            owner = board.get_owner(n)
-            if owner == opponent:
-                enemy_neighbors.append((n, board.get_stones(n)))
-            elif owner == Owner.NEUTRAL:
-                neutral_neighbors.append(n)
-            else:
-                friendly_neighbors.append((n, board.get_stones(n)))
-
-        # Score all valid options
-        options: list[tuple[float, TerritoryAction]] = []
+        for j, n in neighbors:
+            owner = owners[j]
+            if owner == Owner.NEUTRAL:
+                open_count = open_counts.get(j)
+                if open_count is None:
+                    open_count = open_counts[j] = sum(
+                        1 for k, _ in neighbor_indices[j]
+                        if owners[k] == Owner.NEUTRAL
+                    )
+                if open_count > best_open:
+                    best_neutral = n
+                    best_open = open_count
+            elif owner == opponent:
+                enemy_neighbors.append((n, cell_stones[j]))
 
-        # STAY/GROW (baseline)
-        options.append((10.0, create_grow_action(pos)))
+        if best_neutral is not None:
+            return create_simple_move_action(pos, best_neutral, half_stones)
 
         # Attack enemy if stronger
+        full_attack = None
         for enemy_pos, enemy_stones in enemy_neighbors:
             if half_stones > enemy_stones:
-                options.append((100.0, create_simple_move_action(pos, enemy_pos, half_stones)))
-            elif stones > enemy_stones:
-                options.append((95.0, create_simple_move_action(pos, enemy_pos, stones)))
-
-        # Expand into neutral (prefer SEND_HALF)
-        for neutral_pos in neutral_neighbors:
-            neutral_neighbors_count = sum(
-                1 for nn in neutral_pos.neighbors(config.board_size)
-                if board.get_owner(nn) == Owner.NEUTRAL
-            )
-            score = 200.0 + neutral_neighbors_count * 30.0
-            options.append((score, create_simple_move_action(pos, neutral_pos, half_stones)))
+                return create_simple_move_action(pos, enemy_pos, half_stones)
+            if full_attack is None and stones > enemy_stones:
+                full_attack = enemy_pos
+        if full_attack is not None:
+            return create_simple_move_action(pos, full_attack, stones)
 
-        # Defend by growing if threatened
-        if enemy_neighbors and stones < 4:
-            options.append((50.0, create_grow_action(pos)))
-
-        # Pick highest scored option
-        options.sort(key=lambda x: x[0], reverse=True)
-        return options[0][1]
+        # STAY/GROW (baseline, and the defence when threatened)
+        return create_grow_action(pos)
 
     def _all_stay(
         self,
@@ -447,11 +691,25 @@ class MCTSHeuristicEval:
         player: Owner,
     ) -> PlayerTurnActions:
         """Create all-stay actions."""
-        actions = [
-            create_grow_action(pos)
-            for pos in state.board.positions_owned_by(player)
-        ]
-        return PlayerTurnActions(player=player, actions=tuple(actions))
+        return self._all_stay_for(
+            player, tuple(state.board.positions_owned_by(player))
+        )
+
+    def _all_stay_for(
+        self,
+        player: Owner,
+        owned: tuple[Position, ...],
+    ) -> PlayerTurnActions:
+        """All-stay actions for the given territories, memoized per agent."""
+        key = (player, owned)
+        all_stay = self._all_stay_cache.get(key)
+        if all_stay is None:
+            all_stay = PlayerTurnActions(
+                player=player,
+                actions=tuple(create_grow_action(pos) for pos in owned),
+            )
+            self._all_stay_cache[key] = all_stay
+        return all_stay
 
 
 class MCTSMinimaxEval:
@@ -470,6 +728,8 @@ class MCTSMinimaxEval:
         exploration_c: float = 1.414,
         weights: EvaluationWeights | None = None,
         verbose: bool = False,
+        num_workers: int = 1,
+        leaf_batch: int = 1,
     ):
         self._initial_seed = seed
         self._rng = Random(seed)
@@ -478,7 +738,13 @@ class MCTSMinimaxEval:
         self._exploration_c = exploration_c
         self._weights = weights or BALANCED_WEIGHTS
         self._verbose = verbose
+        self._num_workers = num_workers
+        self._leaf_batch = max(1, leaf_batch)
+        self._executor: ProcessPoolExecutor | None = None
+        self._eval_cache: dict[PlayerTurnActions, float] = {}
+        self._board_scores: dict[tuple[TerritoryBoard, int], float] = {}
         self._last_search_time = 0.0
+        self._all_stay_cache: dict[tuple[Owner, tuple[Position, ...]], PlayerTurnActions] = {}
 
     @property
     def name(self) -> str:
@@ -486,6 +752,13 @@ class MCTSMinimaxEval:
 
     def reset(self) -> None:
         self._rng = Random(self._initial_seed)
+        self._all_stay_cache.clear()
+
+    def close(self) -> None:
+        """Shut down the worker pool used for parallel search, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def choose_setup(
         self,
@@ -503,6 +776,10 @@ class MCTSMinimaxEval:
         config: GameConfig,
     ) -> PlayerTurnActions:
         """Choose actions using MCTS with minimax depth-1 evaluation."""
+        # Nothing to search once the game is over
+        if state.is_complete:
+            return self._all_stay(state, player)
+
         start_time = time.time()
 
         candidates = self._generate_candidates(state, player, config)
@@ -517,39 +794,89 @@ class MCTSMinimaxEval:
             print(f"  MCTSMinimax: {len(candidates)} candidates, {self._num_simulations} sims")
 
         # Run simulations using UCB1
-        total_sims = 0
-        for _ in range(self._num_simulations):
-            best_candidate = max(
-                candidates,
-                key=lambda c: c.ucb_value(total_sims + 1, self._exploration_c)
+        if self._num_workers > 1 and self._leaf_batch == 1:
+            total_sims = _run_root_parallel(self, candidates, state, player, config)
+        else:
+            total_sims = self._run_simulations(
+                candidates, state, player, config, self._num_simulations
             )
 
+        self._last_search_time = time.time() - start_time
+
+        # Return candidate with highest win rate
+        best = max(candidates, key=lambda c: c.win_rate)
+
+        if self._verbose:
+            print(f"  MCTSMinimax: {total_sims} sims in {self._last_search_time:.2f}s, best={best.win_rate:.1%}")
+
+        return best.actions
+
+    def _run_simulations(
+        self,
+        candidates: list[CandidateStats],
+        state: GameState,
+        player: Owner,
+        config: GameConfig,
+        num_simulations: int,
+        early_termination: bool = True,
+    ) -> int:
+        """Run UCB1-guided simulations, updating candidate stats in place.
+
+        Each step selects a batch of leaf_batch candidates (the last batch is
+        trimmed to the remaining budget).
+
+        Returns:
+            Number of simulations actually run.
+        """
+        # Cached leaf values are only valid for this search's root state
+        self._eval_cache.clear()
+        self._board_scores.clear()
+
+        ucb = _UCBArrays(candidates)
+        # The opponent's greedy reply to the root is the same for every leaf
+        opp_actions = self._greedy_actions(state.board, player.opponent(), config)
+        total_sims = 0
+        while total_sims < num_simulations:
+            batch = min(self._leaf_batch, num_simulations - total_sims)
+            picks = ucb.select_batch(total_sims, self._exploration_c, batch)
+
             # Evaluate with depth-1 minimax
-            result = self._eval_with_depth1_minimax(
-                state, player, best_candidate.actions, config
+            results = _run_leaf_batch(
+                self, "_eval_with_depth1_minimax", state, player,
+                [candidates[i].actions for i in picks], opp_actions, config,
             )
 
             # Update statistics
-            best_candidate.simulations += 1
-            best_candidate.total_value += result
-            if result > 0.5:
-                best_candidate.wins += 1
-            elif result == 0.5:
-                best_candidate.wins += 0.5
-
-            total_sims += 1
-
-            if total_sims >= 30 and self._should_terminate_early(candidates):
+            for best_i, result in zip(picks, results):
+                best_candidate = candidates[best_i]
+                best_candidate.simulations += 1
+                best_candidate.total_value += result
+                if result > 0.5:
+                    reward = 1.0
+                elif result == 0.5:
+                    reward = 0.5
+                else:
+                    reward = 0.0
+                best_candidate.wins += reward
+                ucb.update(best_i, reward)
+
+            total_sims += batch
+
+            if (early_termination and total_sims >= 30
+                    and self._should_terminate_early(candidates)):
                 break
 
-        self._last_search_time = time.time() - start_time
+        return total_sims
 
-        if self._verbose:
-            best = max(candidates, key=lambda c: c.win_rate)
-            print(f"  MCTSMinimax: {total_sims} sims in {self._last_search_time:.2f}s, best={best.win_rate:.1%}")
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Worker pool for parallel search, created on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._num_workers)
+        return self._executor
 
-        best = max(candidates, key=lambda c: c.win_rate)
-        return best.actions
+    def _shard_kwargs(self) -> dict:
+        """Constructor arguments for this agent's root-parallel workers."""
+        return {"exploration_c": self._exploration_c, "weights": self._weights}
 
     def get_stats(self) -> dict:
         """Get statistics from last search."""
@@ -563,9 +890,14 @@ class MCTSMinimaxEval:
         if len(candidates) < 2:
             return True
 
-        sorted_cands = sorted(candidates, key=lambda c: c.simulations, reverse=True)
-        best = sorted_cands[0]
-        second = sorted_cands[1]
+        # Two most-simulated candidates (earliest first on ties), one pass
+        best = second = None
+        for c in candidates:
+            if best is None or c.simulations > best.simulations:
+                second = best
+                best = c
+            elif second is None or c.simulations > second.simulations:
+                second = c
 
         if best.simulations < 10 or second.simulations < 5:
             return False
@@ -584,7 +916,7 @@ class MCTSMinimaxEval:
     ) -> list[CandidateStats]:
         """Generate diverse candidate moves."""
         candidates: list[CandidateStats] = []
-        owned = list(state.board.positions_owned_by(player))
+        owned = tuple(state.board.positions_owned_by(player))
 
         if not owned:
             return []
@@ -592,39 +924,53 @@ class MCTSMinimaxEval:
         opponent = player.opponent()
         board = state.board
 
-        all_stay = self._all_stay(state, player)
+        # Candidate 1: All stay (defensive baseline)
+        all_stay = self._all_stay_for(player, owned)
+
+        # Every other candidate starts from "all stay" and changes one slot
+        grow_template = list(all_stay.actions)
         candidates.append(CandidateStats(actions=all_stay))
+        seen: set[PlayerTurnActions] = {all_stay}
 
-        for pos in owned:
+        # Generate targeted candidates for each territory
+        neighbor_lists = neighbor_table(config.board_size)
+        for i, pos in enumerate(owned):
             territory = board.get(pos)
             stones = territory.stones
             half_stones = calculate_half(stones)
-            neighbors = list(pos.neighbors(config.board_size))
 
-            for neighbor in neighbors:
-                neighbor_owner = board.get_owner(neighbor)
-                neighbor_stones = board.get_stones(neighbor) if neighbor_owner != Owner.NEUTRAL else 0
+            for neighbor in neighbor_lists[pos.row][pos.col]:
+                neighbor_owner = board.get(neighbor).owner
 
+                # SEND_HALF expansion/attack
                 cand = self._single_action_candidate(
-                    state, player, pos, neighbor, half_stones, config
+                    player, grow_template, i,
+                    create_simple_move_action(pos, neighbor, half_stones),
                 )
-                if cand not in [c.actions for c in candidates]:
+                if cand not in seen:
+                    seen.add(cand)
                     candidates.append(CandidateStats(actions=cand))
 
+                # SEND_ALL for strong attacks or full expansion
                 if neighbor_owner == opponent or neighbor_owner == Owner.NEUTRAL:
                     cand = self._single_action_candidate(
-                        state, player, pos, neighbor, stones, config
+                        player, grow_template, i,
+                        create_simple_move_action(pos, neighbor, stones),
                     )
-                    if cand not in [c.actions for c in candidates]:
+                    if cand not in seen:
+                        seen.add(cand)
                         candidates.append(CandidateStats(actions=cand))
 
+        # Add random candidates to fill remaining slots
         while len(candidates) < self._num_candidates:
-            random_cand = self._random_candidate(state, player, config)
-            if random_cand not in [c.actions for c in candidates]:
+            random_cand = self._random_candidate(state, player, owned, config)
+            if random_cand not in seen:
+                seen.add(random_cand)
                 candidates.append(CandidateStats(actions=random_cand))
             else:
                 break
 
+        # Limit candidates
         if len(candidates) > self._num_candidates:
             heuristic_count = max(4, self._num_candidates // 2)
             keep = candidates[:heuristic_count]
@@ -636,45 +982,49 @@ class MCTSMinimaxEval:
 
     def _single_action_candidate(
         self,
-        state: GameState,
         player: Owner,
-        source: Position,
-        dest: Position,
-        stones: int,
-        config: GameConfig,
+        grow_template: list[TerritoryAction],
+        index: int,
+        action: TerritoryAction,
     ) -> PlayerTurnActions:
-        """Create candidate where one territory moves, others stay."""
-        actions = []
-        for pos in state.board.positions_owned_by(player):
-            if pos == source:
-                actions.append(create_simple_move_action(pos, dest, stones))
-            else:
-                actions.append(create_grow_action(pos))
+        """Create candidate where one territory moves, others stay.
+
+        Args:
+            player: Player the candidate is for
+            grow_template: Grow actions for every owned territory, in order
+            index: Slot of the moving territory in grow_template
+            action: The move replacing that slot
+        """
+        actions = grow_template.copy()
+        actions[index] = action
         return PlayerTurnActions(player=player, actions=tuple(actions))
 
     def _random_candidate(
         self,
         state: GameState,
         player: Owner,
+        owned: tuple[Position, ...],
         config: GameConfig,
     ) -> PlayerTurnActions:
         """Generate a random candidate."""
         actions = []
+        neighbor_lists = neighbor_table(config.board_size)
 
-        for pos in state.board.positions_owned_by(player):
+        for pos in owned:
             territory = state.board.get(pos)
             stones = territory.stones
-            neighbors = list(pos.neighbors(config.board_size))
+            neighbors = neighbor_lists[pos.row][pos.col]
 
             choice = self._rng.random()
-            if choice < 0.4 or not neighbors:
+            dest = None
+            if choice >= 0.4 and neighbors:
+                # SEND_HALF (preferred) below 0.75, SEND_ALL above
+                amount = calculate_half(stones) if choice < 0.75 else stones
+                dest = weighted_destination(state.board, player, neighbors, amount, self._rng)
+            if dest is None:
                 actions.append(create_grow_action(pos))
-            elif choice < 0.75:
-                dest = self._rng.choice(neighbors)
-                actions.append(create_simple_move_action(pos, dest, calculate_half(stones)))
             else:
-                dest = self._rng.choice(neighbors)
-                actions.append(create_simple_move_action(pos, dest, stones))
+                actions.append(create_simple_move_action(pos, dest, amount))
 
         return PlayerTurnActions(player=player, actions=tuple(actions))
 
@@ -683,76 +1033,106 @@ class MCTSMinimaxEval:
         state: GameState,
         player: Owner,
         candidate: PlayerTurnActions,
+        opp_actions: PlayerTurnActions,
         config: GameConfig,
     ) -> float:
         """Evaluate candidate using depth-1 minimax search.
 
-        We play our candidate move, then consider opponent's best response,
-        and evaluate the resulting position.
-        """
-        opponent = player.opponent()
-
-        # Apply our candidate move
-        if not state.is_complete:
-            # Get opponent's best greedy response
-            opp_actions = self._greedy_actions(state, opponent, config)
+        We play our candidate move against the opponent's best (greedy)
+        response, opp_actions, and evaluate the resulting position. The
+        root is never a finished game (choose_actions returns before
+        searching one).
 
-            if player == Owner.PLAYER_1:
-                turn_actions = TurnActions(
-                    player1_actions=candidate,
-                    player2_actions=opp_actions,
-                    turn_number=state.current_turn + 1,
-                )
-            else:
-                turn_actions = TurnActions(
-                    player1_actions=opp_actions,
-                    player2_actions=candidate,
-                    turn_number=state.current_turn + 1,
-                )
+        The greedy response and the fixed-seed turn make this deterministic
+        for a given root state, so each candidate is evaluated once per
+        search and then served from the cache.
+        """
+        cached = self._eval_cache.get(candidate)
+        if cached is not None:
+            return cached
 
-            eval_rng = Random(42)  # Fixed seed for consistency
-            current_state = apply_turn(state, turn_actions, config, eval_rng)
+        # Apply our candidate move (opp_actions is the greedy response)
+        if player == Owner.PLAYER_1:
+            turn_actions = TurnActions(
+                player1_actions=candidate,
+                player2_actions=opp_actions,
+                turn_number=state.current_turn + 1,
+            )
         else:
-            current_state = state
+            turn_actions = TurnActions(
+                player1_actions=opp_actions,
+                player2_actions=candidate,
+                turn_number=state.current_turn + 1,
+            )
+
+        eval_rng = Random(42)  # Fixed seed for consistency
+        current_state = apply_turn(state, turn_actions, config, eval_rng)
 
         # Check for game end
         if current_state.is_complete:
             if current_state.winner == player:
-                return 1.0
+                result = 1.0
             elif current_state.winner is None:
-                return 0.5
+                result = 0.5
             else:
-                return 0.0
+                result = 0.0
         else:
             # Evaluate the position
-            eval_score = evaluate_board(
-                current_state.board, player, config,
-                current_state.current_turn, self._weights
+            eval_score = self._score_board(
+                current_state.board, player, config, current_state.current_turn
             )
-            return (eval_score + 1.0) / 2.0
+            result = (eval_score + 1.0) / 2.0
+
+        self._eval_cache[candidate] = result
+        return result
+
+    def _score_board(
+        self,
+        board: TerritoryBoard,
+        player: Owner,
+        config: GameConfig,
+        turn: int,
+    ) -> float:
+        """evaluate_board, memoized per resulting board within a search.
+
+        Different candidates, or different dice on the same one, often
+        reach the same board; the player and weights are fixed per search.
+        """
+        key = (board, turn)
+        score = self._board_scores.get(key)
+        if score is None:
+            score = evaluate_board(board, player, config, turn, self._weights)
+            self._board_scores[key] = score
+        return score
 
     def _greedy_actions(
         self,
-        state: GameState,
+        board: TerritoryBoard,
         player: Owner,
         config: GameConfig,
     ) -> PlayerTurnActions:
         """Generate greedy actions."""
         actions = []
         opponent = player.opponent()
-        board = state.board
+        board_size = config.board_size
+
+        cells = board.territories()
+        owners = [t.owner for t in cells]
+        stones = [t.stones for t in cells]
+        neighbor_indices = flat_neighbor_table(board_size)
+        open_counts: dict[int, int] = {}
 
         for pos in board.positions_owned_by(player):
-            territory = board.get(pos)
-            stones = territory.stones
-            neighbors = list(pos.neighbors(config.board_size))
+            i = pos.row * board_size + pos.col
+            neighbors = neighbor_indices[i]
 
             if not neighbors:
                 actions.append(create_grow_action(pos))
                 continue
 
             action = self._choose_greedy_action(
-                pos, stones, neighbors, board, player, opponent, config
+                pos, stones[i], neighbors, owners, stones, opponent,
+                neighbor_indices, open_counts,
             )
             actions.append(action)
 
@@ -762,51 +1142,47 @@ class MCTSMinimaxEval:
         self,
         pos: Position,
         stones: int,
-        neighbors: list[Position],
-        board,
-        player: Owner,
+        neighbors: tuple[tuple[int, Position], ...],
+        owners: list[Owner],
+        cell_stones: list[int],
         opponent: Owner,
-        config: GameConfig,
+        neighbor_indices: tuple[tuple[tuple[int, Position], ...], ...],
+        open_counts: dict[int, int],
     ) -> TerritoryAction:
         """Choose greedy action."""
         half_stones = calculate_half(stones)
 
+        best_neutral = None
+        best_open = -1
         enemy_neighbors = []
-        neutral_neighbors = []
-        friendly_neighbors = []
-
-        for n in neighbors:
-            owner = board.get_owner(n)
-            if owner == opponent:
-                enemy_neighbors.append((n, board.get_stones(n)))
-            elif owner == Owner.NEUTRAL:
-                neutral_neighbors.append(n)
-            else:
-                friendly_neighbors.append((n, board.get_stones(n)))
-
-        options: list[tuple[float, TerritoryAction]] = []
+        for j, n in neighbors:
+            owner = owners[j]
+            if owner == Owner.NEUTRAL:
+                open_count = open_counts.get(j)
+                if open_count is None:
+                    open_count = open_counts[j] = sum(
+                        1 for k, _ in neighbor_indices[j]
+                        if owners[k] == Owner.NEUTRAL
+                    )
+                if open_count > best_open:
+                    best_neutral = n
+                    best_open = open_count
+            elif owner == opponent:
+                enemy_neighbors.append((n, cell_stones[j]))
 
-        options.append((10.0, create_grow_action(pos)))
+        if best_neutral is not None:
+            return create_simple_move_action(pos, best_neutral, half_stones)
 
+        full_attack = None
         for enemy_pos, enemy_stones in enemy_neighbors:
             if half_stones > enemy_stones:
-                options.append((100.0, create_simple_move_action(pos, enemy_pos, half_stones)))
-            elif stones > enemy_stones:
-                options.append((95.0, create_simple_move_action(pos, enemy_pos, stones)))
-
-        for neutral_pos in neutral_neighbors:
-            neutral_neighbors_count = sum(
-                1 for nn in neutral_pos.neighbors(config.board_size)
-                if board.get_owner(nn) == Owner.NEUTRAL
-            )
-            score = 200.0 + neutral_neighbors_count * 30.0
-            options.append((score, create_simple_move_action(pos, neutral_pos, half_stones)))
+                return create_simple_move_action(pos, enemy_pos, half_stones)
+            if full_attack is None and stones > enemy_stones:
+                full_attack = enemy_pos
+        if full_attack is not None:
+            return create_simple_move_action(pos, full_attack, stones)
 
-        if enemy_neighbors and stones < 4:
-            options.append((50.0, create_grow_action(pos)))
-
-        options.sort(key=lambda x: x[0], reverse=True)
-        return options[0][1]
+        return create_grow_action(pos)
 
     def _all_stay(
         self,
@@ -814,11 +1190,25 @@ class MCTSMinimaxEval:
         player: Owner,
     ) -> PlayerTurnActions:
         """Create all-stay actions."""
-        actions = [
-            create_grow_action(pos)
-            for pos in state.board.positions_owned_by(player)
-        ]
-        return PlayerTurnActions(player=player, actions=tuple(actions))
+        return self._all_stay_for(
+            player, tuple(state.board.positions_owned_by(player))
+        )
+
+    def _all_stay_for(
+        self,
+        player: Owner,
+        owned: tuple[Position, ...],
+    ) -> PlayerTurnActions:
+        """All-stay actions for the given territories, memoized per agent."""
+        key = (player, owned)
+        all_stay = self._all_stay_cache.get(key)
+        if all_stay is None:
+            all_stay = PlayerTurnActions(
+                player=player,
+                actions=tuple(create_grow_action(pos) for pos in owned),
+            )
+            self._all_stay_cache[key] = all_stay
+        return all_stay
 
 
 class MCTSHeuristicRollout:
@@ -827,6 +1217,10 @@ class MCTSHeuristicRollout:
     Similar to ImprovedMCTSAgent but uses pure greedy strategy
     for rollouts instead of weighted random. Tests whether
     fully deterministic heuristic rollouts help MCTS.
+
+    max_rollout_depth caps each rollout at that many turns, after which the
+    board is scored by territory count, as in ImprovedMCTSAgent (None =
+    play to the end).
     """
 
     def __init__(
@@ -836,6 +1230,9 @@ class MCTSHeuristicRollout:
         num_candidates: int = 15,
         exploration_c: float = 1.414,
         verbose: bool = False,
+        num_workers: int = 1,
+        leaf_batch: int = 1,
+        max_rollout_depth: int | None = None,
     ):
         self._initial_seed = seed
         self._rng = Random(seed)
@@ -843,7 +1240,14 @@ class MCTSHeuristicRollout:
         self._num_candidates = num_candidates
         self._exploration_c = exploration_c
         self._verbose = verbose
+        self._num_workers = num_workers
+        self._leaf_batch = max(1, leaf_batch)
+        self._max_rollout_depth = max_rollout_depth
+        self._executor: ProcessPoolExecutor | None = None
         self._last_search_time = 0.0
+        self._all_stay_cache: dict[tuple[Owner, tuple[Position, ...]], PlayerTurnActions] = {}
+        # Board after each candidate's dice-free first turn, per search
+        self._first_boards: dict[PlayerTurnActions, TerritoryBoard] = {}
 
     @property
     def name(self) -> str:
@@ -851,6 +1255,13 @@ class MCTSHeuristicRollout:
 
     def reset(self) -> None:
         self._rng = Random(self._initial_seed)
+        self._all_stay_cache.clear()
+
+    def close(self) -> None:
+        """Shut down the worker pool used for parallel search, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def choose_setup(
         self,
@@ -868,6 +1279,10 @@ class MCTSHeuristicRollout:
         config: GameConfig,
     ) -> PlayerTurnActions:
         """Choose actions using MCTS with pure heuristic rollouts."""
+        # Nothing to search once the game is over
+        if state.is_complete:
+            return self._all_stay(state, player)
+
         start_time = time.time()
 
         candidates = self._generate_candidates(state, player, config)
@@ -881,37 +1296,88 @@ class MCTSHeuristicRollout:
         if self._verbose:
             print(f"  MCTSHeuristicRollout: {len(candidates)} candidates, {self._num_simulations} sims")
 
-        total_sims = 0
-        for _ in range(self._num_simulations):
-            best_candidate = max(
-                candidates,
-                key=lambda c: c.ucb_value(total_sims + 1, self._exploration_c)
+        if self._num_workers > 1 and self._leaf_batch == 1:
+            total_sims = _run_root_parallel(self, candidates, state, player, config)
+        else:
+            total_sims = self._run_simulations(
+                candidates, state, player, config, self._num_simulations
             )
 
-            # Simulate game to completion using pure greedy rollout
-            result = self._simulate_game(
-                state, player, best_candidate.actions, config
+        self._last_search_time = time.time() - start_time
+
+        # Return candidate with highest win rate
+        best = max(candidates, key=lambda c: c.win_rate)
+
+        if self._verbose:
+            print(f"  MCTSHeuristicRollout: {total_sims} sims in {self._last_search_time:.2f}s, best={best.win_rate:.1%}")
+
+        return best.actions
+
+    def _run_simulations(
+        self,
+        candidates: list[CandidateStats],
+        state: GameState,
+        player: Owner,
+        config: GameConfig,
+        num_simulations: int,
+        early_termination: bool = True,
+    ) -> int:
+        """Run UCB1-guided simulations, updating candidate stats in place.
+
+        Each step selects a batch of leaf_batch candidates (the last batch is
+        trimmed to the remaining budget). Stats are kept only in the
+        _UCBArrays during the loop and written back to candidates at the end.
+
+        Returns:
+            Number of simulations actually run.
+        """
+        # Cached first turns are only valid for this search's root state
+        self._first_boards.clear()
+
+        ucb = _UCBArrays(candidates)
+        # The opponent's greedy reply to the root is the same for every leaf
+        opp_actions = self._greedy_actions(state.board, player.opponent(), config)
+        total_sims = 0
+        while total_sims < num_simulations:
+            batch = min(self._leaf_batch, num_simulations - total_sims)
+            picks = ucb.select_batch(total_sims, self._exploration_c, batch)
+
+            # Simulate games to completion using pure greedy rollout
+            results = _run_leaf_batch(
+                self, "_simulate_game", state, player,
+                [candidates[i].actions for i in picks], opp_actions, config,
             )
 
-            best_candidate.simulations += 1
-            if result == player:
-                best_candidate.wins += 1
-            elif result is None:
-                best_candidate.wins += 0.5
+            for best_i, result in zip(picks, results):
+                if result == player:
+                    reward = 1.0
+                elif result is None:
+                    reward = 0.5
+                else:
+                    reward = 0.0
+                ucb.update(best_i, reward)
 
-            total_sims += 1
+            total_sims += batch
 
-            if total_sims >= 30 and self._should_terminate_early(candidates):
+            if (early_termination and total_sims >= 30
+                    and ucb.has_clear_leader()):
                 break
 
-        self._last_search_time = time.time() - start_time
+        ucb.write_back(candidates)
+        return total_sims
 
-        if self._verbose:
-            best = max(candidates, key=lambda c: c.win_rate)
-            print(f"  MCTSHeuristicRollout: {total_sims} sims in {self._last_search_time:.2f}s, best={best.win_rate:.1%}")
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Worker pool for parallel search, created on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._num_workers)
+        return self._executor
 
-        best = max(candidates, key=lambda c: c.win_rate)
-        return best.actions
+    def _shard_kwargs(self) -> dict:
+        """Constructor arguments for this agent's root-parallel workers."""
+        return {
+            "exploration_c": self._exploration_c,
+            "max_rollout_depth": self._max_rollout_depth,
+        }
 
     def get_stats(self) -> dict:
         """Get statistics from last search."""
@@ -920,24 +1386,6 @@ class MCTSHeuristicRollout:
             "simulations": self._num_simulations,
         }
 
-    def _should_terminate_early(self, candidates: list[CandidateStats]) -> bool:
-        """Check if we can stop early."""
-        if len(candidates) < 2:
-            return True
-
-        sorted_cands = sorted(candidates, key=lambda c: c.simulations, reverse=True)
-        best = sorted_cands[0]
-        second = sorted_cands[1]
-
-        if best.simulations < 10 or second.simulations < 5:
-            return False
-
-        if best.simulations >= second.simulations * 3:
-            if best.win_rate > second.win_rate + 0.15:
-                return True
-
-        return False
-
     def _generate_candidates(
         self,
         state: GameState,
@@ -946,7 +1394,7 @@ class MCTSHeuristicRollout:
     ) -> list[CandidateStats]:
         """Generate diverse candidate moves."""
         candidates: list[CandidateStats] = []
-        owned = list(state.board.positions_owned_by(player))
+        owned = tuple(state.board.positions_owned_by(player))
 
         if not owned:
             return []
@@ -954,39 +1402,53 @@ class MCTSHeuristicRollout:
         opponent = player.opponent()
         board = state.board
 
-        all_stay = self._all_stay(state, player)
+        # Candidate 1: All stay (defensive baseline)
+        all_stay = self._all_stay_for(player, owned)
+
+        # Every other candidate starts from "all stay" and changes one slot
+        grow_template = list(all_stay.actions)
         candidates.append(CandidateStats(actions=all_stay))
+        seen: set[PlayerTurnActions] = {all_stay}
 
-        for pos in owned:
+        # Generate targeted candidates for each territory
+        neighbor_lists = neighbor_table(config.board_size)
+        for i, pos in enumerate(owned):
             territory = board.get(pos)
             stones = territory.stones
             half_stones = calculate_half(stones)
-            neighbors = list(pos.neighbors(config.board_size))
 
-            for neighbor in neighbors:
-                neighbor_owner = board.get_owner(neighbor)
-                neighbor_stones = board.get_stones(neighbor) if neighbor_owner != Owner.NEUTRAL else 0
+            for neighbor in neighbor_lists[pos.row][pos.col]:
+                neighbor_owner = board.get(neighbor).owner
 
+                # SEND_HALF expansion/attack
                 cand = self._single_action_candidate(
-                    state, player, pos, neighbor, half_stones, config
+                    player, grow_template, i,
+                    create_simple_move_action(pos, neighbor, half_stones),
                 )
-                if cand not in [c.actions for c in candidates]:
+                if cand not in seen:
+                    seen.add(cand)
                     candidates.append(CandidateStats(actions=cand))
 
+                # SEND_ALL for strong attacks or full expansion
                 if neighbor_owner == opponent or neighbor_owner == Owner.NEUTRAL:
                     cand = self._single_action_candidate(
-                        state, player, pos, neighbor, stones, config
+                        player, grow_template, i,
+                        create_simple_move_action(pos, neighbor, stones),
                     )
-                    if cand not in [c.actions for c in candidates]:
+                    if cand not in seen:
+                        seen.add(cand)
                         candidates.append(CandidateStats(actions=cand))
 
+        # Add random candidates to fill remaining slots
         while len(candidates) < self._num_candidates:
-            random_cand = self._random_candidate(state, player, config)
-            if random_cand not in [c.actions for c in candidates]:
+            random_cand = self._random_candidate(state, player, owned, config)
+            if random_cand not in seen:
+                seen.add(random_cand)
                 candidates.append(CandidateStats(actions=random_cand))
             else:
                 break
 
+        # Limit candidates
         if len(candidates) > self._num_candidates:
             heuristic_count = max(4, self._num_candidates // 2)
             keep = candidates[:heuristic_count]
@@ -998,45 +1460,49 @@ class MCTSHeuristicRollout:
 
     def _single_action_candidate(
         self,
-        state: GameState,
         player: Owner,
-        source: Position,
-        dest: Position,
-        stones: int,
-        config: GameConfig,
+        grow_template: list[TerritoryAction],
+        index: int,
+        action: TerritoryAction,
     ) -> PlayerTurnActions:
-        """Create candidate where one territory moves, others stay."""
-        actions = []
-        for pos in state.board.positions_owned_by(player):
-            if pos == source:
-                actions.append(create_simple_move_action(pos, dest, stones))
-            else:
-                actions.append(create_grow_action(pos))
+        """Create candidate where one territory moves, others stay.
+
+        Args:
+            player: Player the candidate is for
+            grow_template: Grow actions for every owned territory, in order
+            index: Slot of the moving territory in grow_template
+            action: The move replacing that slot
+        """
+        actions = grow_template.copy()
+        actions[index] = action
         return PlayerTurnActions(player=player, actions=tuple(actions))
 
     def _random_candidate(
         self,
         state: GameState,
         player: Owner,
+        owned: tuple[Position, ...],
         config: GameConfig,
     ) -> PlayerTurnActions:
         """Generate a random candidate."""
         actions = []
+        neighbor_lists = neighbor_table(config.board_size)
 
-        for pos in state.board.positions_owned_by(player):
+        for pos in owned:
             territory = state.board.get(pos)
             stones = territory.stones
-            neighbors = list(pos.neighbors(config.board_size))
+            neighbors = neighbor_lists[pos.row][pos.col]
 
             choice = self._rng.random()
-            if choice < 0.4 or not neighbors:
+            dest = None
+            if choice >= 0.4 and neighbors:
+                # SEND_HALF (preferred) below 0.75, SEND_ALL above
+                amount = calculate_half(stones) if choice < 0.75 else stones
+                dest = weighted_destination(state.board, player, neighbors, amount, self._rng)
+            if dest is None:
                 actions.append(create_grow_action(pos))
-            elif choice < 0.75:
-                dest = self._rng.choice(neighbors)
-                actions.append(create_simple_move_action(pos, dest, calculate_half(stones)))
             else:
-                dest = self._rng.choice(neighbors)
-                actions.append(create_simple_move_action(pos, dest, stones))
+                actions.append(create_simple_move_action(pos, dest, amount))
 
         return PlayerTurnActions(player=player, actions=tuple(actions))
 
@@ -1045,70 +1511,111 @@ class MCTSHeuristicRollout:
         state: GameState,
         player: Owner,
         candidate: PlayerTurnActions,
+        opp_actions: PlayerTurnActions,
         config: GameConfig,
     ) -> Owner | None:
-        """Simulate game to completion using pure greedy play."""
-        opponent = player.opponent()
-        current_state = state
+        """Simulate game to completion using pure greedy play.
 
-        # Apply candidate move with greedy opponent response
-        if not current_state.is_complete:
-            opp_actions = self._greedy_actions(current_state, opponent, config)
+        opp_actions is the opponent's greedy response to the root state,
+        computed once per search by _run_simulations. The root is never a
+        finished game (choose_actions returns before searching one).
+
+        Only the candidate's turn goes through apply_turn (which validates
+        it). The greedy turns after it advance the bare board with
+        resolve_turn, skipping validation, turn history and per-turn
+        GameState objects. Every turn draws from the agent's own RNG; a
+        rollout only needs independent dice, not a stream of its own.
+
+        When the candidate's turn cannot involve any dice (see
+        _turn_is_deterministic) its board is cached, so later rollouts of
+        the same candidate start straight from it.
 
+        Plays to completion unless max_rollout_depth is set, in which case
+        the rollout stops after that many turns and the board is judged by
+        the game's own win rule (territory count).
+        """
+        if self._max_rollout_depth is None:
+            stop_turn = config.num_turns
+        else:
+            stop_turn = min(config.num_turns, state.current_turn + self._max_rollout_depth)
+
+        turn = state.current_turn + 1
+        board = self._first_boards.get(candidate)
+        if board is None:
+            # Apply candidate move with greedy opponent response
             if player == Owner.PLAYER_1:
                 turn_actions = TurnActions(
                     player1_actions=candidate,
                     player2_actions=opp_actions,
-                    turn_number=current_state.current_turn + 1,
+                    turn_number=turn,
                 )
             else:
                 turn_actions = TurnActions(
                     player1_actions=opp_actions,
                     player2_actions=candidate,
-                    turn_number=current_state.current_turn + 1,
+                    turn_number=turn,
                 )
 
-            sim_rng = Random(self._rng.randint(0, 2**31 - 1))
-            current_state = apply_turn(current_state, turn_actions, config, sim_rng)
-
-        # Continue with greedy play
-        while not current_state.is_complete:
-            p1_actions = self._greedy_actions(current_state, Owner.PLAYER_1, config)
-            p2_actions = self._greedy_actions(current_state, Owner.PLAYER_2, config)
-
-            turn_actions = TurnActions(
-                player1_actions=p1_actions,
-                player2_actions=p2_actions,
-                turn_number=current_state.current_turn + 1,
-            )
-
-            sim_rng = Random(self._rng.randint(0, 2**31 - 1))
-            current_state = apply_turn(current_state, turn_actions, config, sim_rng)
-
-        return current_state.winner
+            board = apply_turn(state, turn_actions, config, self._rng).board
+            if _turn_is_deterministic(state.board, turn_actions, config):
+                self._first_boards[candidate] = board
+
+        # Continue with greedy play; both players score the same board, so
+        # they share its neutral-neighbor counts
+        while turn < stop_turn:
+            open_counts: dict[int, int] = {}
+            p1_actions = self._greedy_actions(board, Owner.PLAYER_1, config, open_counts)
+            p2_actions = self._greedy_actions(board, Owner.PLAYER_2, config, open_counts)
+            turn += 1
+            board = resolve_turn(
+                board,
+                TurnActions(
+                    player1_actions=p1_actions,
+                    player2_actions=p2_actions,
+                    turn_number=turn,
+                ),
+                config,
+                self._rng,
+            )[0]
+
+        return determine_winner(board)
 
     def _greedy_actions(
         self,
-        state: GameState,
+        board: TerritoryBoard,
         player: Owner,
         config: GameConfig,
+        open_counts: dict[int, int] | None = None,
     ) -> PlayerTurnActions:
-        """Generate pure greedy actions for a player."""
+        """Generate pure greedy actions for a player.
+
+        Args:
+            open_counts: Neutral-neighbor counts per neutral cell of this
+                board, filled in place; pass the same dict for both players
+                of a turn to count each cell once
+        """
         actions = []
         opponent = player.opponent()
-        board = state.board
+        board_size = config.board_size
+
+        cells = board.territories()
+        owners = [t.owner for t in cells]
+        stones = [t.stones for t in cells]
+        neighbor_indices = flat_neighbor_table(board_size)
+        if open_counts is None:
+            open_counts = {}
 
         for pos in board.positions_owned_by(player):
-            territory = board.get(pos)
-            stones = territory.stones
-            neighbors = list(pos.neighbors(config.board_size))
+            i = pos.row * board_size + pos.col
+            neighbors = neighbor_indices[i]
 
             if not neighbors:
                 actions.append(create_grow_action(pos))
                 continue
 
             action = self._choose_greedy_action(
-                pos, stones, neighbors, board, player, opponent, config
+                pos, stones[i], neighbors, owners, stones, opponent,
+                neighbor_indices, open_counts,
             )
             actions.append(action)
 
@@ -1118,51 +1625,47 @@ class MCTSHeuristicRollout:
         self,
         pos: Position,
         stones: int,
-        neighbors: list[Position],
-        board,
-        player: Owner,
+        neighbors: tuple[tuple[int, Position], ...],
+        owners: list[Owner],
+        cell_stones: list[int],
         opponent: Owner,
-        config: GameConfig,
+        neighbor_indices: tuple[tuple[tuple[int, Position], ...], ...],
+        open_counts: dict[int, int],
     ) -> TerritoryAction:
         """Choose the best greedy action for a territory."""
         half_stones = calculate_half(stones)
 
+        best_neutral = None
+        best_open = -1
         enemy_neighbors = []
-        neutral_neighbors = []
-        friendly_neighbors = []
-
-        for n in neighbors:
-            owner = board.get_owner(n)
-            if owner == opponent:
-                enemy_neighbors.append((n, board.get_stones(n)))
-            elif owner == Owner.NEUTRAL:
-                neutral_neighbors.append(n)
-            else:
-                friendly_neighbors.append((n, board.get_stones(n)))
-
-        options: list[tuple[float, TerritoryAction]] = []
+        for j, n in neighbors:
+            owner = owners[j]
+            if owner == Owner.NEUTRAL:
+                open_count = open_counts.get(j)
+                if open_count is None:
+                    open_count = open_counts[j] = sum(
+                        1 for k, _ in neighbor_indices[j]
+                        if owners[k] == Owner.NEUTRAL
+                    )
+                if open_count > best_open:
+                    best_neutral = n
+                    best_open = open_count
+            elif owner == opponent:
+                enemy_neighbors.append((n, cell_stones[j]))
 
-        options.append((10.0, create_grow_action(pos)))
+        if best_neutral is not None:
+            return create_simple_move_action(pos, best_neutral, half_stones)
 
+        full_attack = None
         for enemy_pos, enemy_stones in enemy_neighbors:
             if half_stones > enemy_stones:
-                options.append((100.0, create_simple_move_action(pos, enemy_pos, half_stones)))
-            elif stones > enemy_stones:
-                options.append((95.0, create_simple_move_action(pos, enemy_pos, stones)))
-
-        for neutral_pos in neutral_neighbors:
-            neutral_neighbors_count = sum(
-                1 for nn in neutral_pos.neighbors(config.board_size)
-                if board.get_owner(nn) == Owner.NEUTRAL
-            )
-            score = 200.0 + neutral_neighbors_count * 30.0
-            options.append((score, create_simple_move_action(pos, neutral_pos, half_stones)))
+                return create_simple_move_action(pos, enemy_pos, half_stones)
+            if full_attack is None and stones > enemy_stones:
+                full_attack = enemy_pos
+        if full_attack is not None:
+            return create_simple_move_action(pos, full_attack, stones)
 
-        if enemy_neighbors and stones < 4:
-            options.append((50.0, create_grow_action(pos)))
-
-        options.sort(key=lambda x: x[0], reverse=True)
-        return options[0][1]
+        return create_grow_action(pos)
 
     def _all_stay(
         self,
@@ -1170,8 +1673,199 @@ class MCTSHeuristicRollout:
         player: Owner,
     ) -> PlayerTurnActions:
         """Create all-stay actions."""
-        actions = [
-            create_grow_action(pos)
-            for pos in state.board.positions_owned_by(player)
-        ]
-        return PlayerTurnActions(player=player, actions=tuple(actions))
+        return self._all_stay_for(
+            player, tuple(state.board.positions_owned_by(player))
+        )
+
+    def _all_stay_for(
+        self,
+        player: Owner,
+        owned: tuple[Position, ...],
+    ) -> PlayerTurnActions:
+        """All-stay actions for the given territories, memoized per agent."""
+        key = (player, owned)
+        all_stay = self._all_stay_cache.get(key)
+        if all_stay is None:
+            all_stay = PlayerTurnActions(
+                player=player,
+                actions=tuple(create_grow_action(pos) for pos in owned),
+            )
+            self._all_stay_cache[key] = all_stay
+        return all_stay
+
+
+def _turn_is_deterministic(
+    board: TerritoryBoard,
+    turn_actions: TurnActions,
+    config: GameConfig,
+) -> bool:
+    """Whether resolving a turn gives the same board for every RNG.
+
+    True when the rules themselves are deterministic (combat always hits and
+    expansion always succeeds), or when no movement can lead to combat or an
+    expansion roll: every move reinforces a territory its owner keeps, or
+    expands uncontested with guaranteed success.
+    """
+    certain_expansion = config.expansion_success_rate >= 1.0
+    if config.hit_chance >= 1.0 and certain_expansion:
+        return True
+
+    movements = [
+        (player_actions.player, movement)
+        for player_actions in (turn_actions.player1_actions, turn_actions.player2_actions)
+        for movement in player_actions.get_all_movements()
+    ]
+    sources = {movement.source for _, movement in movements}
+    expanders: dict[Position, Owner] = {}
+    for mover, movement in movements:
+        dest = movement.destination
+        dest_owner = board.get_owner(dest)
+        if dest_owner == mover and dest not in sources:
+            continue  # Plain reinforcement
+        if dest_owner != Owner.NEUTRAL or not certain_expansion:
+            return False  # Combat, or an expansion roll that can fail
+        if expanders.setdefault(dest, mover) != mover:
+            return False  # Contested expansion can end in combat
+    return True
+
+
+def _run_root_parallel(
+    agent: "MCTSHeuristicEval | MCTSMinimaxEval | MCTSHeuristicRollout",
+    candidates: list[CandidateStats],
+    state: GameState,
+    player: Owner,
+    config: GameConfig,
+) -> int:
+    """Split an agent's simulation budget across worker processes.
+
+    Each worker runs an independent UCB1 search over the same candidates
+    with its own seed (root parallelization); per-candidate wins, values and
+    simulation counts are summed into `candidates` afterwards.
+
+    Returns:
+        Number of simulations run across all workers.
+    """
+    executor = agent._get_executor()
+
+    base, extra = divmod(agent._num_simulations, agent._num_workers)
+    shard_sizes = [base + (i < extra) for i in range(agent._num_workers)]
+    candidate_actions = [c.actions for c in candidates]
+    state = _without_history(state)
+
+    futures = [
+        executor.submit(
+            _run_shard,
+            type(agent), agent._shard_kwargs(), state, player,
+            candidate_actions, config, num_sims,
+            agent._rng.randint(0, 2**31 - 1),
+        )
+        for num_sims in shard_sizes
+        if num_sims > 0
+    ]
+
+    total_sims = 0
+    for future in futures:
+        for candidate, (wins, value, sims) in zip(candidates, future.result()):
+            candidate.wins += wins
+            candidate.total_value += value
+            candidate.simulations += sims
+            total_sims += sims
+
+    return total_sims
+
+
+def _without_history(state: GameState) -> GameState:
+    """The state as sent to worker processes, without its turn history.
+
+    Searches never read the history, and late in a game it is most of a
+    pickled state (about 30 KB of 31 KB after 20 turns).
+    """
+    return replace(state, turn_history=())
+
+
+def _run_shard(
+    agent_cls: type,
+    agent_kwargs: dict,
+    state: GameState,
+    player: Owner,
+    candidate_actions: list[PlayerTurnActions],
+    config: GameConfig,
+    num_simulations: int,
+    seed: int,
+) -> list[tuple[float, float, int]]:
+    """Run one root-parallel shard of simulations (in a worker process).
+
+    Returns:
+        (wins, total_value, simulations) for each candidate, in input order.
+    """
+    agent = agent_cls(seed=seed, num_simulations=num_simulations, **agent_kwargs)
+    candidates = [CandidateStats(actions=actions) for actions in candidate_actions]
+    agent._run_simulations(
+        candidates, state, player, config, num_simulations,
+        early_termination=False,
+    )
+    return [(c.wins, c.total_value, c.simulations) for c in candidates]
+
+
+def _run_leaf_batch(
+    agent: "MCTSHeuristicEval | MCTSMinimaxEval | MCTSHeuristicRollout",
+    leaf: str,
+    state: GameState,
+    player: Owner,
+    batch: list[PlayerTurnActions],
+    opp_actions: PlayerTurnActions,
+    config: GameConfig,
+) -> list:
+    """Results of the agent's `leaf` method for a batch of candidates, in order.
+
+    With num_workers > 1, batch entries without a cached value run across the
+    worker pool, each in a fresh agent with its own seed (leaf
+    parallelization), sent in about one chunk per worker. Values a worker
+    cached are cached here as well.
+    """
+    cache = getattr(agent, "_eval_cache", {})
+    pending = [i for i, actions in enumerate(batch) if actions not in cache]
+    results: dict[int, object] = {}
+    if agent._num_workers > 1 and len(pending) > 1:
+        count = len(pending)
+        shipped = _without_history(state)
+        pooled = agent._get_executor().map(
+            _eval_leaf,
+            [type(agent)] * count, [agent._shard_kwargs()] * count,
+            [agent._rng.randint(0, 2**31 - 1) for _ in pending], [leaf] * count,
+            [shipped] * count, [player] * count, [batch[i] for i in pending],
+            [opp_actions] * count, [config] * count,
+            chunksize=-(-count // agent._num_workers),
+        )
+        for i, (result, cacheable) in zip(pending, pooled):
+            results[i] = result
+            if cacheable:
+                cache[batch[i]] = result
+
+    method = getattr(agent, leaf)
+    return [
+        results[i] if i in results
+        else method(state, player, actions, opp_actions, config)
+        for i, actions in enumerate(batch)
+    ]
+
+
+def _eval_leaf(
+    agent_cls: type,
+    agent_kwargs: dict,
+    seed: int,
+    leaf: str,
+    state: GameState,
+    player: Owner,
+    candidate: PlayerTurnActions,
+    opp_actions: PlayerTurnActions,
+    config: GameConfig,
+) -> tuple[object, bool]:
+    """Run one leaf evaluation or rollout (in a worker process).
+
+    Returns:
+        (result, whether the agent cached it)
+    """
+    agent = agent_cls(seed=seed, **agent_kwargs)
+    result = getattr(agent, leaf)(state, player, candidate, opp_actions, config)
+    return result, candidate in getattr(agent, "_eval_cache", {})
@@ -9,11 +9,24 @@ Handles simultaneous moves using "paranoid search" - assume
 opponent plays the worst-case response to our move.
 
 TUNING GUIDE:
-- depth: How many turns to look ahead (1=fast, 2=moderate, 3+=slow)
+- depth: How many turns to look ahead (1=fast, 2=moderate, 3+=slow);
+  searched by iterative deepening, each pass trying the previous pass's
+  best moves first
+- time_budget: Seconds after which no deeper pass is started
 - max_moves: How many moves to consider per position (fewer=faster)
+- tt_size: Transposition table slots; positions reached through different
+  move pairs are searched once per depth
+- Killer moves and a history table (both per search) try moves that caused
+  recent cutoffs first; they reorder the max_moves kept, never replace them
+- num_workers: >1 splits each pass's root moves across worker processes
+  (root parallelization); deeper plies stay serial inside each worker
 - For debugging, set verbose=True to see search stats
 """
 
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from heapq import nlargest
 from itertools import product
 from random import Random
 import time
@@ -38,7 +51,17 @@ from ..evaluation import (
     BALANCED_WEIGHTS,
     EvaluationWeights,
 )
-from .common import center_aware_setup
+from .common import center_aware_setup, set_order_neighbor_table
+
+# Transposition table entry flags: the stored value is exact, a lower bound
+# (search failed high) or an upper bound (search failed low).
+_EXACT = 0
+_LOWER = 1
+_UPPER = 2
+
+# Search window bounds, built once rather than at every node
+_NEG_INF = float('-inf')
+_POS_INF = float('inf')
 
 
 class MinimaxAgent:
@@ -52,6 +75,11 @@ class MinimaxAgent:
     Key parameters:
     - max_depth: How far to look ahead (default 2 for speed)
     - max_moves: Limit on moves to consider (default 20)
+    - tt_size: Transposition table slots (default 65536)
+    - time_budget: Stop deepening once this many seconds have passed
+      (default None: always reach max_depth)
+    - num_workers: Worker processes for the root moves (default 1: serial);
+      call close() when done to shut the pool down
     - verbose: Print search statistics
     """
 
@@ -61,6 +89,9 @@ class MinimaxAgent:
         max_depth: int = 2,  # Conservative default for speed
         weights: EvaluationWeights | None = None,
         max_moves: int = 20,  # Limit branching
+        tt_size: int = 1 << 16,
+        time_budget: float | None = None,
+        num_workers: int = 1,
         verbose: bool = False,
     ):
         self._initial_seed = seed
@@ -68,13 +99,36 @@ class MinimaxAgent:
         self._max_depth = max_depth
         self._weights = weights or BALANCED_WEIGHTS
         self._max_moves = max_moves
+        self._time_budget = time_budget
+        self._num_workers = num_workers
+        self._executor: ProcessPoolExecutor | None = None
         self._verbose = verbose
 
+        # Transposition table: slot -> (key, depth, value, flag, best move),
+        # where key is (board zobrist hash, turn, player). Cleared at the
+        # start of each search and shared by its deepening passes.
+        self._tt_size = max(1, tt_size)
+        self._tt: dict[
+            int,
+            tuple[tuple[int, int, Owner], int, float, int, PlayerTurnActions | None],
+        ] = {}
+        self._tt_hits = 0
+
+        # Cutoff heuristics, cleared at the start of each search: up to two
+        # killer moves per (remaining depth, side to move), so our moves and
+        # the opponent's replies never evict each other, and a history score
+        # per sending territory action, bumped by depth^2 whenever a move
+        # containing it causes a cutoff (stays are in too many moves to tell
+        # them apart).
+        self._killers: dict[tuple[int, Owner], list[PlayerTurnActions]] = {}
+        self._history: dict[TerritoryAction, int] = {}
+
         # Diagnostic counters (reset each move)
         self._nodes_searched = 0
         self._nodes_pruned = 0  # Cut off by alpha-beta
         self._moves_generated = 0
         self._moves_after_limit = 0
+        self._depth_reached = 0
         self._last_search_time = 0.0
 
     @property
@@ -84,6 +138,16 @@ class MinimaxAgent:
     def reset(self) -> None:
         self._rng = Random(self._initial_seed)
         self._nodes_searched = 0
+        self._tt.clear()
+        self._tt_hits = 0
+        self._killers.clear()
+        self._history.clear()
+
+    def close(self) -> None:
+        """Shut down the worker pool used for parallel search, if any."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def choose_setup(
         self,
@@ -100,7 +164,7 @@ class MinimaxAgent:
         player: Owner,
         config: GameConfig,
     ) -> PlayerTurnActions:
-        """Choose best move using minimax with alpha-beta."""
+        """Choose best move using iteratively deepened minimax with alpha-beta."""
         start_time = time.time()
 
         # Reset diagnostic counters
@@ -108,6 +172,11 @@ class MinimaxAgent:
         self._nodes_pruned = 0
         self._moves_generated = 0
         self._moves_after_limit = 0
+        self._depth_reached = 0
+        self._tt.clear()
+        self._tt_hits = 0
+        self._killers.clear()
+        self._history.clear()
 
         # Use configured depth
         depth = self._max_depth
@@ -120,43 +189,124 @@ class MinimaxAgent:
         if len(moves) == 1:
             return moves[0]
 
-        # Order moves for better pruning
-        moves = self._order_moves(moves, state, player, config)
-
-        # Track move limiting
+        # Order moves for better pruning, keeping the best max_moves
         moves_before_limit = len(moves)
-        if len(moves) > self._max_moves:
-            moves = moves[:self._max_moves]
+        moves = self._order_moves(moves, state, player, config)
         self._moves_generated += moves_before_limit
         self._moves_after_limit += len(moves)
 
         if self._verbose:
             print(f"  Minimax: {len(moves)} moves (of {moves_before_limit}), depth {depth}")
 
-        best_move = moves[0]
-        best_value = float('-inf')
-        alpha = float('-inf')
-        beta = float('inf')
-
-        for move in moves:
-            value = self._min_opponent(
-                state, player, move, depth, alpha, beta, config
-            )
-
-            if value > best_value:
-                best_value = value
-                best_move = move
-
-            alpha = max(alpha, value)
+        best_index = 0
+
+        for d in range(1, depth + 1):
+            # Principal variation first: the previous pass's best move
+            moves.insert(0, moves.pop(best_index))
+            best_index = 0
+            best_value = _NEG_INF
+            alpha = _NEG_INF
+            beta = _POS_INF
+
+            if self._num_workers > 1:
+                values = self._search_root_parallel(moves, state, player, d, config)
+            else:
+                values = None
+                opp_moves = self._opponent_moves(state, player, d, config)
+
+            for i, move in enumerate(moves):
+                if values is not None:
+                    value = values[i]
+                else:
+                    value = self._min_opponent(
+                        state, player, move, opp_moves, d, alpha, beta, config
+                    )
+
+                if value > best_value:
+                    best_value = value
+                    best_index = i
+
+                alpha = max(alpha, value)
+
+            self._depth_reached = d
+            if (
+                self._time_budget is not None
+                and time.time() - start_time > self._time_budget
+            ):
+                break
 
+        best_move = moves[best_index]
         self._last_search_time = time.time() - start_time
 
         if self._verbose:
             prune_rate = self._nodes_pruned / max(1, self._nodes_searched + self._nodes_pruned)
-            print(f"  Minimax: {self._nodes_searched} nodes, {self._nodes_pruned} pruned ({prune_rate:.0%}), {self._last_search_time:.2f}s")
+            print(f"  Minimax: {self._nodes_searched} nodes, {self._nodes_pruned} pruned ({prune_rate:.0%}), TT hits: {self._tt_hits}, depth {self._depth_reached}, {self._last_search_time:.2f}s")
 
         return best_move
 
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Worker pool for parallel search, created on first use."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._num_workers)
+        return self._executor
+
+    def _search_root_parallel(
+        self,
+        moves: list[PlayerTurnActions],
+        state: GameState,
+        player: Owner,
+        depth: int,
+        config: GameConfig,
+    ) -> list[float]:
+        """Value every root move with a full window, split across workers.
+
+        Each worker searches a contiguous shard of the moves with its own
+        agent (and transposition table) seeded from this agent's RNG. Without
+        a shared alpha each value is exact, so picking the first maximum
+        gives the move the serial search would choose, as long as no
+        searched position has more than 1000 move combinations. Past that,
+        _sample_moves draws from each worker's own RNG, so workers may
+        search different sampled moves than the serial agent would and the
+        choice can differ.
+
+        Returns:
+            Value of each move, in input order.
+        """
+        executor = self._get_executor()
+
+        base, extra = divmod(len(moves), self._num_workers)
+        shards = []
+        start = 0
+        for i in range(self._num_workers):
+            end = start + base + (i < extra)
+            if end > start:
+                shards.append(moves[start:end])
+            start = end
+
+        kwargs = {
+            "weights": self._weights,
+            "max_moves": self._max_moves,
+            "tt_size": self._tt_size,
+        }
+        history_free = replace(state, turn_history=())
+        futures = [
+            executor.submit(
+                _search_root_shard,
+                kwargs, self._rng.randint(0, 2**31 - 1),
+                history_free, player, shard, depth, config,
+            )
+            for shard in shards
+        ]
+
+        values: list[float] = []
+        for future in futures:
+            shard_values, searched, pruned, tt_hits = future.result()
+            values.extend(shard_values)
+            self._nodes_searched += searched
+            self._nodes_pruned += pruned
+            self._tt_hits += tt_hits
+        return values
+
     def get_stats(self) -> dict:
         """Get statistics from last search (for debugging)."""
         total_considered = self._nodes_searched + self._nodes_pruned
@@ -167,6 +317,8 @@ class MinimaxAgent:
             "prune_rate": prune_rate,
             "moves_generated": self._moves_generated,
             "moves_after_limit": self._moves_after_limit,
+            "tt_hits": self._tt_hits,
+            "depth_reached": self._depth_reached,
             "search_time": self._last_search_time,
             "nodes_per_second": self._nodes_searched / max(0.001, self._last_search_time),
         }
@@ -182,6 +334,15 @@ class MinimaxAgent:
         if not territories:
             return []
 
+        if len(territories) == 1:
+            # Common late-game case: each option is a move on its own
+            return [
+                PlayerTurnActions(player=player, actions=(option,))
+                for option in self._get_territory_options(
+                    territories[0], state.board, config
+                )
+            ]
+
         # Generate options for each territory
         territory_options: list[list[TerritoryAction]] = []
 
@@ -196,16 +357,14 @@ class MinimaxAgent:
 
         if total_combos > 1000:
             # Too many - use sampling
-            return self._sample_moves(state, player, config, 100)
-
-        # Generate all combinations
-        all_combos = list(product(*territory_options))
+            return self._sample_moves(player, territories, territory_options, 100)
 
-        moves = []
-        for combo in all_combos:
-            moves.append(PlayerTurnActions(player=player, actions=tuple(combo)))
-
-        return moves
+        # Generate all combinations, streaming product's tuples straight
+        # into the moves
+        return [
+            PlayerTurnActions(player=player, actions=combo)
+            for combo in product(*territory_options)
+        ]
 
     def _get_territory_options(
         self,
@@ -234,9 +393,9 @@ class MinimaxAgent:
 
         options = [create_grow_action(pos)]  # STAY is always an option
         half_stones = calculate_half(stones)
-        neighbors = list(pos.neighbors(config.board_size))
+        neighbors = set_order_neighbor_table(config.board_size)
 
-        for neighbor in neighbors:
+        for neighbor in neighbors[pos.row][pos.col]:
             neighbor_owner = board.get_owner(neighbor)
             neighbor_stones = board.get_stones(neighbor) if neighbor_owner != Owner.NEUTRAL else 0
 
@@ -258,7 +417,7 @@ class MinimaxAgent:
                 # Reinforce only if it resolves a threat
                 # Check if neighbor is threatened (enemy nearby with more stones)
                 neighbor_threatened_by = None
-                for nn in neighbor.neighbors(config.board_size):
+                for nn in neighbors[neighbor.row][neighbor.col]:
                     if board.get_owner(nn) == opponent:
                         enemy_stones = board.get_stones(nn)
                         if enemy_stones > neighbor_stones:
@@ -277,37 +436,48 @@ class MinimaxAgent:
 
     def _sample_moves(
         self,
-        state: GameState,
         player: Owner,
-        config: GameConfig,
+        territories: list[Position],
+        territory_options: list[list[TerritoryAction]],
         n: int,
     ) -> list[PlayerTurnActions]:
-        """Sample n diverse moves when full enumeration is too expensive."""
+        """Sample n diverse moves when full enumeration is too expensive.
+
+        Args:
+            player: Player to move
+            territories: The player's territories
+            territory_options: _get_territory_options for each territory,
+                computed once by _generate_moves and shared by every sample
+            n: Number of moves, including all-stay
+        """
         moves = []
-        territories = list(state.board.positions_owned_by(player))
 
         # Always include all-stay
         all_stay = tuple(create_grow_action(p) for p in territories)
         moves.append(PlayerTurnActions(player=player, actions=all_stay))
 
         # Generate random samples
+        choice = self._rng.choice
         for _ in range(n - 1):
-            actions = []
-            for pos in territories:
-                options = self._get_territory_options(pos, state.board, config)
-                actions.append(self._rng.choice(options))
-            moves.append(PlayerTurnActions(player=player, actions=tuple(actions)))
+            actions = tuple(choice(options) for options in territory_options)
+            moves.append(PlayerTurnActions(player=player, actions=actions))
 
         return moves
 
     def _order_moves(
         self,
-        moves: list[PlayerTurnActions],
+        moves: Iterable[PlayerTurnActions],
         state: GameState,
         player: Owner,
         config: GameConfig,
+        depth: int | None = None,
     ) -> list[PlayerTurnActions]:
-        """Order moves for better alpha-beta pruning.
+        """Order moves for better alpha-beta pruning, keeping the best max_moves.
+
+        Selects the top max_moves with a heap rather than sorting them all;
+        ties keep generation order, exactly as a stable sort would. Given the
+        search depth, the kept moves are then reordered killers first, then
+        by history score, with the static order breaking ties.
 
         Simplified scoring (user hypotheses):
         1. EXPANSION - scored by destination's neutral neighbor count
@@ -317,6 +487,9 @@ class MinimaxAgent:
         """
         opponent = player.opponent()
         board = state.board
+        neighbors = set_order_neighbor_table(config.board_size)
+        # Neutral-neighbor count per expansion target, shared by all moves
+        neutral_counts: dict[Position, int] = {}
 
         def move_score(move: PlayerTurnActions) -> float:
             score = 0.0
@@ -335,10 +508,12 @@ class MinimaxAgent:
                         # 1. EXPANSION to neutral - score by future potential
                         if dest_owner == Owner.NEUTRAL:
                             # Count neutral neighbors of destination
-                            neutral_neighbors = sum(
-                                1 for nn in dest.neighbors(config.board_size)
-                                if board.get_owner(nn) == Owner.NEUTRAL
-                            )
+                            neutral_neighbors = neutral_counts.get(dest)
+                            if neutral_neighbors is None:
+                                neutral_neighbors = neutral_counts[dest] = sum(
+                                    1 for nn in neighbors[dest.row][dest.col]
+                                    if board.get_owner(nn) == Owner.NEUTRAL
+                                )
                             # Best expansions have most neutral neighbors
                             score += 200 + neutral_neighbors * 30
 
@@ -352,7 +527,21 @@ class MinimaxAgent:
 
             return score
 
-        return sorted(moves, key=move_score, reverse=True)
+        ordered = nlargest(self._max_moves, moves, key=move_score)
+        if depth is None or not self._killers:
+            return ordered
+
+        killers = self._killers.get((depth, player), ())
+        history = self._history
+
+        def cutoff_score(move: PlayerTurnActions) -> tuple[bool, int]:
+            return (
+                move in killers,
+                sum(history.get(action, 0) for action in move.actions),
+            )
+
+        ordered.sort(key=cutoff_score, reverse=True)
+        return ordered
 
     def _max_player(
         self,
@@ -366,66 +555,153 @@ class MinimaxAgent:
         """Maximizing player's turn."""
         self._nodes_searched += 1
 
+        # Probe the transposition table: reuse a deep enough result, or
+        # narrow the window with a stored bound. A shallower entry (from an
+        # earlier deepening pass) still supplies its best move.
+        key = (state.board.zobrist_hash(), state.current_turn, player)
+        slot = hash(key) % self._tt_size
+        entry = self._tt.get(slot)
+        if entry is None or entry[0] != key:
+            entry = None
+        tt_move = entry[4] if entry is not None else None
+        if entry is not None and entry[1] >= depth:
+            _, _, value, flag, _ = entry
+            if flag == _EXACT:
+                self._tt_hits += 1
+                return value
+            if flag == _LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                self._tt_hits += 1
+                return value
+        alpha_orig = alpha
+
         # Terminal or depth limit
         if state.is_complete or depth == 0:
-            return evaluate_board(
+            value = evaluate_board(
                 state.board, player, config,
                 state.current_turn, self._weights
             )
+            self._tt_store(slot, key, depth, value, _EXACT, None)
+            return value
 
         moves = self._generate_moves(state, player, config)
         if not moves:
-            return evaluate_board(
+            value = evaluate_board(
                 state.board, player, config,
                 state.current_turn, self._weights
             )
+            self._tt_store(slot, key, depth, value, _EXACT, None)
+            return value
 
-        moves = self._order_moves(moves, state, player, config)
-        if len(moves) > self._max_moves:
-            moves = moves[:self._max_moves]
+        moves = self._order_moves(moves, state, player, config, depth)
+
+        # Best move from the table goes first
+        if tt_move is not None and tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
 
-        best_value = float('-inf')
+        # The opponent's replies depend only on this state, not on our move
+        opp_moves = self._opponent_moves(state, player, depth, config)
+
+        best_value = _NEG_INF
+        best_move = None
 
         for i, move in enumerate(moves):
             value = self._min_opponent(
-                state, player, move, depth, alpha, beta, config
+                state, player, move, opp_moves, depth, alpha, beta, config
             )
 
-            best_value = max(best_value, value)
+            if value > best_value:
+                best_value = value
+                best_move = move
             alpha = max(alpha, value)
 
             if beta <= alpha:
                 # Pruning! Count remaining moves as pruned
                 self._nodes_pruned += len(moves) - i - 1
+                self._record_cutoff(move, depth)
                 break
 
+        if best_value <= alpha_orig:
+            flag = _UPPER
+        elif best_value >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._tt_store(slot, key, depth, best_value, flag, best_move)
+
         return best_value
 
+    def _tt_store(
+        self,
+        slot: int,
+        key: tuple[int, int, Owner],
+        depth: int,
+        value: float,
+        flag: int,
+        best_move: PlayerTurnActions | None,
+    ) -> None:
+        """Store a search result, keeping the deeper entry on slot collisions."""
+        entry = self._tt.get(slot)
+        if entry is None or depth >= entry[1]:
+            self._tt[slot] = (key, depth, value, flag, best_move)
+
+    def _record_cutoff(self, move: PlayerTurnActions, depth: int) -> None:
+        """Remember a move that caused a cutoff at this depth for its player."""
+        killers = self._killers.setdefault((depth, move.player), [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+
+        bonus = depth * depth
+        history = self._history
+        for action in move.actions:
+            if action.is_move:
+                history[action] = history.get(action, 0) + bonus
+
+    def _opponent_moves(
+        self,
+        state: GameState,
+        player: Owner,
+        depth: int,
+        config: GameConfig,
+    ) -> list[PlayerTurnActions]:
+        """Opponent's ordered replies at this state, shared by all our moves.
+
+        Limited to max_moves for speed (same limit as our moves); empty if
+        the opponent has no territories.
+        """
+        opponent = player.opponent()
+        opp_moves = self._generate_moves(state, opponent, config)
+        if not opp_moves:
+            return opp_moves
+        return self._order_moves(opp_moves, state, opponent, config, depth)
+
     def _min_opponent(
         self,
         state: GameState,
         player: Owner,
         my_move: PlayerTurnActions,
+        opp_moves: list[PlayerTurnActions],
         depth: int,
         alpha: float,
         beta: float,
         config: GameConfig,
     ) -> float:
-        """Minimizing opponent's response to our move."""
-        opponent = player.opponent()
+        """Minimizing opponent's response to our move.
 
-        opp_moves = self._generate_moves(state, opponent, config)
+        opp_moves comes from _opponent_moves for this state, computed once
+        by the caller rather than again for each of our moves.
+        """
         if not opp_moves:
             # Opponent has no moves - apply our move only
             next_state = self._apply_turn(state, my_move, player, config)
             return self._max_player(next_state, player, depth - 1, alpha, beta, config)
 
-        # Limit opponent moves for speed (same limit as our moves)
-        opp_moves = self._order_moves(opp_moves, state, opponent, config)
-        if len(opp_moves) > self._max_moves:
-            opp_moves = opp_moves[:self._max_moves]
-
-        best_value = float('inf')
+        best_value = _POS_INF
 
         for i, opp_move in enumerate(opp_moves):
             next_state = self._apply_turn_both(
@@ -442,6 +718,7 @@ class MinimaxAgent:
             if beta <= alpha:
                 # Pruning! Count remaining opponent moves as pruned
                 self._nodes_pruned += len(opp_moves) - i - 1
+                self._record_cutoff(opp_move, depth)
                 break
 
         return best_value
@@ -511,3 +788,28 @@ class MinimaxAgent:
             for pos in state.board.positions_owned_by(player)
         ]
         return PlayerTurnActions(player=player, actions=tuple(actions))
+
+
+def _search_root_shard(
+    agent_kwargs: dict,
+    seed: int,
+    state: GameState,
+    player: Owner,
+    moves: list[PlayerTurnActions],
+    depth: int,
+    config: GameConfig,
+) -> tuple[list[float], int, int, int]:
+    """Value a shard of root moves with full windows (in a worker process).
+
+    Returns:
+        (value per move, nodes searched, nodes pruned, TT hits)
+    """
+    agent = MinimaxAgent(seed=seed, **agent_kwargs)
+    opp_moves = agent._opponent_moves(state, player, depth, config)
+    values = [
+        agent._min_opponent(
+            state, player, move, opp_moves, depth, _NEG_INF, _POS_INF, config
+        )
+        for move in moves
+    ]
+    return values, agent._nodes_searched, agent._nodes_pruned, agent._tt_hits
@@ -6,6 +6,7 @@ Key improvements:
 2. Better pruning
 3. Time limits per move
 4. Simpler evaluation for shallow depths
+5. Transposition table over Zobrist-hashed positions
 
 Run tests with: python -m pytest tests/unit/test_agents.py -v
 """
@@ -33,6 +34,13 @@ from ..evaluation import (
     BALANCED_WEIGHTS,
     EvaluationWeights,
 )
+from .common import set_order_neighbor_table
+
+# Transposition table entry flags: the stored value is exact, a lower bound
+# (search failed high) or an upper bound (search failed low).
+_EXACT = 0
+_LOWER = 1
+_UPPER = 2
 
 
 class OptimizedMinimaxAgent:
@@ -49,6 +57,8 @@ class OptimizedMinimaxAgent:
     - max_moves: Maximum moves to consider (5-10 for speed)
     - max_candidates_per_territory: Max options per territory (3-5)
     - time_limit_sec: Hard time limit per move
+    - tt_size: Transposition table slots
+    - null_move: Try null-move pruning at depth 2 and deeper
     """
 
     def __init__(
@@ -59,6 +69,8 @@ class OptimizedMinimaxAgent:
         max_moves: int = 8,
         max_candidates_per_territory: int = 4,
         time_limit_sec: float = 5.0,
+        tt_size: int = 1 << 16,
+        null_move: bool = True,
         verbose: bool = False,
     ):
         self._initial_seed = seed
@@ -68,8 +80,27 @@ class OptimizedMinimaxAgent:
         self._max_moves = max_moves
         self._max_candidates_per_territory = max_candidates_per_territory
         self._time_limit_sec = time_limit_sec
+        self._null_move = null_move
         self._verbose = verbose
 
+        # Transposition table: slot -> (key, depth, value, flag), where key
+        # is (board zobrist hash, turn, player). Cleared at the start of
+        # each search.
+        self._tt_size = max(1, tt_size)
+        self._tt: dict[int, tuple[tuple[int, int, Owner], int, float, int]] = {}
+        self._tt_hits = 0
+        self._null_cutoffs = 0
+
+        # Killer moves: up to two moves per (depth, side to move) that caused
+        # a cutoff, tried first among siblings. Keyed by side so our moves and
+        # the opponent's replies never evict each other. Cleared at the start
+        # of each search.
+        self._killers: dict[tuple[int, Owner], list[PlayerTurnActions]] = {}
+
+        # Search RNG for simultaneous turns, re-seeded to 42 per turn
+        # rather than allocated each time
+        self._eval_rng = Random(42)
+
         self._nodes_searched = 0
         self._last_search_time = 0.0
         self._start_time = 0.0
@@ -81,6 +112,10 @@ class OptimizedMinimaxAgent:
     def reset(self) -> None:
         self._rng = Random(self._initial_seed)
         self._nodes_searched = 0
+        self._tt.clear()
+        self._tt_hits = 0
+        self._null_cutoffs = 0
+        self._killers.clear()
 
     def choose_setup(
         self,
@@ -118,6 +153,10 @@ class OptimizedMinimaxAgent:
         """Choose best move using optimized minimax."""
         self._start_time = time.time()
         self._nodes_searched = 0
+        self._tt.clear()
+        self._tt_hits = 0
+        self._null_cutoffs = 0
+        self._killers.clear()
 
         # Limit to 5 best candidates per territory for speed
         moves = self._generate_limited_moves(state, player, config)
@@ -139,6 +178,7 @@ class OptimizedMinimaxAgent:
         best_value = float("-inf")
         alpha = float("-inf")
         beta = float("inf")
+        opp_moves = self._opponent_moves(state, player, config)
 
         for move in moves:
             # Check time limit
@@ -147,7 +187,9 @@ class OptimizedMinimaxAgent:
                     print(f"  Time limit exceeded, using current best move")
                 break
 
-            value = self._min_opponent(state, player, move, self._max_depth, alpha, beta, config)
+            value = self._min_opponent(
+                state, player, move, opp_moves, self._max_depth, alpha, beta, config
+            )
 
             if value > best_value:
                 best_value = value
@@ -158,7 +200,7 @@ class OptimizedMinimaxAgent:
         self._last_search_time = time.time() - self._start_time
 
         if self._verbose:
-            print(f"  OptimizedMinimax: {self._nodes_searched} nodes, {self._last_search_time:.2f}s")
+            print(f"  OptimizedMinimax: {self._nodes_searched} nodes, TT hits: {self._tt_hits}, {self._last_search_time:.2f}s")
 
         return best_move
 
@@ -166,6 +208,8 @@ class OptimizedMinimaxAgent:
         """Get statistics from last search."""
         return {
             "nodes_searched": self._nodes_searched,
+            "tt_hits": self._tt_hits,
+            "null_cutoffs": self._null_cutoffs,
             "search_time": self._last_search_time,
         }
 
@@ -224,7 +268,8 @@ class OptimizedMinimaxAgent:
 
         options = [create_grow_action(pos)]  # STAY is always first
         half_stones = calculate_half(stones)
-        neighbors = list(pos.neighbors(config.board_size))
+        table = set_order_neighbor_table(config.board_size)
+        neighbors = table[pos.row][pos.col]
 
         if not neighbors:
             return options
@@ -249,7 +294,7 @@ class OptimizedMinimaxAgent:
 
             else:  # friendly
                 neighbor_threatened_by = None
-                for nn in neighbor.neighbors(config.board_size):
+                for nn in table[neighbor.row][neighbor.col]:
                     if board.get_owner(nn) == opponent:
                         enemy_stones = board.get_stones(nn)
                         if enemy_stones > neighbor_stones:
@@ -266,7 +311,7 @@ class OptimizedMinimaxAgent:
     def _select_best_neighbors(
         self,
         pos: Position,
-        neighbors: list[Position],
+        neighbors: tuple[Position, ...],
         board,
         config: GameConfig,
         limit: int,
@@ -274,6 +319,7 @@ class OptimizedMinimaxAgent:
         """Select most promising neighbors."""
         scored = []
         opponent = board.get_owner(pos).opponent()
+        table = set_order_neighbor_table(config.board_size)
 
         for neighbor in neighbors:
             owner = board.get_owner(neighbor)
@@ -282,7 +328,7 @@ class OptimizedMinimaxAgent:
             if owner == Owner.NEUTRAL:
                 # Score by neutral neighbors
                 neutral_count = sum(
-                    1 for nn in neighbor.neighbors(config.board_size)
+                    1 for nn in table[neighbor.row][neighbor.col]
                     if board.get_owner(nn) == Owner.NEUTRAL
                 )
                 score = 100 + neutral_count
@@ -329,9 +375,15 @@ class OptimizedMinimaxAgent:
         state: GameState,
         player: Owner,
         config: GameConfig,
+        depth: int | None = None,
     ) -> list[PlayerTurnActions]:
-        """Order moves for better pruning."""
+        """Order moves for better pruning.
+
+        Given the search depth, killer moves recorded for player at that
+        depth go first, with the static order breaking ties.
+        """
         board = state.board
+        opponent = player.opponent()
 
         def move_score(move: PlayerTurnActions) -> float:
             score = 0.0
@@ -339,21 +391,24 @@ class OptimizedMinimaxAgent:
             for action in move.actions:
                 if action.is_grow:
                     score += 10
-                elif action.is_move:
+                else:
                     for movement in action.movements:
-                        dest = movement.destination
-                        dest_owner = board.get_owner(dest)
+                        dest_owner = board.get_owner(movement.destination)
 
                         if dest_owner == Owner.NEUTRAL:
                             score += 200
-                        elif dest_owner == player.opponent():
+                        elif dest_owner == opponent:
                             score += 100
                         else:
                             score += 50
 
             return score
 
-        return sorted(moves, key=move_score, reverse=True)
+        ordered = sorted(moves, key=move_score, reverse=True)
+        killers = self._killers.get((depth, player)) if depth is not None else None
+        if killers:
+            ordered.sort(key=killers.__contains__, reverse=True)
+        return ordered
 
     def _max_player(
         self,
@@ -371,52 +426,132 @@ class OptimizedMinimaxAgent:
         if time.time() - self._start_time > self._time_limit_sec:
             return evaluate_board(state.board, player, config, state.current_turn, self._weights)
 
+        # Probe the transposition table: reuse a deep enough result, or
+        # narrow the window with a stored bound
+        key = (state.board.zobrist_hash(), state.current_turn, player)
+        slot = hash(key) % self._tt_size
+        entry = self._tt.get(slot)
+        if entry is not None and entry[0] == key and entry[1] >= depth:
+            _, _, value, flag = entry
+            if flag == _EXACT:
+                self._tt_hits += 1
+                return value
+            if flag == _LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                self._tt_hits += 1
+                return value
+        alpha_orig = alpha
+
         # Terminal or depth limit
         if state.is_complete or depth == 0:
-            return evaluate_board(state.board, player, config, state.current_turn, self._weights)
+            value = evaluate_board(state.board, player, config, state.current_turn, self._weights)
+            self._tt_store(slot, key, depth, value, _EXACT)
+            return value
 
         moves = self._generate_limited_moves(state, player, config)
         if not moves:
-            return evaluate_board(state.board, player, config, state.current_turn, self._weights)
+            value = evaluate_board(state.board, player, config, state.current_turn, self._weights)
+            self._tt_store(slot, key, depth, value, _EXACT)
+            return value
+
+        # The opponent's replies depend only on this state, not on our move
+        opp_moves = self._opponent_moves(state, player, config, depth)
+
+        # Null move: if standing still, searched one turn shallower, already
+        # reaches beta, assume the best real move would too. The bound only
+        # comes from a depth - 1 search, so it is stored at that depth.
+        if self._null_move and depth >= 2 and beta < float("inf"):
+            value = self._min_opponent(
+                state, player, self._all_stay(state, player), opp_moves,
+                depth - 1, alpha, beta, config,
+            )
+            if value >= beta:
+                self._null_cutoffs += 1
+                self._tt_store(slot, key, depth - 1, value, _LOWER)
+                return value
 
-        moves = self._order_moves(moves, state, player, config)
+        moves = self._order_moves(moves, state, player, config, depth)
         if len(moves) > self._max_moves:
             moves = moves[: self._max_moves]
 
         best_value = float("-inf")
 
         for move in moves:
-            value = self._min_opponent(state, player, move, depth, alpha, beta, config)
+            value = self._min_opponent(
+                state, player, move, opp_moves, depth, alpha, beta, config
+            )
             best_value = max(best_value, value)
             alpha = max(alpha, value)
 
             if beta <= alpha:
+                self._record_killer(move, depth)
                 break
 
+        if best_value <= alpha_orig:
+            flag = _UPPER
+        elif best_value >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._tt_store(slot, key, depth, best_value, flag)
+
         return best_value
 
+    def _tt_store(
+        self,
+        slot: int,
+        key: tuple[int, int, Owner],
+        depth: int,
+        value: float,
+        flag: int,
+    ) -> None:
+        """Store a search result, keeping the deeper entry on slot collisions."""
+        entry = self._tt.get(slot)
+        if entry is None or depth >= entry[1]:
+            self._tt[slot] = (key, depth, value, flag)
+
+    def _record_killer(self, move: PlayerTurnActions, depth: int) -> None:
+        """Remember a move that caused a cutoff at this depth for its player."""
+        killers = self._killers.setdefault((depth, move.player), [])
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+
+    def _opponent_moves(
+        self,
+        state: GameState,
+        player: Owner,
+        config: GameConfig,
+        depth: int | None = None,
+    ) -> list[PlayerTurnActions]:
+        """Opponent's ordered replies at this state, shared by all our moves."""
+        opponent = player.opponent()
+        opp_moves = self._generate_limited_moves(state, opponent, config)
+        if not opp_moves:
+            return opp_moves
+
+        opp_moves = self._order_moves(opp_moves, state, opponent, config, depth)
+        return opp_moves[: self._max_moves]
+
     def _min_opponent(
         self,
         state: GameState,
         player: Owner,
         my_move: PlayerTurnActions,
+        opp_moves: list[PlayerTurnActions],
         depth: int,
         alpha: float,
         beta: float,
         config: GameConfig,
     ) -> float:
-        """Minimizing opponent's response."""
-        opponent = player.opponent()
-
-        opp_moves = self._generate_limited_moves(state, opponent, config)
+        """Minimizing opponent's response (opp_moves from _opponent_moves)."""
         if not opp_moves:
             next_state = self._apply_turn(state, my_move, player, config)
             return self._max_player(next_state, player, depth - 1, alpha, beta, config)
 
-        opp_moves = self._order_moves(opp_moves, state, opponent, config)
-        if len(opp_moves) > self._max_moves:
-            opp_moves = opp_moves[: self._max_moves]
-
         best_value = float("inf")
 
         for opp_move in opp_moves:
@@ -426,6 +561,7 @@ class OptimizedMinimaxAgent:
             beta = min(beta, value)
 
             if beta <= alpha:
+                self._record_killer(opp_move, depth)
                 break
 
         return best_value
@@ -479,7 +615,8 @@ class OptimizedMinimaxAgent:
             )
 
         # Use fixed seed for consistency
-        eval_rng = Random(42)
+        eval_rng = self._eval_rng
+        eval_rng.seed(42)
         return apply_turn(state, turn_actions, config, eval_rng)
 
     def _all_stay(
@@ -4,8 +4,11 @@ Provides reusable evaluation functions for AI agents.
 All functions evaluate from a specific player's perspective.
 """
 
+import math
 from dataclasses import dataclass, field
-from typing import Callable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Mapping
 
 from .types import (
     Owner, Position, GameState, TerritoryBoard,
@@ -139,51 +142,59 @@ TERRITORY_SAFETY_WEIGHTS = EvaluationWeights(
 )
 
 
-def get_phase_multipliers(current_turn: int, total_turns: int) -> dict[str, float]:
+# Phase multiplier tables, shared read-only by every evaluation
+_EARLY_GAME_MULTIPLIERS: Mapping[str, float] = MappingProxyType({
+    'territory_count': 0.7,
+    'stone_advantage': 1.2,
+    'growth_potential': 1.5,
+    'expansion_opportunity': 1.4,
+    'center_control': 1.2,
+    'attack_opportunity': 0.5,
+    'threatened_penalty': 0.8,
+    'connectivity': 0.8,
+    'merge_potential': 1.2,
+})
+_MID_GAME_MULTIPLIERS: Mapping[str, float] = MappingProxyType({
+    'territory_count': 1.0,
+    'stone_advantage': 1.0,
+    'growth_potential': 1.0,
+    'expansion_opportunity': 1.2,
+    'center_control': 1.0,
+    'attack_opportunity': 1.2,
+    'threatened_penalty': 1.0,
+    'connectivity': 1.0,
+    'merge_potential': 1.0,
+})
+_LATE_GAME_MULTIPLIERS: Mapping[str, float] = MappingProxyType({
+    'territory_count': 2.0,  # Critical!
+    'stone_advantage': 0.6,
+    'growth_potential': 0.5,
+    'expansion_opportunity': 1.5,
+    'center_control': 0.8,
+    'attack_opportunity': 1.5,
+    'threatened_penalty': 1.2,
+    'connectivity': 0.8,
+    'merge_potential': 0.5,
+})
+
+
+def get_phase_multipliers(current_turn: int, total_turns: int) -> Mapping[str, float]:
     """Return weight multipliers based on game phase.
 
     Early game: expansion and growth potential matter more
     Mid game: balanced
     Late game: territory count is critical
+
+    The tables are shared between calls, so the mapping is read-only.
     """
     progress = current_turn / total_turns if total_turns > 0 else 0
 
     if progress < 0.3:  # Early game
-        return {
-            'territory_count': 0.7,
-            'stone_advantage': 1.2,
-            'growth_potential': 1.5,
-            'expansion_opportunity': 1.4,
-            'center_control': 1.2,
-            'attack_opportunity': 0.5,
-            'threatened_penalty': 0.8,
-            'connectivity': 0.8,
-            'merge_potential': 1.2,
-        }
+        return _EARLY_GAME_MULTIPLIERS
     elif progress < 0.7:  # Mid game
-        return {
-            'territory_count': 1.0,
-            'stone_advantage': 1.0,
-            'growth_potential': 1.0,
-            'expansion_opportunity': 1.2,
-            'center_control': 1.0,
-            'attack_opportunity': 1.2,
-            'threatened_penalty': 1.0,
-            'connectivity': 1.0,
-            'merge_potential': 1.0,
-        }
+        return _MID_GAME_MULTIPLIERS
     else:  # Late game
-        return {
-            'territory_count': 2.0,  # Critical!
-            'stone_advantage': 0.6,
-            'growth_potential': 0.5,
-            'expansion_opportunity': 1.5,
-            'center_control': 0.8,
-            'attack_opportunity': 1.5,
-            'threatened_penalty': 1.2,
-            'connectivity': 0.8,
-            'merge_potential': 0.5,
-        }
+        return _LATE_GAME_MULTIPLIERS
 
 
 # =============================================================================
@@ -496,6 +507,160 @@ def can_safely_divide(
     return turns_to_threat > recovery_turns
 
 
+# =============================================================================
+# Fused Feature Pass
+# =============================================================================
+
+@lru_cache(maxsize=None)
+def _neighbor_order(board_size: int) -> tuple[tuple[int, ...], ...]:
+    """Flat neighbor indices of every cell, in Position.neighbors() order.
+
+    The per-feature functions above iterate neighbor frozensets, and some of
+    them (first enemy neighbor, first owner to reach a cell) depend on that
+    order, so the fused pass replays exactly the same order.
+    """
+    return tuple(
+        tuple(n.row * board_size + n.col for n in Position(r, c).neighbors(board_size))
+        for r in range(board_size)
+        for c in range(board_size)
+    )
+
+
+def _feature_scores(
+    board: TerritoryBoard,
+    player: Owner,
+    config: GameConfig,
+) -> tuple[float, ...]:
+    """All nine evaluation features in one pass over the board.
+
+    Reads the board once into flat owner/stone lists and walks the player's
+    territories once, accumulating every feature in the same order as the
+    individual feature functions, so the results are identical to calling
+    them one by one.
+
+    Returns:
+        (territory_count, stone_advantage, growth_potential,
+        expansion_opportunity, center_control, attack_opportunity,
+        threatened_penalty, connectivity, merge_potential)
+    """
+    board_size = config.board_size
+    max_stones = config.max_stones
+    opponent = player.opponent()
+    neutral = Owner.NEUTRAL
+
+    cells = board.territories()
+    owners = [t.owner for t in cells]
+    stones = [t.stones for t in cells]
+    neighbor_order = _neighbor_order(board_size)
+
+    mid = board_size // 2
+    max_dist = mid * 2
+
+    growth = 0.0
+    expansion = 0.0
+    center = 0.0
+    attack = 0.0
+    threatened = 0.0
+    connectivity = 0.0
+    merge = 0.0
+    counted_neutrals: set[int] = set()
+    evaluated_targets: set[int] = set()
+
+    owned = board.positions_owned_by(player)
+    for pos in owned:
+        i = pos.row * board_size + pos.col
+        my_stones = stones[i]
+        half_stones = calculate_half(my_stones)
+        neighbors = neighbor_order[i]
+
+        # Growth potential (threatened = any enemy neighbor at least as strong)
+        if my_stones < max_stones:
+            growth += 1.0
+            if not any(
+                owners[n] == opponent and stones[n] >= my_stones for n in neighbors
+            ):
+                growth += 0.5
+
+        # Expansion opportunities (each neutral counted once)
+        for n in neighbors:
+            if owners[n] == neutral and n not in counted_neutrals:
+                counted_neutrals.add(n)
+                expansion += 1.0
+                if half_stones >= 2:
+                    expansion += 0.5
+                if half_stones >= 3:
+                    expansion += 0.3
+
+        # Center control
+        dist = abs(pos.row - mid) + abs(pos.col - mid)
+        center += 1.0 - (dist / max_dist) if max_dist > 0 else 1.0
+
+        # Attack opportunities (each enemy target counted once)
+        for n in neighbors:
+            if n in evaluated_targets:
+                continue
+            if owners[n] == opponent:
+                evaluated_targets.add(n)
+                enemy_stones = stones[n]
+                if my_stones > enemy_stones:
+                    advantage = my_stones - enemy_stones
+                    attack += 0.5 + 0.2 * advantage
+                    if half_stones > enemy_stones:
+                        attack += 0.8
+
+        # Threatened territories (first enemy neighbor only)
+        for n in neighbors:
+            if owners[n] == opponent:
+                enemy_stones = stones[n]
+                if enemy_stones >= my_stones:
+                    threatened += 1.0 + 0.2 * (enemy_stones - my_stones)
+                elif enemy_stones >= my_stones - 2:
+                    threatened += 0.5
+                break
+
+        # Connectivity and merge potential
+        friendly = [n for n in neighbors if owners[n] == player]
+        if not friendly:
+            connectivity -= 0.3
+        else:
+            connectivity += 0.3 * len(friendly)
+            merge += 0.5 * len(friendly)
+            combined_potential = my_stones + sum(stones[n] for n in friendly)
+            merge += min(combined_potential / max_stones, 1.0) * 0.5
+
+    if owners[mid * board_size + mid] == player:
+        center += 1.5
+
+    # Territory count and stone advantage
+    my_territories = len(owned)
+    opp_territories = 0
+    my_total = 0
+    opp_total = 0
+    for owner, count in zip(owners, stones):
+        if owner == player:
+            my_total += count
+        elif owner == opponent:
+            opp_territories += 1
+            opp_total += count
+    if my_total > 0 and my_territories > 0:
+        effective_my = my_territories * math.log2(1 + my_total / my_territories)
+    else:
+        effective_my = 0
+    stone_adv = effective_my - opp_total * 0.8
+
+    return (
+        float(my_territories - opp_territories),
+        stone_adv,
+        growth,
+        expansion,
+        center,
+        attack,
+        threatened,
+        connectivity,
+        merge,
+    )
+
+
 # =============================================================================
 # Complete Evaluation Function
 # =============================================================================
@@ -526,18 +691,22 @@ def evaluate_position(
             'threatened_penalty', 'connectivity', 'merge_potential'
         ]}
 
-    # Calculate features
-    score = 0.0
+    # Calculate features (one fused pass)
+    (
+        territory, stones, growth, expansion, center,
+        attack, threatened, connectivity, merge,
+    ) = _feature_scores(board, player, config)
 
-    score += territory_count_difference(board, player) * weights.territory_count * phase_mult['territory_count']
-    score += stone_advantage(board, player) * weights.stone_advantage * phase_mult['stone_advantage']
-    score += growth_potential(board, player, config) * weights.growth_potential * phase_mult['growth_potential']
-    score += expansion_opportunities(board, player, config) * weights.expansion_opportunity * phase_mult['expansion_opportunity']
-    score += center_control(board, player, config) * weights.center_control * phase_mult['center_control']
-    score += attack_opportunities(board, player, config) * weights.attack_opportunity * phase_mult['attack_opportunity']
-    score -= threatened_territories(board, player, config) * weights.threatened_penalty * phase_mult['threatened_penalty']
-    score += connectivity_score(board, player, config) * weights.connectivity * phase_mult['connectivity']
-    score += merge_potential(board, player, config) * weights.merge_potential * phase_mult['merge_potential']
+    score = 0.0
+    score += territory * weights.territory_count * phase_mult['territory_count']
+    score += stones * weights.stone_advantage * phase_mult['stone_advantage']
+    score += growth * weights.growth_potential * phase_mult['growth_potential']
+    score += expansion * weights.expansion_opportunity * phase_mult['expansion_opportunity']
+    score += center * weights.center_control * phase_mult['center_control']
+    score += attack * weights.attack_opportunity * phase_mult['attack_opportunity']
+    score -= threatened * weights.threatened_penalty * phase_mult['threatened_penalty']
+    score += connectivity * weights.connectivity * phase_mult['connectivity']
+    score += merge * weights.merge_potential * phase_mult['merge_potential']
 
     return score
 
@@ -555,15 +724,20 @@ def evaluate_board(
 
     phase_mult = get_phase_multipliers(current_turn, config.num_turns)
 
+    (
+        territory, stones, growth, expansion, center,
+        attack, threatened, connectivity, merge,
+    ) = _feature_scores(board, player, config)
+
     score = 0.0
-    score += territory_count_difference(board, player) * weights.territory_count * phase_mult['territory_count']
-    score += stone_advantage(board, player) * weights.stone_advantage * phase_mult['stone_advantage']
-    score += growth_potential(board, player, config) * weights.growth_potential * phase_mult['growth_potential']
-    score += expansion_opportunities(board, player, config) * weights.expansion_opportunity * phase_mult['expansion_opportunity']
-    score += center_control(board, player, config) * weights.center_control * phase_mult['center_control']
-    score += attack_opportunities(board, player, config) * weights.attack_opportunity * phase_mult['attack_opportunity']
-    score -= threatened_territories(board, player, config) * weights.threatened_penalty * phase_mult['threatened_penalty']
-    score += connectivity_score(board, player, config) * weights.connectivity * phase_mult['connectivity']
-    score += merge_potential(board, player, config) * weights.merge_potential * phase_mult['merge_potential']
+    score += territory * weights.territory_count * phase_mult['territory_count']
+    score += stones * weights.stone_advantage * phase_mult['stone_advantage']
+    score += growth * weights.growth_potential * phase_mult['growth_potential']
+    score += expansion * weights.expansion_opportunity * phase_mult['expansion_opportunity']
+    score += center * weights.center_control * phase_mult['center_control']
+    score += attack * weights.attack_opportunity * phase_mult['attack_opportunity']
+    score -= threatened * weights.threatened_penalty * phase_mult['threatened_penalty']
+    score += connectivity * weights.connectivity * phase_mult['connectivity']
+    score += merge * weights.merge_potential * phase_mult['merge_potential']
 
     return score
@@ -484,11 +484,11 @@ def cap_territory_stones(
     potentially exceeding the cap.
     """
     current_board = board
-    for pos in board.all_positions():
-        territory = board.get(pos)
+    size = board.size
+    for i, territory in enumerate(board.territories()):
         if territory.owner != Owner.NEUTRAL and territory.stones > max_stones:
             current_board = current_board.with_stones(
-                pos, territory.owner, max_stones
+                Position(i // size, i % size), territory.owner, max_stones
             )
     return current_board
 
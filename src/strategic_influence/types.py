@@ -10,8 +10,12 @@ All types are immutable (frozen dataclasses) to ensure:
 
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import cached_property, lru_cache
+from random import Random
 from typing import Mapping
 
+import numpy as np
+
 
 class Owner(Enum):
     """Territory ownership state."""
@@ -50,7 +54,17 @@ class Position:
         return f"({self.row}, {self.col})"
 
     def neighbors(self, board_size: int) -> frozenset["Position"]:
-        """Return orthogonal neighbors (following the lines)."""
+        """Return orthogonal neighbors (following the lines).
+
+        On-board positions read a per-board-size table, so repeated calls
+        return the same frozenset instead of rebuilding it.
+        """
+        if 0 <= self.row < board_size and 0 <= self.col < board_size:
+            return _neighbor_sets(board_size)[self.row][self.col]
+        return self._compute_neighbors(board_size)
+
+    def _compute_neighbors(self, board_size: int) -> frozenset["Position"]:
+        """Build the orthogonal neighbor set from scratch."""
         adjacent = [
             Position(self.row - 1, self.col),  # Down
             Position(self.row + 1, self.col),  # Up
@@ -99,6 +113,18 @@ class Position:
         return False
 
 
+@lru_cache(maxsize=None)
+def _neighbor_sets(board_size: int) -> tuple[tuple[frozenset[Position], ...], ...]:
+    """Position.neighbors() of every on-board cell, indexed [row][col]."""
+    return tuple(
+        tuple(
+            Position(r, c)._compute_neighbors(board_size)
+            for c in range(board_size)
+        )
+        for r in range(board_size)
+    )
+
+
 @dataclass(frozen=True)
 class Territory:
     """A territory with stone count.
@@ -125,6 +151,23 @@ class Territory:
         return f"{symbol}{self.stones}"
 
 
+# Random 64-bit key per (row, col, owner value, stones), drawn on first use.
+# Neutral cells contribute nothing, so the empty board hashes to 0.
+_ZOBRIST_KEYS: dict[tuple[int, int, int, int], int] = {}
+_ZOBRIST_RNG = Random(0x5EED)
+
+
+def _zobrist_key(row: int, col: int, territory: Territory) -> int:
+    """Zobrist key for a territory at (row, col); 0 for neutral cells."""
+    if territory.owner == Owner.NEUTRAL:
+        return 0
+    index = (row, col, territory.owner.value, territory.stones)
+    key = _ZOBRIST_KEYS.get(index)
+    if key is None:
+        key = _ZOBRIST_KEYS[index] = _ZOBRIST_RNG.getrandbits(64)
+    return key
+
+
 def create_neutral_territory() -> Territory:
     """Create an empty intersection."""
     return Territory(owner=Owner.NEUTRAL, stones=0)
@@ -158,17 +201,79 @@ class TerritoryBoard:
         """Get the stone count at a position."""
         return self.get(pos).stones
 
+    @classmethod
+    def from_arrays(
+        cls,
+        size: int,
+        owners: "np.ndarray",
+        stones: "np.ndarray",
+    ) -> "TerritoryBoard":
+        """Build a board from flat row-major owner values and stone counts.
+
+        Inverse of to_arrays(): owners[i] is an Owner value and stones[i] the
+        stone count of the cell at index i = row * size + col.
+        """
+        owner_values = np.asarray(owners).tolist()
+        stone_counts = np.asarray(stones).tolist()
+        cells = tuple(
+            tuple(
+                Territory(owner=Owner(owner_values[i]), stones=stone_counts[i])
+                for i in range(r * size, (r + 1) * size)
+            )
+            for r in range(size)
+        )
+        return cls(size=size, _cells=cells)
+
+    def to_arrays(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """Flat row-major owner values (int8) and stone counts (int16).
+
+        Computed once per board and shared, so the arrays are read-only.
+        """
+        return self._arrays
+
+    @cached_property
+    def _arrays(self) -> tuple["np.ndarray", "np.ndarray"]:
+        cells = self.territories()
+        owners = np.fromiter((t.owner.value for t in cells), dtype=np.int8, count=len(cells))
+        stones = np.fromiter((t.stones for t in cells), dtype=np.int16, count=len(cells))
+        owners.flags.writeable = False
+        stones.flags.writeable = False
+        return owners, stones
+
     def with_territory(self, pos: Position, territory: Territory) -> "TerritoryBoard":
-        """Return a new board with one cell changed."""
+        """Return a new board with one cell changed.
+
+        Copies one row; the rest of the board is shared with this one.
+        """
         if not pos.is_valid(self.size):
             raise ValueError(f"Position {pos} is outside board of size {self.size}")
 
-        new_cells = [list(row) for row in self._cells]
-        new_cells[pos.row][pos.col] = territory
-        return TerritoryBoard(
-            size=self.size,
-            _cells=tuple(tuple(row) for row in new_cells)
-        )
+        # Copy only the changed row; the new board shares every other row
+        # (rows are immutable tuples) with this one
+        rows = list(self._cells)
+        row = list(rows[pos.row])
+        old_territory = row[pos.col]
+        row[pos.col] = territory
+        rows[pos.row] = tuple(row)
+        board = TerritoryBoard(size=self.size, _cells=tuple(rows))
+
+        # Carry stone totals forward by the one cell's delta, if known
+        totals = self.__dict__.get("_stone_totals")
+        if totals is not None:
+            totals = totals.copy()
+            totals[old_territory.owner] -= old_territory.stones
+            totals[territory.owner] += territory.stones
+            board.__dict__["_stone_totals"] = totals
+
+        # Likewise XOR the one cell's keys into a known Zobrist hash
+        zobrist = self.__dict__.get("_zobrist")
+        if zobrist is not None:
+            board.__dict__["_zobrist"] = (
+                zobrist
+                ^ _zobrist_key(pos.row, pos.col, old_territory)
+                ^ _zobrist_key(pos.row, pos.col, territory)
+            )
+        return board
 
     def with_stones(self, pos: Position, owner: Owner, stones: int) -> "TerritoryBoard":
         """Return a new board with updated stones at a position."""
@@ -187,13 +292,26 @@ class TerritoryBoard:
         )
 
     def positions_owned_by(self, owner: Owner) -> frozenset[Position]:
-        """Return all positions owned by the given player."""
-        return frozenset(
-            Position(r, c)
-            for r in range(self.size)
-            for c in range(self.size)
-            if self._cells[r][c].owner == owner
-        )
+        """Return all positions owned by the given player.
+
+        Boards are immutable, so each owner's set is computed on first
+        request and then shared by every later call on this board.
+        """
+        cache = self.__dict__.setdefault("_owned_positions", {})
+        owned = cache.get(owner)
+        if owned is None:
+            owned = frozenset(
+                Position(r, c)
+                for r, row in enumerate(self._cells)
+                for c, territory in enumerate(row)
+                if territory.owner == owner
+            )
+            cache[owner] = owned
+        return owned
+
+    def territories(self) -> tuple[Territory, ...]:
+        """Return all territories in row-major order (index = row * size + col)."""
+        return tuple(territory for row in self._cells for territory in row)
 
     def count_territories(self) -> dict[Owner, int]:
         """Count territories for each owner."""
@@ -204,13 +322,43 @@ class TerritoryBoard:
         return counts
 
     def total_stones(self, owner: Owner) -> int:
-        """Count total stones for a player."""
-        total = 0
+        """Count total stones for a player.
+
+        O(1) after the first call on a board; boards derived through
+        with_territory/with_stones inherit the totals incrementally.
+        """
+        return self._stone_totals[owner]
+
+    @cached_property
+    def _stone_totals(self) -> dict[Owner, int]:
+        totals = {Owner.NEUTRAL: 0, Owner.PLAYER_1: 0, Owner.PLAYER_2: 0}
         for row in self._cells:
             for territory in row:
-                if territory.owner == owner:
-                    total += territory.stones
-        return total
+                totals[territory.owner] += territory.stones
+        return totals
+
+    def __getstate__(self) -> dict:
+        # Zobrist keys are per process, so a cached hash is not sent along
+        state = self.__dict__.copy()
+        state.pop("_zobrist", None)
+        return state
+
+    def zobrist_hash(self) -> int:
+        """64-bit Zobrist hash of the cell contents, for transposition tables.
+
+        Keys are drawn per process on first use, so hashes are only
+        comparable within one process. Boards derived from a hashed board
+        through with_territory/with_stones update the hash incrementally.
+        """
+        return self._zobrist
+
+    @cached_property
+    def _zobrist(self) -> int:
+        h = 0
+        for r, row in enumerate(self._cells):
+            for c, territory in enumerate(row):
+                h ^= _zobrist_key(r, c, territory)
+        return h
 
     def __str__(self) -> str:
         """String representation of the board."""
@@ -239,7 +387,9 @@ def create_empty_board(size: int) -> TerritoryBoard:
         tuple(neutral for _ in range(size))
         for _ in range(size)
     )
-    return TerritoryBoard(size=size, _cells=cells)
+    board = TerritoryBoard(size=size, _cells=cells)
+    board.__dict__["_stone_totals"] = {Owner.NEUTRAL: 0, Owner.PLAYER_1: 0, Owner.PLAYER_2: 0}
+    return board
 
 
 @dataclass(frozen=True)
@@ -298,6 +448,23 @@ class PlayerTurnActions:
     player: Owner
     actions: tuple[TerritoryAction, ...]
 
+    def __hash__(self) -> int:
+        """Hash of (player, actions), computed once per object.
+
+        Searches use moves as set members and cache keys many times over, and
+        hashing the nested action dataclasses is the costly part.
+        """
+        h = self.__dict__.get("_hash")
+        if h is None:
+            h = self.__dict__["_hash"] = hash((self.player, self.actions))
+        return h
+
+    def __getstate__(self) -> dict:
+        # Enum hashes vary between processes, so the cached hash stays behind
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
+
     def get_action_for(self, pos: Position) -> TerritoryAction | None:
         """Get the action for a specific territory."""
         for action in self.actions:
@@ -503,7 +670,10 @@ def create_initial_state(board_size: int) -> GameState:
     )
 
 
-# Helper functions for creating actions
+# Helper functions for creating actions. The single-action helpers are
+# interned: actions are immutable, so agents generating the same action in
+# every search node share one instance instead of allocating a new one.
+@lru_cache(maxsize=None)
 def create_grow_action(position: Position) -> TerritoryAction:
     """Create a GROW action (stay and gain +1 stone)."""
     return TerritoryAction(position=position, movements=())
@@ -526,6 +696,7 @@ def create_move_action(
     return TerritoryAction(position=position, movements=stone_movements)
 
 
+@lru_cache(maxsize=None)
 def create_simple_move_action(
     source: Position,
     destination: Position,
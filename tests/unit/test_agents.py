@@ -3,13 +3,50 @@
 V3: Stone-count with split movement support.
 """
 
+from dataclasses import replace
+from random import Random
+
 import pytest
 
 from strategic_influence.config import create_default_config
-from strategic_influence.types import Owner, Position, GamePhase
-from strategic_influence.engine import create_game, apply_setup
-from strategic_influence.agents import RandomAgent, AggressiveAgent
+from strategic_influence.types import (
+    GamePhase,
+    Owner,
+    PlayerTurnActions,
+    Position,
+    create_grow_action,
+)
+from strategic_influence.engine import (
+    apply_setup,
+    create_game,
+    determine_winner,
+    simulate_game,
+    validate_turn_actions,
+)
+from strategic_influence.agents import (
+    RandomAgent,
+    AggressiveAgent,
+    HeuristicMinimaxAgent,
+    ImprovedMCTSAgent,
+    MinimaxAgent,
+    MCTSHeuristicEval,
+    MCTSMinimaxEval,
+    MCTSHeuristicRollout,
+)
+from strategic_influence.agents.common import (
+    flat_neighbor_table,
+    weighted_destination,
+    weighted_flat_destination,
+)
+from strategic_influence.agents.mcts_variants import (
+    CandidateStats,
+    _UCBArrays,
+    _turn_is_deterministic,
+)
+from strategic_influence.agents.heuristic_minimax_agent import _stay_actions
+from strategic_influence.agents.optimized_minimax_agent import OptimizedMinimaxAgent
 from strategic_influence.agents.protocol import Agent, validate_agent
+from tests.conftest import create_test_board, create_test_turn_actions
 
 
 class TestAgentProtocol:
@@ -142,3 +179,471 @@ class TestAggressiveAgent:
         setup2 = agent.choose_setup(state, Owner.PLAYER_1, default_config)
 
         assert setup1.position == setup2.position
+
+
+def _playing_state(config, territories):
+    """Build a PLAYING-phase state from a create_test_board territory map."""
+    return replace(
+        create_game(config),
+        board=create_test_board(config.board_size, territories),
+        phase=GamePhase.PLAYING,
+        current_turn=1,
+        turn_history=(),
+        setup_complete=(Owner.PLAYER_1, Owner.PLAYER_2),
+        winner=None,
+    )
+
+
+class TestMinimaxAgent:
+    """Tests for MinimaxAgent."""
+
+    def test_transposition_table_keeps_best_move(self, default_config):
+        """Table hits skip re-search without changing the chosen move."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = MinimaxAgent(seed=42, max_depth=2, max_moves=8)
+        untabled = MinimaxAgent(seed=42, max_depth=2, max_moves=8, tt_size=1)
+
+        actions = agent.choose_actions(state, Owner.PLAYER_1, default_config)
+        expected = untabled.choose_actions(state, Owner.PLAYER_1, default_config)
+
+        assert actions == expected
+        assert agent.get_stats()["tt_hits"] > 0
+        assert untabled.get_stats()["tt_hits"] == 0
+
+    def test_killer_moves_ordered_first(self, default_config):
+        """A recent cutoff move is tried first, without changing the kept set."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = MinimaxAgent(seed=42, max_moves=4)
+        moves = agent._generate_moves(state, Owner.PLAYER_1, default_config)
+        static = agent._order_moves(moves, state, Owner.PLAYER_1, default_config)
+
+        agent._record_cutoff(static[-1], 2)
+        ordered = agent._order_moves(moves, state, Owner.PLAYER_1, default_config, 2)
+
+        assert ordered[0] == static[-1]
+        assert set(ordered) == set(static)
+
+    def test_opponent_killers_kept_separately(self, default_config):
+        """Opponent cutoffs at the same depth do not evict our killer."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 4),
+        })
+        agent = MinimaxAgent(seed=42, max_moves=4)
+        moves = agent._generate_moves(state, Owner.PLAYER_1, default_config)
+        static = agent._order_moves(moves, state, Owner.PLAYER_1, default_config)
+        opp_moves = agent._generate_moves(state, Owner.PLAYER_2, default_config)
+
+        agent._record_cutoff(static[-1], 2)
+        for opp_move in opp_moves[:3]:
+            agent._record_cutoff(opp_move, 2)
+        agent._history.clear()  # order by killers alone
+        ordered = agent._order_moves(moves, state, Owner.PLAYER_1, default_config, 2)
+
+        assert ordered[0] == static[-1]
+
+    def test_time_budget_stops_deepening(self, default_config):
+        """An exhausted budget keeps the best move of the last full pass."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = MinimaxAgent(seed=42, max_depth=3, max_moves=6, time_budget=0.0)
+        shallow = MinimaxAgent(seed=42, max_depth=1, max_moves=6)
+
+        actions = agent.choose_actions(state, Owner.PLAYER_1, default_config)
+
+        assert agent.get_stats()["depth_reached"] == 1
+        assert actions == shallow.choose_actions(state, Owner.PLAYER_1, default_config)
+
+    def test_root_parallel_search_matches_serial(self, default_config):
+        """Full-window root values across workers pick the serial move.
+
+        The position is small enough that no node samples moves, which is
+        when the parallel and serial searches are guaranteed to agree.
+        """
+        state = _playing_state(default_config, {
+            (1, 1): (Owner.PLAYER_1, 3),
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = MinimaxAgent(seed=42, max_depth=2, max_moves=8, num_workers=2)
+        serial = MinimaxAgent(seed=42, max_depth=2, max_moves=8)
+        try:
+            actions = agent.choose_actions(state, Owner.PLAYER_1, default_config)
+        finally:
+            agent.close()
+
+        assert actions == serial.choose_actions(state, Owner.PLAYER_1, default_config)
+
+
+class TestHeuristicMinimaxAgent:
+    """Tests for HeuristicMinimaxAgent."""
+
+    def test_expands_with_send_half(self, default_config):
+        """A lone multi-stone territory expands into neutral with SEND_HALF."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 3),
+            (2, 4): (Owner.PLAYER_2, 1),
+        })
+        agent = HeuristicMinimaxAgent(seed=42)
+
+        actions = agent.choose_actions(state, Owner.PLAYER_1, default_config)
+
+        (action,) = actions.actions
+        (movement,) = action.movements
+        assert movement.count == 2
+        assert state.board.get_owner(movement.destination) == Owner.NEUTRAL
+
+    def test_single_stone_territory_stays(self, default_config):
+        """1-stone territories always grow."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 1),
+            (2, 2): (Owner.PLAYER_2, 1),
+        })
+        agent = HeuristicMinimaxAgent(seed=42)
+
+        actions = agent.choose_actions(state, Owner.PLAYER_1, default_config)
+
+        assert all(a.is_grow for a in actions.actions)
+
+    def test_plays_complete_game(self, default_config):
+        """Agent produces valid actions for a full game."""
+        final_state = simulate_game(
+            default_config, HeuristicMinimaxAgent(seed=1), RandomAgent(seed=2), seed=3
+        )
+        assert final_state.is_complete
+
+    def test_stay_actions_shared_and_valid(self, default_config):
+        """Opponent all-stay actions are reused and pass engine validation."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 2),
+            (1, 3): (Owner.PLAYER_2, 2),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        stay = _stay_actions(state, Owner.PLAYER_2)
+
+        assert _stay_actions(state, Owner.PLAYER_2) is stay
+        assert validate_turn_actions(stay, state, default_config) == (True, None)
+
+    def test_lookahead_skips_moves_the_engine_rejects(self, default_config):
+        """A move missing an owned territory scores 0.0 instead of raising."""
+        state = _playing_state(default_config, {
+            (1, 1): (Owner.PLAYER_1, 2),
+            (2, 1): (Owner.PLAYER_1, 2),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        grow = create_grow_action(Position(2, 1))
+        move = PlayerTurnActions(player=Owner.PLAYER_1, actions=(grow, grow))
+        agent = HeuristicMinimaxAgent(seed=42)
+
+        assert agent._evaluate_move_consequences(
+            move, state, Owner.PLAYER_1, default_config
+        ) == 0.0
+
+
+class TestOptimizedMinimaxAgent:
+    """Tests for OptimizedMinimaxAgent."""
+
+    def test_transposition_table_keeps_best_move(self, default_config):
+        """Table hits skip re-search without changing the chosen move."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = OptimizedMinimaxAgent(seed=42, max_depth=2)
+        untabled = OptimizedMinimaxAgent(seed=42, max_depth=2, tt_size=1)
+
+        actions = agent.choose_actions(state, Owner.PLAYER_1, default_config)
+        expected = untabled.choose_actions(state, Owner.PLAYER_1, default_config)
+
+        assert actions == expected
+        assert agent.get_stats()["tt_hits"] > 0
+        assert untabled.get_stats()["tt_hits"] == 0
+
+    def test_killer_moves_ordered_first(self, default_config):
+        """Our cutoff move is tried first, even after opponent cutoffs."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 4),
+        })
+        agent = OptimizedMinimaxAgent(seed=42)
+        moves = agent._generate_limited_moves(state, Owner.PLAYER_1, default_config)
+        static = agent._order_moves(moves, state, Owner.PLAYER_1, default_config)
+        opp_moves = agent._generate_limited_moves(state, Owner.PLAYER_2, default_config)
+
+        agent._record_killer(static[-1], 2)
+        for opp_move in opp_moves[:3]:
+            agent._record_killer(opp_move, 2)
+        ordered = agent._order_moves(moves, state, Owner.PLAYER_1, default_config, 2)
+
+        assert ordered[0] == static[-1]
+        assert ordered[1:] == static[:-1]
+
+    def test_null_move_cutoff_keeps_best_move(self, default_config):
+        """Null-move pruning fires without changing the chosen move."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 2),
+            (2, 2): (Owner.PLAYER_2, 3),
+        })
+        agent = OptimizedMinimaxAgent(seed=42, max_depth=3, max_moves=4)
+        unpruned = OptimizedMinimaxAgent(
+            seed=42, max_depth=3, max_moves=4, null_move=False
+        )
+
+        actions = agent.choose_actions(state, Owner.PLAYER_1, default_config)
+        expected = unpruned.choose_actions(state, Owner.PLAYER_1, default_config)
+
+        assert actions == expected
+        assert agent.get_stats()["null_cutoffs"] > 0
+        assert unpruned.get_stats()["null_cutoffs"] == 0
+
+
+class TestImprovedMCTSAgent:
+    """Tests for ImprovedMCTSAgent."""
+
+    def test_root_parallel_search_returns_valid_actions(self, default_config):
+        """Root-parallel search merges worker stats into a valid move."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = ImprovedMCTSAgent(seed=42, num_simulations=8, num_workers=2)
+        try:
+            actions = agent.choose_actions(state, Owner.PLAYER_1, default_config)
+        finally:
+            agent.close()
+
+        owned = state.board.positions_owned_by(Owner.PLAYER_1)
+        assert frozenset(a.position for a in actions.actions) == owned
+
+    def test_leaf_parallel_batches_count_every_rollout(self, default_config):
+        """Leaf-parallel batches credit each rollout to the chosen candidate."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = ImprovedMCTSAgent(seed=42, num_simulations=6, num_workers=2, leaf_batch=3)
+        candidates = agent._generate_candidates(state, Owner.PLAYER_1, default_config)
+        try:
+            total = agent._run_simulations(
+                candidates, state, Owner.PLAYER_1, default_config, 6
+            )
+        finally:
+            agent.close()
+
+        assert total == 6
+        assert sum(c.simulations for c in candidates) == 6
+
+
+class TestMCTSVariants:
+    """Tests for the MCTS evaluation variants."""
+
+    def test_weighted_destination_skips_unbeatable_enemies(self, default_config):
+        """Random candidates never send stones into an enemy they cannot beat."""
+        board = create_test_board(default_config.board_size, {
+            (2, 2): (Owner.PLAYER_1, 4),
+            (1, 2): (Owner.PLAYER_2, 5),
+            (3, 2): (Owner.PLAYER_2, 1),
+        })
+        neighbors = (Position(1, 2), Position(3, 2))
+        rng = Random(0)
+
+        assert {
+            weighted_destination(board, Owner.PLAYER_1, neighbors, 4, rng)
+            for _ in range(50)
+        } == {Position(3, 2)}
+        assert weighted_destination(
+            board, Owner.PLAYER_1, neighbors[:1], 4, rng
+        ) is None
+
+    def test_weighted_flat_destination_matches_board_weights(self, default_config):
+        """The flat-array variant makes the same draws as weighted_destination."""
+        board = create_test_board(default_config.board_size, {
+            (2, 2): (Owner.PLAYER_1, 4),
+            (1, 2): (Owner.PLAYER_2, 5),
+            (3, 2): (Owner.PLAYER_2, 1),
+            (2, 1): (Owner.PLAYER_1, 2),
+        })
+        owners = [t.owner for t in board.territories()]
+        cell_stones = [t.stones for t in board.territories()]
+        size = default_config.board_size
+        flat = flat_neighbor_table(size)[2 * size + 2]
+        neighbors = tuple(n for _, n in flat)
+
+        for amount in (2, 4, 6):
+            board_rng, flat_rng = Random(amount), Random(amount)
+            assert [
+                weighted_destination(board, Owner.PLAYER_1, neighbors, amount, board_rng)
+                for _ in range(20)
+            ] == [
+                weighted_flat_destination(
+                    flat, owners, cell_stones, Owner.PLAYER_1, amount, flat_rng
+                )
+                for _ in range(20)
+            ]
+
+    @pytest.mark.parametrize("agent_cls,num_simulations", [
+        (MCTSHeuristicEval, 8),
+        (MCTSMinimaxEval, 8),
+        (MCTSHeuristicRollout, 4),
+    ])
+    def test_root_parallel_search_returns_valid_actions(
+        self, default_config, agent_cls, num_simulations
+    ):
+        """Root-parallel search merges worker stats into a valid move."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = agent_cls(seed=42, num_simulations=num_simulations, num_workers=2)
+        try:
+            actions = agent.choose_actions(state, Owner.PLAYER_1, default_config)
+        finally:
+            agent.close()
+
+        owned = state.board.positions_owned_by(Owner.PLAYER_1)
+        assert frozenset(a.position for a in actions.actions) == owned
+
+    @pytest.mark.parametrize("agent_cls", [
+        MCTSHeuristicEval, MCTSMinimaxEval, MCTSHeuristicRollout,
+    ])
+    def test_finished_game_is_not_searched(self, default_config, agent_cls):
+        """A completed game gets all-stay actions without running a search."""
+        state = replace(_playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        }), phase=GamePhase.COMPLETE)
+        agent = agent_cls(seed=42)
+
+        actions = agent.choose_actions(state, Owner.PLAYER_1, default_config)
+
+        assert all(a.is_grow for a in actions.actions)
+        assert agent.get_stats()["search_time"] == 0.0
+
+    def test_minimax_eval_evaluates_each_candidate_once(self, default_config):
+        """Depth-1 leaf values are cached per candidate within a search."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = MCTSMinimaxEval(seed=42, num_simulations=20)
+        candidates = agent._generate_candidates(state, Owner.PLAYER_1, default_config)
+
+        agent._run_simulations(
+            candidates, state, Owner.PLAYER_1, default_config, 20,
+            early_termination=False,
+        )
+
+        for c in candidates:
+            if c.simulations:
+                assert c.total_value == pytest.approx(
+                    agent._eval_cache[c.actions] * c.simulations
+                )
+
+    def test_rollout_first_turn_applied_once_per_candidate(self, default_config):
+        """Dice-free first turns are cached per candidate within a search."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = MCTSHeuristicRollout(seed=42, num_simulations=20)
+        candidates = agent._generate_candidates(state, Owner.PLAYER_1, default_config)
+
+        agent._run_simulations(
+            candidates, state, Owner.PLAYER_1, default_config, 20,
+            early_termination=False,
+        )
+
+        simulated = {c.actions for c in candidates if c.simulations}
+        assert set(agent._first_boards) == simulated
+
+    def test_rollout_depth_cap_judges_by_territory(self, default_config):
+        """A one-turn rollout is scored on the board after the candidate's turn."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = MCTSHeuristicRollout(seed=42, max_rollout_depth=1)
+        candidate = agent._generate_candidates(
+            state, Owner.PLAYER_1, default_config
+        )[0].actions
+        opp_actions = agent._greedy_actions(state.board, Owner.PLAYER_2, default_config)
+
+        result = agent._simulate_game(
+            state, Owner.PLAYER_1, candidate, opp_actions, default_config
+        )
+
+        board = agent._first_boards.get(candidate)
+        assert board is not None
+        assert result == determine_winner(board)
+
+    @pytest.mark.parametrize("agent_cls", [
+        MCTSHeuristicEval, MCTSMinimaxEval, MCTSHeuristicRollout,
+    ])
+    def test_leaf_batches_spread_over_candidates(self, default_config, agent_cls):
+        """Virtual loss spreads a batch across unexplored candidates."""
+        state = _playing_state(default_config, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 3): (Owner.PLAYER_2, 2),
+        })
+        agent = agent_cls(seed=42, num_simulations=6, num_workers=2, leaf_batch=3)
+        candidates = agent._generate_candidates(state, Owner.PLAYER_1, default_config)
+        try:
+            total = agent._run_simulations(
+                candidates, state, Owner.PLAYER_1, default_config, 6,
+                early_termination=False,
+            )
+        finally:
+            agent.close()
+
+        assert total == 6
+        assert [c.simulations for c in candidates[:6]] == [1] * 6
+        assert sum(c.simulations for c in candidates) == 6
+
+    @pytest.mark.parametrize("stats", [
+        [(0, 0), (0, 0)],
+        [(15, 30), (1, 5), (2, 8)],
+        [(8, 30), (1, 5), (2, 8)],
+        [(9, 30), (3, 10), (3, 10)],
+        [(20, 40), (10, 20)],
+    ])
+    def test_array_early_termination_matches_candidates(self, stats):
+        """The SoA leader check agrees with _should_terminate_early."""
+        candidates = [
+            CandidateStats(actions=None, wins=wins, simulations=sims)
+            for wins, sims in stats
+        ]
+        ucb = _UCBArrays(candidates)
+        agent = MCTSHeuristicEval(seed=0)
+
+        assert ucb.has_clear_leader() == agent._should_terminate_early(candidates)
+
+    def test_only_dice_free_turns_are_deterministic(self, default_config):
+        """With random combat, attacks are uncacheable but growth is not."""
+        config = replace(default_config, game=replace(
+            default_config.game,
+            combat=replace(default_config.game.combat, hit_chance=0.5),
+        ))
+        board = create_test_board(config.board_size, {
+            (2, 1): (Owner.PLAYER_1, 4),
+            (2, 2): (Owner.PLAYER_2, 2),
+        })
+        grow = create_test_turn_actions(
+            1, [{"pos": (2, 1), "type": "grow"}], [{"pos": (2, 2), "type": "grow"}]
+        )
+        attack = create_test_turn_actions(
+            1,
+            [{"pos": (2, 1), "type": "move", "dest": (2, 2), "count": 2}],
+            [{"pos": (2, 2), "type": "grow"}],
+        )
+
+        assert _turn_is_deterministic(board, grow, config)
+        assert not _turn_is_deterministic(board, attack, config)
+        assert _turn_is_deterministic(board, attack, default_config)
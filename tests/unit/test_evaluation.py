@@ -0,0 +1,60 @@
+"""Tests for position evaluation."""
+
+import pytest
+
+from strategic_influence.agents import RandomAgent
+from strategic_influence.engine import simulate_game
+from strategic_influence.evaluation import (
+    AGGRESSIVE_WEIGHTS,
+    BALANCED_WEIGHTS,
+    attack_opportunities,
+    center_control,
+    connectivity_score,
+    evaluate_board,
+    expansion_opportunities,
+    get_phase_multipliers,
+    growth_potential,
+    merge_potential,
+    stone_advantage,
+    territory_count_difference,
+    threatened_territories,
+)
+from strategic_influence.types import Owner
+
+
+def _reference_score(board, player, config, turn, weights):
+    """evaluate_board computed feature by feature."""
+    pm = get_phase_multipliers(turn, config.num_turns)
+    score = 0.0
+    score += territory_count_difference(board, player) * weights.territory_count * pm['territory_count']
+    score += stone_advantage(board, player) * weights.stone_advantage * pm['stone_advantage']
+    score += growth_potential(board, player, config) * weights.growth_potential * pm['growth_potential']
+    score += expansion_opportunities(board, player, config) * weights.expansion_opportunity * pm['expansion_opportunity']
+    score += center_control(board, player, config) * weights.center_control * pm['center_control']
+    score += attack_opportunities(board, player, config) * weights.attack_opportunity * pm['attack_opportunity']
+    score -= threatened_territories(board, player, config) * weights.threatened_penalty * pm['threatened_penalty']
+    score += connectivity_score(board, player, config) * weights.connectivity * pm['connectivity']
+    score += merge_potential(board, player, config) * weights.merge_potential * pm['merge_potential']
+    return score
+
+
+class TestEvaluateBoard:
+    """Tests for the fused evaluate_board."""
+
+    @pytest.mark.parametrize("weights", [BALANCED_WEIGHTS, AGGRESSIVE_WEIGHTS])
+    def test_matches_individual_features(self, default_config, weights):
+        """Fused pass gives exactly the per-feature result on played boards."""
+        for seed in range(5):
+            final_state = simulate_game(
+                default_config, RandomAgent(seed=seed), RandomAgent(seed=seed + 1),
+                seed=seed,
+            )
+            for turn in final_state.turn_history:
+                for player in (Owner.PLAYER_1, Owner.PLAYER_2):
+                    assert evaluate_board(
+                        turn.board_after, player, default_config,
+                        turn.turn_number, weights,
+                    ) == _reference_score(
+                        turn.board_after, player, default_config,
+                        turn.turn_number, weights,
+                    )
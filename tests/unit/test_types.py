@@ -3,6 +3,8 @@
 V3: Stone-count with split movement support.
 """
 
+import pickle
+
 import pytest
 
 from strategic_influence.types import (
@@ -77,6 +79,11 @@ class TestPosition:
         })
         assert neighbors == expected
 
+    def test_neighbors_reuses_table_entry(self):
+        """Repeated lookups share one frozenset; off-board cells still work."""
+        assert Position(2, 2).neighbors(5) is Position(2, 2).neighbors(5)
+        assert Position(-1, 0).neighbors(5) == frozenset({Position(0, 0)})
+
     def test_is_valid(self):
         """Test position validation."""
         assert Position(0, 0).is_valid(5) is True
@@ -178,6 +185,44 @@ class TestTerritoryBoard:
         p2_positions = board.positions_owned_by(Owner.PLAYER_2)
         assert p2_positions == frozenset({Position(2, 2)})
 
+    def test_positions_owned_by_cached_per_board(self):
+        """Repeated lookups share one set; derived boards recompute."""
+        board = create_empty_board(5).with_stones(Position(0, 0), Owner.PLAYER_1, 1)
+
+        owned = board.positions_owned_by(Owner.PLAYER_1)
+        assert board.positions_owned_by(Owner.PLAYER_1) is owned
+
+        board2 = board.with_stones(Position(1, 1), Owner.PLAYER_1, 2)
+        assert board2.positions_owned_by(Owner.PLAYER_1) == frozenset({
+            Position(0, 0), Position(1, 1),
+        })
+        assert board.positions_owned_by(Owner.PLAYER_1) == frozenset({Position(0, 0)})
+
+    def test_zobrist_hash_incremental(self):
+        """Derived boards update the hash to match a fresh computation."""
+        board = create_empty_board(5)
+        assert board.zobrist_hash() == 0
+
+        board = board.with_stones(Position(0, 0), Owner.PLAYER_1, 3)
+        board = board.with_stones(Position(2, 2), Owner.PLAYER_2, 1)
+        board = board.with_stones(Position(0, 0), Owner.PLAYER_2, 2)
+        fresh = TerritoryBoard(size=5, _cells=board._cells)
+
+        cleared = board.with_stones(Position(0, 0), Owner.NEUTRAL, 0)
+
+        assert board.zobrist_hash() == fresh.zobrist_hash()
+        assert cleared.zobrist_hash() != board.zobrist_hash()
+
+    def test_with_territory_shares_unchanged_rows(self):
+        """Only the changed row is copied."""
+        board = create_empty_board(5)
+        changed = board.with_stones(Position(2, 3), Owner.PLAYER_1, 2)
+
+        assert changed.get_stones(Position(2, 3)) == 2
+        assert board.get_stones(Position(2, 3)) == 0
+        assert changed._cells[2] is not board._cells[2]
+        assert all(changed._cells[r] is board._cells[r] for r in (0, 1, 3, 4))
+
     def test_count_territories(self):
         """Test territory counting."""
         board = create_empty_board(5)
@@ -201,6 +246,38 @@ class TestTerritoryBoard:
         assert board.total_stones(Owner.PLAYER_2) == 5
         assert board.total_stones(Owner.NEUTRAL) == 0
 
+    def test_total_stones_after_capture(self):
+        """Test totals carried forward when a cell changes owner."""
+        board = create_empty_board(5)
+        board = board.with_stones(Position(1, 1), Owner.PLAYER_1, 3)
+        board = board.with_stones(Position(2, 2), Owner.PLAYER_2, 5)
+        board = board.with_stones(Position(2, 2), Owner.PLAYER_1, 2)
+        board = board.with_stones(Position(1, 1), Owner.NEUTRAL, 0)
+
+        assert board.total_stones(Owner.PLAYER_1) == 2
+        assert board.total_stones(Owner.PLAYER_2) == 0
+
+    def test_territories_row_major(self):
+        """Test flat row-major territory order."""
+        board = create_empty_board(3)
+        board = board.with_stones(Position(1, 2), Owner.PLAYER_1, 4)
+
+        territories = board.territories()
+        assert len(territories) == 9
+        assert territories[1 * 3 + 2] == create_territory(Owner.PLAYER_1, 4)
+        assert territories[0] == create_neutral_territory()
+
+    def test_arrays_round_trip(self):
+        """Test flat owner/stone arrays and rebuilding a board from them."""
+        board = create_empty_board(3)
+        board = board.with_stones(Position(1, 2), Owner.PLAYER_1, 4)
+        board = board.with_stones(Position(2, 0), Owner.PLAYER_2, 2)
+
+        owners, stones = board.to_arrays()
+        assert owners.tolist() == [0, 0, 0, 0, 0, 1, 2, 0, 0]
+        assert stones.tolist() == [0, 0, 0, 0, 0, 4, 2, 0, 0]
+        assert TerritoryBoard.from_arrays(3, owners, stones) == board
+
     def test_all_positions(self):
         """Test getting all positions."""
         board = create_empty_board(3)
@@ -261,6 +338,20 @@ class TestPlayerTurnActions:
         all_movements = actions.get_all_movements()
         assert len(all_movements) == 3  # 0 + 1 + 2 = 3
 
+    def test_hash_survives_pickling(self):
+        """The cached hash is recomputed, not copied, after unpickling."""
+        actions = PlayerTurnActions(
+            player=Owner.PLAYER_1,
+            actions=(create_simple_move_action(Position(1, 1), Position(1, 2), 2),),
+        )
+        h = hash(actions)
+
+        restored = pickle.loads(pickle.dumps(actions))
+
+        assert "_hash" not in restored.__dict__
+        assert restored == actions
+        assert hash(restored) == h
+
     def test_get_action_for(self):
         """Test getting action for specific position."""
         action1 = create_grow_action(Position(0, 0))